@@ -0,0 +1,567 @@
+"""
+Benchmark building every league's objects from the integration test fixtures.
+
+Every page is served by replaying an archive of the HTML fixtures under
+``tests/integration`` instead of the network, so each benchmark only measures
+the time and memory spent reading, parsing and building the objects. Run every
+benchmark and compare the results against the stored baselines with::
+
+    python -m benchmarks.parsers
+
+Use ``--league`` or ``--object`` to run a subset of the benchmarks and
+``--save`` to store the results as the new baselines. Latency depends on the
+machine running the benchmarks, so it's only checked against the baselines
+with ``--latency``.
+"""
+import argparse
+import gc
+import json
+import mock
+import os
+import shutil
+import sys
+import tempfile
+import time
+import tracemalloc
+from collections import defaultdict
+from datetime import datetime
+from sportsreference import archive, fetch
+from sportsreference.mlb import boxscore as mlb_boxscore
+from sportsreference.mlb import schedule as mlb_schedule
+from sportsreference.mlb import teams as mlb_teams
+from sportsreference.nba import boxscore as nba_boxscore
+from sportsreference.nba import roster as nba_roster
+from sportsreference.nba import schedule as nba_schedule
+from sportsreference.nba import teams as nba_teams
+from sportsreference.ncaab import boxscore as ncaab_boxscore
+from sportsreference.ncaab import conferences as ncaab_conferences
+from sportsreference.ncaab import rankings as ncaab_rankings
+from sportsreference.ncaab import roster as ncaab_roster
+from sportsreference.ncaab import schedule as ncaab_schedule
+from sportsreference.ncaab import teams as ncaab_teams
+from sportsreference.ncaaf import boxscore as ncaaf_boxscore
+from sportsreference.ncaaf import schedule as ncaaf_schedule
+from sportsreference.ncaaf import teams as ncaaf_teams
+from sportsreference.nfl import boxscore as nfl_boxscore
+from sportsreference.nfl import schedule as nfl_schedule
+from sportsreference.nfl import teams as nfl_teams
+from sportsreference.nhl import boxscore as nhl_boxscore
+from sportsreference.nhl import schedule as nhl_schedule
+from sportsreference.nhl import teams as nhl_teams
+
+
+FIXTURES = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..',
+                        'tests', 'integration')
+BASELINES = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                         'baselines.json')
+# Number of times every object is built to measure its latency.
+DEFAULT_REPEAT = 5
+# A result is reported as a regression when it exceeds its baseline by more
+# than this fraction.
+DEFAULT_TOLERANCE = 0.25
+# The results which are compared against the baselines.
+METRICS = ('latency', 'peak_memory', 'allocations')
+# The results which are checked for regressions by default. Unlike latency,
+# memory use doesn't depend on the speed of the machine running the
+# benchmarks, so it can be compared against baselines stored elsewhere.
+CHECKED_METRICS = ('peak_memory', 'allocations')
+
+# time.perf_counter isn't available on Python 2.
+_timer = getattr(time, 'perf_counter', time.time)
+
+
+class _TeamConferences(object):
+    """
+    Stands in for the NCAAB Conferences class while building NCAAB teams.
+
+    The fixtures don't include the conference of every team, so every team's
+    conference is left empty, matching the NCAAB teams integration test. The
+    conference pages are benchmarked separately by 'ncaab.Conferences'.
+    """
+    def __init__(self, year=None):
+        self.team_conference = defaultdict(lambda: None)
+
+
+def _ncaab_teams():
+    with mock.patch.object(ncaab_teams, 'Conferences', _TeamConferences):
+        return ncaab_teams.Teams(2018)
+
+
+class Benchmark(object):
+    """
+    A single object built from the fixtures.
+
+    Parameters
+    ----------
+    league : string
+        The league the object belongs to, such as 'nba'.
+    name : string
+        The name of the class being built, such as 'Teams'.
+    build : function
+        A function which builds the object.
+    pages : list
+        A list of tuples of the full URL of every page requested while
+        building the object and the path of the fixture to serve, relative to
+        ``tests/integration``.
+    """
+    def __init__(self, league, name, build, pages):
+        self.league = league
+        self.name = name
+        self.build = build
+        self.pages = pages
+
+    @property
+    def key(self):
+        """
+        Returns a ``string`` uniquely identifying the benchmark, such as
+        'nba.Teams'.
+        """
+        return '%s.%s' % (self.league, self.name)
+
+
+BENCHMARKS = [
+    Benchmark('mlb', 'Teams', lambda: mlb_teams.Teams(2017), [
+        ('https://www.baseball-reference.com/leagues/MLB/2017-standings.shtml',
+         'teams/mlb_stats/2017-standings.html'),
+        ('https://www.baseball-reference.com/leagues/MLB/2017.shtml',
+         'teams/mlb_stats/2017.html')
+    ]),
+    Benchmark('mlb', 'Schedule', lambda: mlb_schedule.Schedule('NYY', 2017), [
+        ('https://www.baseball-reference.com/teams/NYY/'
+         '2017-schedule-scores.shtml',
+         'schedule/mlb/2017-schedule-scores.html')
+    ]),
+    Benchmark('mlb', 'Boxscore',
+              lambda: mlb_boxscore.Boxscore('BOS/BOS201806070'), [
+                  ('https://www.baseball-reference.com/boxes/BOS/'
+                   'BOS201806070.shtml', 'boxscore/mlb/BOS201806070.shtml')
+              ]),
+    Benchmark('mlb', 'Boxscores',
+              lambda: mlb_boxscore.Boxscores(datetime(2017, 7, 17)), [
+                  ('https://www.baseball-reference.com/boxes/'
+                   '?year=2017&month=7&day=17', 'boxscore/mlb/boxscore.html')
+              ]),
+    Benchmark('nba', 'Teams', lambda: nba_teams.Teams(2017), [
+        ('http://www.basketball-reference.com/leagues/NBA_2017.html',
+         'teams/nba_stats/NBA_2017.html')
+    ]),
+    Benchmark('nba', 'Schedule', lambda: nba_schedule.Schedule('GSW', 2017), [
+        ('http://www.basketball-reference.com/teams/GSW/2017/gamelog/',
+         'schedule/nba/gamelog')
+    ]),
+    Benchmark('nba', 'Boxscore',
+              lambda: nba_boxscore.Boxscore('201710310LAL'), [
+                  ('https://www.basketball-reference.com/boxscores/'
+                   '201710310LAL.html', 'boxscore/nba/201710310LAL.html')
+              ]),
+    Benchmark('nba', 'Boxscores',
+              lambda: nba_boxscore.Boxscores(datetime(2017, 2, 4)), [
+                  ('https://www.basketball-reference.com/boxscores/'
+                   '?month=2&day=4&year=2017', 'boxscore/nba/boxscores.html')
+              ]),
+    Benchmark('nba', 'Player', lambda: nba_roster.Player('hardeja01'), [
+        ('https://www.basketball-reference.com/players/h/hardeja01.html',
+         'roster/nba/hardeja01.html')
+    ]),
+    Benchmark('nba', 'Roster', lambda: nba_roster.Roster('HOU', 2018), [
+        ('https://www.basketball-reference.com/teams/HOU/2018.html',
+         'roster/nba/2018.html'),
+        ('https://www.basketball-reference.com/players/a/anderry01.html',
+         'roster/nba/anderry01.html'),
+        ('https://www.basketball-reference.com/players/a/arizatr01.html',
+         'roster/nba/arizatr01.html'),
+        ('https://www.basketball-reference.com/players/b/blackta01.html',
+         'roster/nba/blackta01.html'),
+        ('https://www.basketball-reference.com/players/h/hardeja01.html',
+         'roster/nba/hardeja01.html')
+    ]),
+    Benchmark('ncaab', 'Teams', _ncaab_teams, [
+        ('http://www.sports-reference.com/cbb/seasons/2018-school-stats.html',
+         'teams/ncaab_stats/2018-school-stats.html'),
+        ('http://www.sports-reference.com/cbb/seasons/'
+         '2018-opponent-stats.html',
+         'teams/ncaab_stats/2018-opponent-stats.html'),
+        ('http://www.sports-reference.com/cbb/seasons/'
+         '2018-advanced-school-stats.html',
+         'teams/ncaab_stats/2018-advanced-school-stats.html'),
+        ('http://www.sports-reference.com/cbb/seasons/'
+         '2018-advanced-opponent-stats.html',
+         'teams/ncaab_stats/2018-advanced-opponent-stats.html')
+    ]),
+    Benchmark('ncaab', 'Schedule',
+              lambda: ncaab_schedule.Schedule('KANSAS', 2018), [
+                  ('http://www.sports-reference.com/cbb/schools/kansas/'
+                   '2018-schedule.html', 'schedule/ncaab/2018-schedule.html')
+              ]),
+    Benchmark('ncaab', 'Boxscore',
+              lambda: ncaab_boxscore.Boxscore('2017-11-24-21-purdue'), [
+                  ('http://www.sports-reference.com/cbb/boxscores/'
+                   '2017-11-24-21-purdue.html',
+                   'boxscore/ncaab/2017-11-24-21-purdue.html')
+              ]),
+    Benchmark('ncaab', 'Boxscores',
+              lambda: ncaab_boxscore.Boxscores(datetime(2017, 11, 11)), [
+                  ('https://www.sports-reference.com/cbb/boxscores/'
+                   'index.cgi?month=11&day=11&year=2017',
+                   'boxscore/ncaab/boxscores.html')
+              ]),
+    Benchmark('ncaab', 'Player',
+              lambda: ncaab_roster.Player('carsen-edwards-1'), [
+                  ('https://www.sports-reference.com/cbb/players/'
+                   'carsen-edwards-1.html',
+                   'roster/ncaab/carsen-edwards-1.html')
+              ]),
+    Benchmark('ncaab', 'Rankings', lambda: ncaab_rankings.Rankings(2018), [
+        ('https://www.sports-reference.com/cbb/seasons/2018-polls.html',
+         'rankings/ncaab/2018-polls.html')
+    ]),
+    Benchmark('ncaab', 'Conferences',
+              lambda: ncaab_conferences.Conferences(2018), [
+                  ('https://www.sports-reference.com/cbb/seasons/2018.html',
+                   'conferences/ncaab/2018.html'),
+                  ('https://www.sports-reference.com/cbb/seasons/'
+                   '2018-ratings.html',
+                   'conferences/ncaab/2018-ratings-synthetic.html')
+              ]),
+    Benchmark('ncaaf', 'Teams', lambda: ncaaf_teams.Teams(2017), [
+        ('http://www.sports-reference.com/cfb/years/2017-standings.html',
+         'teams/ncaaf_stats/2017-standings.html'),
+        ('https://www.sports-reference.com/cfb/years/2017-team-offense.html',
+         'teams/ncaaf_stats/2017-team-offense.html')
+    ]),
+    Benchmark('ncaaf', 'Schedule',
+              lambda: ncaaf_schedule.Schedule('MICHIGAN', 2017), [
+                  ('https://www.sports-reference.com/cfb/schools/michigan/'
+                   '2017-schedule.html', 'schedule/ncaaf/2017-schedule.html')
+              ]),
+    Benchmark('ncaaf', 'Boxscore',
+              lambda: ncaaf_boxscore.Boxscore('2018-01-08-georgia'), [
+                  ('https://www.sports-reference.com/cfb/boxscores/'
+                   '2018-01-08-georgia.html',
+                   'boxscore/ncaaf/2018-01-08-georgia.html')
+              ]),
+    Benchmark('ncaaf', 'Boxscores',
+              lambda: ncaaf_boxscore.Boxscores(datetime(2017, 8, 30)), [
+                  ('https://www.sports-reference.com/cfb/boxscores/'
+                   'index.cgi?month=8&day=30&year=2017&conf_id=',
+                   'boxscore/ncaaf/boxscores.html')
+              ]),
+    Benchmark('nfl', 'Teams', lambda: nfl_teams.Teams(2017), [
+        ('http://www.pro-football-reference.com/years/2017.html',
+         'teams/nfl_stats/2017.html')
+    ]),
+    Benchmark('nfl', 'Schedule', lambda: nfl_schedule.Schedule('NWE', 2017), [
+        ('https://www.pro-football-reference.com/teams/nwe/2017/gamelog/',
+         'schedule/nfl/gamelog')
+    ]),
+    Benchmark('nfl', 'Boxscore',
+              lambda: nfl_boxscore.Boxscore('201802040nwe'), [
+                  ('https://www.pro-football-reference.com/boxscores/'
+                   '201802040nwe.htm', 'boxscore/nfl/201802040nwe.html')
+              ]),
+    Benchmark('nfl', 'Boxscores', lambda: nfl_boxscore.Boxscores(7, 2017), [
+        ('https://www.pro-football-reference.com/years/2017/week_7.htm',
+         'boxscore/nfl/boxscores.html')
+    ]),
+    Benchmark('nhl', 'Teams', lambda: nhl_teams.Teams(2017), [
+        ('http://www.hockey-reference.com/leagues/NHL_2017.html',
+         'teams/nhl_stats/NHL_2017.html')
+    ]),
+    Benchmark('nhl', 'Schedule', lambda: nhl_schedule.Schedule('NYR', 2017), [
+        ('https://www.hockey-reference.com/teams/NYR/2017_gamelog.html',
+         'schedule/nhl/2017_gamelog.html')
+    ]),
+    Benchmark('nhl', 'Boxscore',
+              lambda: nhl_boxscore.Boxscore('201806070VEG'), [
+                  ('https://www.hockey-reference.com/boxscores/'
+                   '201806070VEG.html', 'boxscore/nhl/201806070VEG.html')
+              ]),
+    Benchmark('nhl', 'Boxscores',
+              lambda: nhl_boxscore.Boxscores(datetime(2017, 2, 4)), [
+                  ('https://www.hockey-reference.com/boxscores/'
+                   'index.fcgi?month=2&day=4&year=2017',
+                   'boxscore/nhl/boxscores.html')
+              ])
+]
+
+
+def load_fixtures(pages, path):
+    """
+    Store the fixture of every page in a replay archive.
+
+    Every fixture is read before any object is built, so reading files isn't
+    included in any measurement.
+
+    Parameters
+    ----------
+    pages : list
+        A list of tuples of the full URL of a page and the path of the
+        fixture to serve, relative to ``tests/integration``.
+    path : string
+        The path of the archive file to create.
+    """
+    fixtures = archive.PageArchive(path)
+    try:
+        for url, fixture_path in pages:
+            with open(os.path.join(FIXTURES, fixture_path), 'r') as fixture:
+                fixtures.add(url, fixture.read())
+    finally:
+        fixtures.close()
+
+
+def measure(benchmark, repeat=DEFAULT_REPEAT):
+    """
+    Build an object from the fixtures and measure its latency and memory.
+
+    The fixtures are loaded into a temporary archive and every page is
+    served by replaying the archive, the same as replaying a recorded crawl.
+    The object is built once to warm up, then 'repeat' times to measure the
+    latency, and once more while tracing memory allocations. Tracing slows
+    down every allocation, so it isn't enabled while measuring the latency.
+
+    Parameters
+    ----------
+    benchmark : Benchmark
+        The benchmark to run.
+    repeat : int (optional)
+        The number of times to build the object to measure its latency.
+
+    Returns
+    -------
+    dict
+        A dictionary of the median 'latency' and fastest 'best' latency in
+        seconds, the 'peak_memory' in bytes allocated at any one time while
+        building the object, and the number of memory blocks still allocated
+        by the object once built as 'allocations'.
+
+    Raises
+    ------
+    ValueError
+        If the object requests a page which doesn't have a fixture.
+    """
+    directory = tempfile.mkdtemp()
+    path = os.path.join(directory, 'fixtures.archive')
+    load_fixtures(benchmark.pages, path)
+    previous_cache = fetch.get_cache()
+    previous_rate_limiter = fetch.get_rate_limiter()
+    fetch.set_cache(None)
+    fetch.set_rate_limiter(None)
+    try:
+        with archive.replay(path) as transport:
+            try:
+                benchmark.build()
+            except Exception:
+                if not transport.missing:
+                    raise
+            if transport.missing:
+                raise ValueError('%s requested pages without a fixture: %s'
+                                 % (benchmark.key,
+                                    ', '.join(transport.missing)))
+            timings = []
+            for _ in range(repeat):
+                gc.collect()
+                start = _timer()
+                benchmark.build()
+                timings.append(_timer() - start)
+            gc.collect()
+            tracemalloc.start()
+            try:
+                built = benchmark.build()
+                peak_memory = tracemalloc.get_traced_memory()[1]
+                snapshot = tracemalloc.take_snapshot()
+            finally:
+                tracemalloc.stop()
+            del built
+    finally:
+        fetch.set_cache(previous_cache)
+        fetch.set_rate_limiter(previous_rate_limiter)
+        shutil.rmtree(directory)
+    timings.sort()
+    return {
+        'latency': round(timings[len(timings) // 2], 6),
+        'best': round(timings[0], 6),
+        'peak_memory': peak_memory,
+        'allocations': sum(stat.count
+                           for stat in snapshot.statistics('filename'))
+    }
+
+
+def load_baselines(path=BASELINES):
+    """
+    Read the stored baselines.
+
+    Returns
+    -------
+    dict
+        A dictionary where every key is a benchmark's key, such as
+        'nba.Teams', and every value is the dictionary of results returned by
+        ``measure``. Empty if no baselines have been stored.
+    """
+    if not os.path.exists(path):
+        return {}
+    with open(path, 'r') as baselines:
+        return json.load(baselines)
+
+
+def save_baselines(results, path=BASELINES):
+    """
+    Store results as the baselines, keeping the baselines of any benchmark
+    which wasn't run.
+
+    Parameters
+    ----------
+    results : dict
+        A dictionary of the results of every benchmark which was run, keyed
+        by the benchmark's key.
+    path : string (optional)
+        The path of the baselines file.
+    """
+    baselines = load_baselines(path)
+    baselines.update(results)
+    with open(path, 'w') as output:
+        json.dump(baselines, output, indent=2, sort_keys=True)
+        output.write('\n')
+
+
+def compare(result, baseline, tolerance=DEFAULT_TOLERANCE,
+            metrics=CHECKED_METRICS):
+    """
+    Find every metric which regressed from its baseline.
+
+    Parameters
+    ----------
+    result : dict
+        The results of a benchmark as returned by ``measure``.
+    baseline : dict
+        The stored baseline of the same benchmark, or None if there isn't a
+        baseline.
+    tolerance : float (optional)
+        The fraction a metric can exceed its baseline by before it's
+        considered a regression.
+    metrics : tuple (optional)
+        The name of every metric to check, as listed in METRICS.
+
+    Returns
+    -------
+    list
+        A list of the name of every metric which regressed.
+    """
+    if not baseline:
+        return []
+    return [metric for metric in metrics
+            if metric in baseline and
+            result[metric] > baseline[metric] * (1 + tolerance)]
+
+
+def _change(value, baseline):
+    """
+    Format the change of a value from its baseline as a percentage.
+    """
+    if not baseline:
+        return ''
+    return '%+.0f%%' % ((value - baseline) * 100.0 / baseline)
+
+
+def _report(benchmark, result, baseline, regressions):
+    """
+    Format a single line reporting the results of a benchmark.
+    """
+    baseline = baseline or {}
+    line = '%-18s %9.2f ms %6s %9.0f KiB %6s %9d %6s' % (
+        benchmark.key,
+        result['latency'] * 1000,
+        _change(result['latency'], baseline.get('latency')),
+        result['peak_memory'] / 1024.0,
+        _change(result['peak_memory'], baseline.get('peak_memory')),
+        result['allocations'],
+        _change(result['allocations'], baseline.get('allocations')))
+    if regressions:
+        line += '  REGRESSED: %s' % ', '.join(regressions)
+    return line
+
+
+def run(benchmarks, repeat=DEFAULT_REPEAT, tolerance=DEFAULT_TOLERANCE,
+        baselines=None, output=sys.stdout, metrics=CHECKED_METRICS):
+    """
+    Run every benchmark, printing each result alongside its change from the
+    baseline.
+
+    Parameters
+    ----------
+    benchmarks : list
+        A list of every Benchmark to run.
+    repeat : int (optional)
+        The number of times to build every object to measure its latency.
+    tolerance : float (optional)
+        The fraction a metric can exceed its baseline by before it's
+        considered a regression.
+    baselines : dict (optional)
+        The stored baselines as returned by ``load_baselines``.
+    output : file (optional)
+        The file every result is printed to.
+    metrics : tuple (optional)
+        The name of every metric to check for regressions, as listed in
+        METRICS.
+
+    Returns
+    -------
+    tuple
+        A tuple of a dictionary of the results of every benchmark keyed by
+        the benchmark's key, and a list of the key of every benchmark which
+        regressed.
+    """
+    baselines = baselines or {}
+    results = {}
+    regressed = []
+    output.write('%-18s %19s %20s %16s\n' % ('benchmark', 'latency',
+                                             'peak memory', 'allocations'))
+    for benchmark in benchmarks:
+        result = measure(benchmark, repeat)
+        regressions = compare(result, baselines.get(benchmark.key),
+                              tolerance, metrics)
+        if regressions:
+            regressed.append(benchmark.key)
+        results[benchmark.key] = result
+        output.write(_report(benchmark, result, baselines.get(benchmark.key),
+                             regressions) + '\n')
+    return results, regressed
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser(
+        description='Benchmark building every object from the integration '
+                    'test fixtures.')
+    parser.add_argument('--league', action='append',
+                        help='Only run the benchmarks for this league. Can be '
+                             'repeated.')
+    parser.add_argument('--object', action='append',
+                        help='Only run the benchmarks for this class, such as '
+                             'Boxscore. Can be repeated.')
+    parser.add_argument('--repeat', type=int, default=DEFAULT_REPEAT,
+                        help='The number of times to build every object.')
+    parser.add_argument('--tolerance', type=float, default=DEFAULT_TOLERANCE,
+                        help='The fraction a result can exceed its baseline '
+                             'by before it is a regression.')
+    parser.add_argument('--latency', action='store_true',
+                        help='Also check the latency against the baselines. '
+                             'Only use this if the baselines were stored on '
+                             'the same machine.')
+    parser.add_argument('--save', action='store_true',
+                        help='Store the results as the new baselines.')
+    options = parser.parse_args(args)
+
+    benchmarks = [benchmark for benchmark in BENCHMARKS
+                  if (not options.league or
+                      benchmark.league in options.league) and
+                  (not options.object or benchmark.name in options.object)]
+    metrics = METRICS if options.latency else CHECKED_METRICS
+    results, regressed = run(benchmarks, options.repeat, options.tolerance,
+                             load_baselines(), metrics=metrics)
+    if options.save:
+        save_baselines(results)
+        return 0
+    return 1 if regressed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
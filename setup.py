@@ -15,13 +15,17 @@ setup(
     long_description=long_description,
     license='MIT',
     url='https://github.com/roclark/sportsreference',
-    packages=find_packages(),
+    packages=find_packages(exclude=['benchmarks']),
     python_requires='>=2.7,!=3.0.*,!=3.1.*,!=3.2.*,!=3.3.*',
     install_requires=[
+        "futures >= 3.2.0; python_version < '3.0'",
         "pandas >= 0.21.0",
         "pyquery >= 1.4.0",
         "requests >= 2.18.4"
     ],
+    extras_require={
+        'arrow': ["pyarrow >= 0.15.0"]
+    },
     classifiers=(
         'Programming Language :: Python :: 2.7',
         'Programming Language :: Python :: 3.4',
@@ -0,0 +1,288 @@
+import sqlite3
+import threading
+import time
+import zlib
+from contextlib import contextmanager
+from . import fetch
+
+
+# Responses which are recorded in an archive. Successful pages and pages
+# which don't exist are recorded so they are replayed identically, while
+# throttled requests and server errors are transient and aren't recorded.
+RECORDED_STATUS_CODES = (200, 201, 202, 203, 204, 400, 401, 403, 404, 410)
+
+
+class _ArchivedResponse(object):
+    """
+    A response served from an archive which mimics a ``requests.Response``.
+
+    Parameters
+    ----------
+    url : string
+        The full URL of the page.
+    text : string
+        The HTML contents of the page.
+    status_code : int
+        The HTTP status code the page was recorded with.
+    """
+    def __init__(self, url, text, status_code):
+        self.url = url
+        self.text = text
+        self.status_code = status_code
+        self.headers = {}
+
+
+class PageArchive(object):
+    """
+    A single file containing every page downloaded during a crawl.
+
+    Every page is stored compressed and indexed by its URL, so any page can be
+    read back without reading the rest of the archive. The archive is a
+    SQLite database which can safely be written to by many threads at once.
+
+    Parameters
+    ----------
+    path : string
+        The path of the archive file. It will be created if it doesn't already
+        exist.
+    compression_level : int (optional)
+        The zlib compression level to use between 1 and 9.
+    """
+    def __init__(self, path, compression_level=6):
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._compression_level = compression_level
+        self._lock = threading.Lock()
+        with self._lock, self._connection:
+            self._connection.execute(
+                'CREATE TABLE IF NOT EXISTS pages (url TEXT PRIMARY KEY, '
+                'status_code INTEGER, fetched REAL, body BLOB)')
+
+    def __contains__(self, url):
+        with self._lock:
+            return self._connection.execute(
+                'SELECT 1 FROM pages WHERE url = ?', (url,)).fetchone() \
+                is not None
+
+    def __len__(self):
+        with self._lock:
+            return self._connection.execute(
+                'SELECT COUNT(*) FROM pages').fetchone()[0]
+
+    def close(self):
+        """
+        Close the archive file.
+        """
+        with self._lock:
+            self._connection.close()
+
+    def add(self, url, html, status_code=200):
+        """
+        Store a page in the archive, replacing any previous copy.
+
+        Parameters
+        ----------
+        url : string
+            The full URL of the page.
+        html : string
+            The HTML contents of the page.
+        status_code : int (optional)
+            The HTTP status code the page was downloaded with.
+        """
+        body = zlib.compress(html.encode('utf-8'), self._compression_level)
+        values = (status_code, time.time(), sqlite3.Binary(body), url)
+        with self._lock, self._connection:
+            # Update the existing row first so the page keeps its position in
+            # the order pages were recorded.
+            cursor = self._connection.execute(
+                'UPDATE pages SET status_code = ?, fetched = ?, body = ? '
+                'WHERE url = ?', values)
+            if cursor.rowcount == 0:
+                self._connection.execute(
+                    'INSERT INTO pages (status_code, fetched, body, url) '
+                    'VALUES (?, ?, ?, ?)', values)
+
+    def get(self, url):
+        """
+        Read a page from the archive.
+
+        Parameters
+        ----------
+        url : string
+            The full URL of the page.
+
+        Returns
+        -------
+        tuple
+            A tuple of the HTML contents of the page and the HTTP status code
+            it was downloaded with, or None if the page isn't archived.
+        """
+        with self._lock:
+            row = self._connection.execute(
+                'SELECT body, status_code FROM pages WHERE url = ?',
+                (url,)).fetchone()
+        if row is None:
+            return None
+        return zlib.decompress(bytes(row[0])).decode('utf-8'), row[1]
+
+    @property
+    def urls(self):
+        """
+        Returns a ``list`` of the URL of every page in the archive in the
+        order the pages were first recorded.
+        """
+        with self._lock:
+            rows = self._connection.execute(
+                'SELECT url FROM pages ORDER BY rowid').fetchall()
+        return [row[0] for row in rows]
+
+
+class RecordingTransport(object):
+    """
+    A transport which downloads pages and records every response in an
+    archive.
+
+    Parameters
+    ----------
+    archive : PageArchive
+        The archive to record every page in.
+    transport : Transport (optional)
+        The transport used to download every page. Defaults to the shared
+        transport in use when the recording transport is created.
+    """
+    def __init__(self, archive, transport=None):
+        self._archive = archive
+        self._transport = transport or fetch.get_transport()
+
+    def get(self, url, headers=None):
+        """
+        Download the requested URL and record the response.
+
+        Parameters
+        ----------
+        url : string
+            The full URL to download.
+        headers : dict (optional)
+            Additional headers to include with this request only.
+
+        Returns
+        -------
+        requests.Response
+            The response received from the server.
+        """
+        response = self._transport.get(url, headers)
+        if response.status_code in RECORDED_STATUS_CODES:
+            self._archive.add(url, response.text, response.status_code)
+        return response
+
+    def close(self):
+        """
+        Close the transport used to download every page.
+        """
+        self._transport.close()
+
+
+class ReplayTransport(object):
+    """
+    A transport which serves every page from an archive without making any
+    requests.
+
+    Pages which aren't in the archive are served as '404 Not Found', the same
+    as a page which doesn't exist on the server.
+
+    Parameters
+    ----------
+    archive : PageArchive
+        The archive to serve every page from.
+    """
+    def __init__(self, archive):
+        self._archive = archive
+        self._missing = []
+
+    def get(self, url, headers=None):
+        """
+        Read the requested URL from the archive.
+
+        Parameters
+        ----------
+        url : string
+            The full URL to read.
+        headers : dict (optional)
+            Ignored, as every archived page is served as-is.
+
+        Returns
+        -------
+        response
+            An object with the same 'status_code', 'text', and 'headers'
+            attributes as a ``requests.Response``.
+        """
+        page = self._archive.get(url)
+        if page is None:
+            self._missing.append(url)
+            return _ArchivedResponse(url, '', 404)
+        return _ArchivedResponse(url, page[0], page[1])
+
+    def close(self):
+        pass
+
+    @property
+    def missing(self):
+        """
+        Returns a ``list`` of every requested URL which wasn't in the archive.
+        """
+        return self._missing
+
+
+@contextmanager
+def record(path):
+    """
+    Record every page downloaded within the context to an archive file.
+
+    Any page which is read from a page cache isn't downloaded and won't be
+    recorded, so the cache should be disabled while recording a complete
+    crawl.
+
+    Parameters
+    ----------
+    path : string
+        The path of the archive file. Pages are added to the archive if it
+        already exists.
+
+    Returns
+    -------
+    PageArchive
+        The archive every page is recorded in.
+    """
+    archive = PageArchive(path)
+    previous = fetch.set_transport(RecordingTransport(archive))
+    try:
+        yield archive
+    finally:
+        fetch.set_transport(previous)
+        archive.close()
+
+
+@contextmanager
+def replay(path):
+    """
+    Serve every page requested within the context from an archive file
+    without using the network.
+
+    Parameters
+    ----------
+    path : string
+        The path of an archive file created by ``record``.
+
+    Returns
+    -------
+    ReplayTransport
+        The transport serving every page, whose 'missing' property lists any
+        requested page which wasn't archived.
+    """
+    archive = PageArchive(path)
+    transport = ReplayTransport(archive)
+    previous = fetch.set_transport(transport)
+    try:
+        yield transport
+    finally:
+        fetch.set_transport(previous)
+        archive.close()
@@ -0,0 +1,532 @@
+import hashlib
+import json
+import os
+import re
+import tempfile
+import threading
+import time
+import zlib
+from datetime import date, timedelta
+from . import utils
+
+
+# Default maximum number of bytes the compressed pages are allowed to occupy
+# on disk before the least recently used pages are evicted.
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+# Default number of seconds a page which may still change, such as a page for
+# the current season, is considered fresh.
+DEFAULT_TTL = 60 * 60
+# A TTL of None indicates a page never expires.
+IMMUTABLE = None
+# Once the cache grows beyond its maximum size, the least recently used pages
+# are evicted until the cache shrinks to this fraction of the maximum size, so
+# the cache directory is only scanned once every several writes while full.
+LOW_WATER_MARK = 0.9
+
+# {
+#   host or host and path prefix: league name as listed in
+#                                 utils.SEASON_START_MONTH
+# }
+LEAGUE_HOSTS = [
+    ('baseball-reference.com', 'mlb'),
+    ('basketball-reference.com', 'nba'),
+    ('sports-reference.com/cbb', 'ncaab'),
+    ('sports-reference.com/cfb', 'ncaaf'),
+    ('pro-football-reference.com', 'nfl'),
+    ('hockey-reference.com', 'nhl')
+]
+
+# Individual game pages never change once the game has been completed. Date
+# and week index pages, which list many games, aren't included here. The date
+# of the game is included in the URI as either YYYYMMDD or YYYY-MM-DD.
+BOXSCORE_PATTERN = re.compile(r'/(boxscores|boxes)/[^?]+\.s?html?$')
+GAME_DATE_PATTERN = re.compile(r'((?:19|20)[0-9]{2})-?([0-9]{2})-?([0-9]{2})')
+# Index pages listing every game played on a single day include the date as
+# the 'year', 'month' and 'day' query parameters, in any order.
+DATE_QUERY_PATTERN = re.compile(r'[?&](year|month|day)=([0-9]+)')
+SEASON_PATTERN = re.compile(r'(?<![0-9])((?:19|20)[0-9]{2})(?![0-9])')
+
+
+def _league_for_url(url):
+    """
+    Find the league a URL belongs to.
+
+    Parameters
+    ----------
+    url : string
+        The full URL of a page on one of the sports-reference websites.
+
+    Returns
+    -------
+    string
+        The league name, such as 'nba', or None if the URL doesn't belong to
+        a known league.
+    """
+    for host, league in LEAGUE_HOSTS:
+        if host in url:
+            return league
+    return None
+
+
+def _completed(game_date):
+    """
+    Determine whether every game played on a date has been completed.
+
+    The games are only considered completed once the day after they were
+    played has passed, as games can finish after midnight and the current
+    date depends on the time zone.
+
+    Parameters
+    ----------
+    game_date : date
+        The date the games were played.
+
+    Returns
+    -------
+    boolean
+        True if the games were played before yesterday.
+    """
+    today = utils._todays_date()
+    yesterday = date(today.year, today.month, today.day) - timedelta(days=1)
+    return game_date < yesterday
+
+
+def _completed_game(uri):
+    """
+    Determine whether the game a boxscore URI belongs to has been completed.
+
+    Parameters
+    ----------
+    uri : string
+        The URI of the boxscore, such as '/boxscores/201710310LAL.html'.
+
+    Returns
+    -------
+    boolean
+        True if the game was played before yesterday, or False if it's still
+        being played, hasn't been played yet, or its date can't be found.
+    """
+    match = GAME_DATE_PATTERN.search(uri)
+    if not match:
+        return False
+    try:
+        game_date = date(*[int(value) for value in match.groups()])
+    except ValueError:
+        return False
+    return _completed(game_date)
+
+
+def _index_date(url):
+    """
+    Find the date of a page listing every game played on a single day.
+
+    Parameters
+    ----------
+    url : string
+        The full URL of the page, such as
+        'https://www.basketball-reference.com/boxscores/?month=12&day=15&year=2017'.
+
+    Returns
+    -------
+    date
+        The date of the games listed on the page, or None if the URL doesn't
+        include a valid date.
+    """
+    values = dict(DATE_QUERY_PATTERN.findall(url))
+    if len(values) != 3:
+        return None
+    try:
+        return date(int(values['year']), int(values['month']),
+                    int(values['day']))
+    except ValueError:
+        return None
+
+
+def _replace(source, destination):
+    """
+    Atomically move a file to the destination, replacing any existing file.
+    """
+    try:
+        os.replace(source, destination)
+    except AttributeError:
+        # Python 2 doesn't include os.replace, but os.rename overwrites the
+        # destination on POSIX systems.
+        os.rename(source, destination)
+
+
+class PageCache(object):
+    """
+    A size-bounded cache of downloaded pages stored on disk.
+
+    Every page is stored in a file named after a hash of its URL and is
+    compressed before being written to disk. Pages expire based on the class
+    of URL they were downloaded from: pages for completed games and seasons
+    never change and are kept indefinitely, while pages for games which
+    haven't finished and for the current season expire after a short time.
+    Once the cache grows beyond the requested size, the least recently used
+    pages are evicted.
+
+    Parameters
+    ----------
+    directory : string
+        The directory to store cached pages in. It will be created if it
+        doesn't already exist.
+    max_bytes : int (optional)
+        The maximum number of bytes the cached pages may occupy on disk.
+    default_ttl : int (optional)
+        The number of seconds a page which may still change, such as a page
+        for the current season, is considered fresh.
+    ttls : list (optional)
+        A list of (regular expression, TTL) tuples which override the default
+        expiration for any matching URL. The first match wins. A TTL of None
+        indicates the matching pages never expire.
+    compression_level : int (optional)
+        The zlib compression level to use between 1 and 9.
+    """
+    def __init__(self, directory, max_bytes=DEFAULT_MAX_BYTES,
+                 default_ttl=DEFAULT_TTL, ttls=None, compression_level=6):
+        self._directory = directory
+        self._max_bytes = max_bytes
+        self._default_ttl = default_ttl
+        self._ttls = [(re.compile(pattern), ttl)
+                      for pattern, ttl in (ttls or [])]
+        self._compression_level = compression_level
+        self._size = None
+        self._lock = threading.Lock()
+        if not os.path.isdir(directory):
+            os.makedirs(directory)
+
+    def _path(self, url):
+        """
+        Return the location of the cached file for the given URL.
+        """
+        digest = hashlib.sha1(url.encode('utf-8')).hexdigest()
+        return os.path.join(self._directory, digest[:2], digest + '.page')
+
+    def ttl(self, url):
+        """
+        Determine how long a page is considered fresh.
+
+        Parameters
+        ----------
+        url : string
+            The full URL of the page.
+
+        Returns
+        -------
+        int
+            The number of seconds the page remains fresh after being
+            downloaded, or None if the page never expires.
+        """
+        for pattern, ttl in self._ttls:
+            if pattern.search(url):
+                return ttl
+        boxscore = BOXSCORE_PATTERN.search(url)
+        if boxscore:
+            if _completed_game(boxscore.group(0)):
+                return IMMUTABLE
+            return self._default_ttl
+        # The calendar year of a date index page doesn't match the season for
+        # leagues whose seasons span two years, so its date is used instead.
+        index_date = _index_date(url)
+        if index_date is not None:
+            if _completed(index_date):
+                return IMMUTABLE
+            return self._default_ttl
+        league = _league_for_url(url)
+        seasons = SEASON_PATTERN.findall(url)
+        if league and seasons:
+            current_season = utils._find_year_for_season(league)
+            if max(int(season) for season in seasons) < current_season:
+                return IMMUTABLE
+        return self._default_ttl
+
+    def _read(self, path):
+        """
+        Read the metadata and compressed body of a cached file.
+
+        Returns
+        -------
+        tuple
+            A tuple of the metadata dictionary and the compressed body.
+        """
+        with open(path, 'rb') as cached_file:
+            metadata = json.loads(cached_file.readline().decode('utf-8'))
+            return metadata, cached_file.read()
+
+    def _revalidation_headers(self, metadata):
+        """
+        Build the headers which ask the server to only send a page if it has
+        changed since it was cached.
+
+        Parameters
+        ----------
+        metadata : dict
+            The metadata of the cached page.
+
+        Returns
+        -------
+        dict
+            A dictionary of the 'If-None-Match' and 'If-Modified-Since'
+            headers, which is empty if the server didn't include an 'ETag' or
+            'Last-Modified' header when the page was downloaded.
+        """
+        headers = {}
+        if metadata.get('etag'):
+            headers['If-None-Match'] = metadata['etag']
+        if metadata.get('last_modified'):
+            headers['If-Modified-Since'] = metadata['last_modified']
+        return headers
+
+    def lookup(self, url):
+        """
+        Return the cached contents of a page and, if it has expired, the
+        headers required to revalidate it with the server.
+
+        The cached file is only read once, so this is preferred over calling
+        both ``get`` and ``stale``.
+
+        Parameters
+        ----------
+        url : string
+            The full URL of the page.
+
+        Returns
+        -------
+        tuple
+            A tuple of the HTML contents of the page and a dictionary of the
+            'If-None-Match' and 'If-Modified-Since' headers to send with the
+            request. The headers are None if the page is still fresh. Returns
+            (None, None) if the page isn't cached, or if it has expired and
+            can't be revalidated.
+        """
+        path = self._path(url)
+        try:
+            metadata, body = self._read(path)
+        except (IOError, OSError, ValueError):
+            return None, None
+        ttl = self.ttl(url)
+        now = time.time()
+        if ttl is IMMUTABLE or now - metadata['fetched'] <= ttl:
+            try:
+                # Track the last access time explicitly to determine which
+                # pages are the least recently used while preserving the
+                # modified time.
+                os.utime(path, (now, os.stat(path).st_mtime))
+            except OSError:
+                pass
+            return zlib.decompress(body).decode('utf-8'), None
+        headers = self._revalidation_headers(metadata)
+        if not headers:
+            return None, None
+        return zlib.decompress(body).decode('utf-8'), headers
+
+    def get(self, url):
+        """
+        Return the cached contents of a page if it is still fresh.
+
+        Parameters
+        ----------
+        url : string
+            The full URL of the page.
+
+        Returns
+        -------
+        string
+            The HTML contents of the page, or None if the page isn't cached or
+            has expired.
+        """
+        html, headers = self.lookup(url)
+        if headers is not None:
+            return None
+        return html
+
+    def stale(self, url):
+        """
+        Return the cached contents of a page which has expired along with the
+        headers required to revalidate it with the server.
+
+        Parameters
+        ----------
+        url : string
+            The full URL of the page.
+
+        Returns
+        -------
+        tuple
+            A tuple of the HTML contents of the page and a dictionary of the
+            'If-None-Match' and 'If-Modified-Since' headers to send with the
+            request. Returns (None, None) if the page isn't cached or the
+            server didn't include an 'ETag' or 'Last-Modified' header when the
+            page was downloaded.
+        """
+        try:
+            metadata, body = self._read(self._path(url))
+        except (IOError, OSError, ValueError):
+            return None, None
+        headers = self._revalidation_headers(metadata)
+        if not headers:
+            return None, None
+        return zlib.decompress(body).decode('utf-8'), headers
+
+    def refresh(self, url):
+        """
+        Mark a cached page as fresh without changing its contents.
+
+        This is used when the server confirms the cached copy of an expired
+        page is still current, such as with a '304 Not Modified' response.
+
+        Parameters
+        ----------
+        url : string
+            The full URL of the page.
+        """
+        path = self._path(url)
+        try:
+            metadata, body = self._read(path)
+        except (IOError, OSError, ValueError):
+            return
+        metadata['fetched'] = time.time()
+        self._write(path, metadata, body)
+
+    def set(self, url, html, validators=None):
+        """
+        Store the contents of a page in the cache.
+
+        Parameters
+        ----------
+        url : string
+            The full URL of the page.
+        html : string
+            The HTML contents of the page.
+        validators : dict (optional)
+            The 'etag' and 'last_modified' values sent by the server with the
+            page, which are used to revalidate the page once it expires.
+        """
+        metadata = {'url': url, 'fetched': time.time()}
+        for key, value in (validators or {}).items():
+            if value:
+                metadata[key] = value
+        body = zlib.compress(html.encode('utf-8'), self._compression_level)
+        self._write(self._path(url), metadata, body)
+
+    def _write(self, path, metadata, body):
+        """
+        Atomically write the metadata and compressed body of a cached file.
+
+        Parameters
+        ----------
+        path : string
+            The location of the cached file.
+        metadata : dict
+            The metadata of the page, including the time it was fetched.
+        body : bytes
+            The compressed HTML contents of the page.
+        """
+        directory = os.path.dirname(path)
+        if not os.path.isdir(directory):
+            try:
+                os.makedirs(directory)
+            except OSError:
+                # Another thread or process may have created the directory.
+                pass
+        handle, temp_path = tempfile.mkstemp(dir=directory)
+        with os.fdopen(handle, 'wb') as cached_file:
+            cached_file.write(json.dumps(metadata).encode('utf-8') + b'\n')
+            cached_file.write(body)
+        new_size = os.path.getsize(temp_path)
+        try:
+            old_size = os.path.getsize(path)
+        except OSError:
+            old_size = 0
+        _replace(temp_path, path)
+        with self._lock:
+            if self._size is not None:
+                self._size += new_size - old_size
+        self._evict()
+
+    def invalidate(self, url):
+        """
+        Remove a page from the cache.
+
+        Parameters
+        ----------
+        url : string
+            The full URL of the page.
+        """
+        path = self._path(url)
+        try:
+            size = os.path.getsize(path)
+            os.remove(path)
+        except OSError:
+            return
+        with self._lock:
+            if self._size is not None:
+                self._size -= size
+
+    def clear(self):
+        """
+        Remove every page from the cache.
+        """
+        for path, _, _ in self._entries():
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+        with self._lock:
+            self._size = 0
+
+    def _entries(self):
+        """
+        Find every cached page on disk.
+
+        Returns
+        -------
+        list
+            A list of (path, size, last access time) tuples for every cached
+            page.
+        """
+        entries = []
+        for root, _, files in os.walk(self._directory):
+            for filename in files:
+                if not filename.endswith('.page'):
+                    continue
+                path = os.path.join(root, filename)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                entries.append((path, stat.st_size, stat.st_atime))
+        return entries
+
+    @property
+    def size(self):
+        """
+        Returns an ``int`` of the number of bytes the cached pages occupy on
+        disk.
+        """
+        with self._lock:
+            if self._size is None:
+                self._size = sum(size for _, size, _ in self._entries())
+            return self._size
+
+    def _evict(self):
+        """
+        Remove the least recently used pages once the cache exceeds the
+        maximum size, until it shrinks to the low water mark.
+        """
+        if self.size <= self._max_bytes:
+            return
+        target = self._max_bytes * LOW_WATER_MARK
+        with self._lock:
+            entries = sorted(self._entries(), key=lambda entry: entry[2])
+            size = sum(entry[1] for entry in entries)
+            for path, entry_size, _ in entries:
+                if size <= target:
+                    break
+                try:
+                    os.remove(path)
+                except OSError:
+                    continue
+                size -= entry_size
+            self._size = size
@@ -0,0 +1,292 @@
+import json
+import os
+import re
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from importlib import import_module
+from itertools import islice
+from . import fetch, utils
+
+
+# Boxscore URIs only contain letters, numbers, dashes, and the slash which
+# separates the home team's directory on baseball-reference. Games which
+# haven't been played yet don't link to a boxscore and are excluded.
+BOXSCORE_URI = re.compile(r'^[A-Za-z0-9/-]+$')
+# The number of boxscores submitted to the worker pool for every worker.
+# Boxscores are only submitted as earlier ones are saved, so memory use stays
+# bounded regardless of the number of games in the season.
+BOXSCORES_PER_WORKER = 2
+
+
+def _league_module(league, module):
+    """
+    Import one of a league's modules.
+
+    Parameters
+    ----------
+    league : string
+        The league name as listed in utils.SEASON_START_MONTH, such as 'nba'.
+    module : string
+        The name of the module within the league's package, such as
+        'boxscore'.
+
+    Returns
+    -------
+    module
+        The imported module.
+    """
+    return import_module('sportsreference.%s.%s' % (league, module))
+
+
+class SeasonCrawler(object):
+    """
+    Download and parse every boxscore in a season.
+
+    The boxscore URI of every game is found from the schedules of all teams in
+    the league and deduplicated, so each game is only downloaded once even
+    though it appears in both teams' schedules. The boxscores are downloaded
+    and parsed by a pool of worker threads, and every parsed boxscore is
+    appended to the checkpoint file as soon as it completes. When a crawl is
+    interrupted, crawling again with the same checkpoint file skips every
+    boxscore which has already been saved.
+
+    The checkpoint file contains one JSON object per line with the boxscore's
+    URI and the values from the boxscore's DataFrame.
+
+    Parameters
+    ----------
+    league : string
+        The league to crawl, such as 'nba'.
+    year : string (optional)
+        The requested year to crawl. Defaults to the most recent season.
+    checkpoint : string (optional)
+        The path of the checkpoint file. Defaults to a file named after the
+        league and year, such as 'nba-2018-boxscores.jsonl', in the current
+        directory.
+    workers : int (optional)
+        The maximum number of boxscores and schedules to download
+        simultaneously.
+    """
+    def __init__(self, league, year=None, checkpoint=None,
+                 workers=fetch.DEFAULT_WORKERS):
+        if league not in utils.SEASON_START_MONTH:
+            raise ValueError('Unknown league: %s' % league)
+        if not year:
+            year = utils._find_year_for_season(league)
+        if not checkpoint:
+            checkpoint = '%s-%s-boxscores.jsonl' % (league, year)
+        self._league = league
+        self._year = year
+        self._checkpoint = checkpoint
+        self._workers = workers
+        self._boxscore_uris = None
+        self._failed = []
+
+    def _find_boxscore_uris(self):
+        """
+        Find the boxscore URI of every completed game in the season.
+
+        Returns
+        -------
+        list
+            A list of every unique boxscore URI in the order they are first
+            listed in the teams' schedules.
+        """
+        teams = _league_module(self._league, 'teams').Teams(self._year)
+        schedules = fetch.map_concurrent(lambda team: team.schedule,
+                                         list(teams),
+                                         self._workers)
+        uris = []
+        seen = set()
+        for schedule in schedules:
+            for game in schedule:
+                uri = game.boxscore_index
+                if not uri or not BOXSCORE_URI.match(uri) or uri in seen:
+                    continue
+                seen.add(uri)
+                uris.append(uri)
+        return uris
+
+    def _read_checkpoint(self):
+        """
+        Read every boxscore saved in the checkpoint file.
+
+        A line which was only partially written when a crawl was interrupted
+        is ignored, so the boxscore is crawled again.
+
+        Returns
+        -------
+        list
+            A list of dictionaries, each with the 'uri' of the boxscore and
+            the 'data' from the boxscore's DataFrame.
+        """
+        if not os.path.exists(self._checkpoint):
+            return []
+        records = []
+        with open(self._checkpoint, 'r') as checkpoint:
+            for line in checkpoint:
+                try:
+                    records.append(json.loads(line))
+                except ValueError:
+                    continue
+        return records
+
+    def _open_checkpoint(self):
+        """
+        Open the checkpoint file to append boxscores.
+
+        If the previous crawl was interrupted while writing a line, the
+        partial line is terminated so the next boxscore starts on a new line.
+
+        Returns
+        -------
+        file
+            The checkpoint file opened for appending.
+        """
+        partial = False
+        if os.path.exists(self._checkpoint) and \
+           os.path.getsize(self._checkpoint) > 0:
+            with open(self._checkpoint, 'rb') as checkpoint:
+                checkpoint.seek(-1, os.SEEK_END)
+                partial = checkpoint.read(1) != b'\n'
+        checkpoint = open(self._checkpoint, 'a')
+        if partial:
+            checkpoint.write('\n')
+        return checkpoint
+
+    def _save(self, checkpoint, uri, boxscore):
+        """
+        Append a parsed boxscore to the checkpoint file.
+
+        Parameters
+        ----------
+        checkpoint : file
+            The open checkpoint file.
+        uri : string
+            The boxscore's URI.
+        boxscore : Boxscore instance
+            The parsed boxscore.
+
+        Returns
+        -------
+        boolean
+            True if the boxscore was saved, or False if the boxscore couldn't
+            be parsed.
+        """
+        dataframe = boxscore.dataframe
+        if dataframe is None:
+            return False
+        data = json.loads(dataframe.to_json(orient='records'))[0]
+        checkpoint.write(json.dumps({'uri': uri, 'data': data}) + '\n')
+        checkpoint.flush()
+        return True
+
+    def _save_completed(self, checkpoint, futures):
+        """
+        Wait for at least one boxscore to finish and save every finished
+        boxscore.
+
+        Every finished boxscore is removed from the pending futures so the
+        parsed boxscore can be released as soon as it's saved.
+
+        Parameters
+        ----------
+        checkpoint : file
+            The open checkpoint file.
+        futures : dict
+            A dictionary where each key is the future of a boxscore which is
+            being downloaded and each value is the boxscore's URI.
+
+        Returns
+        -------
+        int
+            The number of boxscores saved.
+        """
+        saved = 0
+        done, _ = wait(futures, return_when=FIRST_COMPLETED)
+        for future in done:
+            uri = futures.pop(future)
+            try:
+                if self._save(checkpoint, uri, future.result()):
+                    saved += 1
+                    continue
+            except Exception:
+                pass
+            self._failed.append(uri)
+        return saved
+
+    def crawl(self):
+        """
+        Download and parse every boxscore which hasn't been saved yet.
+
+        Returns
+        -------
+        int
+            The number of boxscores saved during this crawl. Any boxscore
+            which couldn't be downloaded or parsed is listed in the 'failed'
+            property and is retried during the next crawl.
+        """
+        completed = self.completed
+        missing = [uri for uri in self.boxscore_uris if uri not in completed]
+        boxscore = _league_module(self._league, 'boxscore').Boxscore
+        self._failed = []
+        saved = 0
+        if not missing:
+            return saved
+        workers = max(1, min(self._workers or 1, len(missing)))
+        with self._open_checkpoint() as checkpoint:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                pending = iter(missing)
+                futures = {}
+                while True:
+                    window = workers * BOXSCORES_PER_WORKER - len(futures)
+                    for uri in islice(pending, window):
+                        futures[executor.submit(boxscore, uri)] = uri
+                    if not futures:
+                        break
+                    saved += self._save_completed(checkpoint, futures)
+        return saved
+
+    @property
+    def boxscore_uris(self):
+        """
+        Returns a ``list`` of the unique boxscore URI of every completed game
+        in the season. The schedules are only downloaded the first time the
+        URIs are requested.
+        """
+        if self._boxscore_uris is None:
+            self._boxscore_uris = self._find_boxscore_uris()
+        return self._boxscore_uris
+
+    @property
+    def completed(self):
+        """
+        Returns a ``set`` of the URI of every boxscore saved in the checkpoint
+        file.
+        """
+        return set(record['uri'] for record in self._read_checkpoint())
+
+    @property
+    def failed(self):
+        """
+        Returns a ``list`` of the URI of every boxscore which couldn't be
+        downloaded or parsed during the most recent crawl.
+        """
+        return self._failed
+
+    @property
+    def dataframes(self):
+        """
+        Returns a pandas DataFrame of every boxscore saved in the checkpoint
+        file. Rows are indexed by the boxscore URI. Returns None if no
+        boxscores have been saved.
+        """
+        rows = []
+        index = []
+        seen = set()
+        for record in self._read_checkpoint():
+            if record['uri'] in seen:
+                continue
+            seen.add(record['uri'])
+            rows.append(record['data'])
+            index.append(record['uri'])
+        return utils._dataframe_from_rows(rows, index)
@@ -0,0 +1,424 @@
+import json
+import math
+from importlib import import_module
+
+
+# The number of rows written to each row group of a Parquet file.
+DEFAULT_BATCH_SIZE = 1024
+
+# The name of the map in each league's constants module which declares the
+# Arrow type of every column exported from a class.
+TYPE_MAPS = {
+    'Boxscore': 'BOXSCORE_TYPES',
+    'Game': 'SCHEDULE_TYPES',
+    'Player': 'PLAYER_TYPES',
+    'SlimPlayer': 'SLIM_PLAYER_TYPES',
+    'Team': 'TEAM_TYPES'
+}
+
+# The pyarrow function which creates every declared Arrow type. Dictionaries
+# and lists are declared as strings and stored as JSON.
+ARROW_TYPES = {
+    'bool': 'bool_',
+    'float64': 'float64',
+    'int64': 'int64',
+    'string': 'string',
+    'timestamp': 'timestamp'
+}
+
+# The name of the column holding the DataFrame index of every class whose
+# index isn't already one of the DataFrame's columns. The column is the first
+# column of the schema.
+INDEX_COLUMNS = {
+    'Boxscore': 'boxscore',
+    'Game': 'boxscore_index',
+    'Player': 'season'
+}
+
+# The Arrow type of every field in the games returned by the Boxscores
+# classes which aren't strings.
+SUMMARY_TYPES = {
+    'non_di': 'bool',
+    'week': 'int64'
+}
+
+_schemas = {}
+
+
+def _pyarrow():
+    """
+    Import pyarrow, which is only required to export Arrow tables and Parquet
+    files.
+
+    Returns
+    -------
+    module
+        The pyarrow module with the parquet submodule loaded.
+
+    Raises
+    ------
+    ImportError
+        If pyarrow isn't installed.
+    """
+    try:
+        import pyarrow
+        import pyarrow.parquet  # noqa: F401
+    except ImportError:
+        raise ImportError('pyarrow is required to export Arrow tables and '
+                          'Parquet files. Install it with "pip install '
+                          'sportsreference[arrow]".')
+    return pyarrow
+
+
+def _arrow_type(pyarrow, name):
+    """
+    Return the Arrow type of a declared column type.
+
+    Parameters
+    ----------
+    pyarrow : module
+        The pyarrow module.
+    name : string
+        The type as declared in a league's constants module, such as 'int64'.
+
+    Returns
+    -------
+    pyarrow DataType
+        The equivalent Arrow type.
+    """
+    arrow_type = ARROW_TYPES[name]
+    if arrow_type == 'timestamp':
+        return pyarrow.timestamp('us')
+    return getattr(pyarrow, arrow_type)()
+
+
+def _declared_types(cls):
+    """
+    Return the Arrow type of every column exported from a class.
+
+    Parameters
+    ----------
+    cls : class
+        The class of any league, such as sportsreference.nba.teams.Team.
+
+    Returns
+    -------
+    dictionary
+        A dictionary where every key is the name of a column and every value
+        is its declared type, as found in the constants module of the class'
+        league.
+
+    Raises
+    ------
+    ValueError
+        If the class' league doesn't declare the types of the class.
+    """
+    package = cls.__module__.rsplit('.', 1)[0]
+    constants = import_module('%s.constants' % package)
+    types = getattr(constants, TYPE_MAPS.get(cls.__name__, ''), None)
+    if types is None:
+        raise ValueError("%s.%s can't be exported."
+                         % (cls.__module__, cls.__name__))
+    return types
+
+
+def schema(cls):
+    """
+    Returns the Arrow schema of the DataFrame of any Team, Game, Boxscore,
+    or Player class.
+
+    The schema is declared next to the parsing schemes in the constants
+    module of the class' league, such as 'TEAM_TYPES' for a Team class.
+    Every declared column is included in alphabetical order, except for the
+    DataFrame's index which is the first column for classes where the index
+    isn't already a column.
+
+    Parameters
+    ----------
+    cls : class
+        The class of any league, such as sportsreference.nba.teams.Team.
+
+    Returns
+    -------
+    pyarrow Schema
+        The schema of every record exported from the class.
+
+    Raises
+    ------
+    ValueError
+        If the class' league doesn't declare the types of the class.
+    """
+    key = (cls.__module__, cls.__name__)
+    if key in _schemas:
+        return _schemas[key]
+    pyarrow = _pyarrow()
+    types = _declared_types(cls)
+    index = INDEX_COLUMNS.get(cls.__name__)
+    names = sorted(name for name in types if name != index)
+    if index in types:
+        names.insert(0, index)
+    _schemas[key] = pyarrow.schema([
+        pyarrow.field(name, _arrow_type(pyarrow, types[name]))
+        for name in names])
+    return _schemas[key]
+
+
+def _string(value):
+    """
+    Convert a value in a string column to a string, storing dictionaries and
+    lists as JSON and missing values as None.
+    """
+    if value is None or (isinstance(value, float) and math.isnan(value)):
+        return None
+    if isinstance(value, (dict, list)):
+        return json.dumps(value, default=str)
+    return str(value)
+
+
+def _array(pyarrow, values, arrow_type):
+    """
+    Create an Arrow array of the requested type.
+
+    Parameters
+    ----------
+    pyarrow : module
+        The pyarrow module.
+    values : list or Pandas Series
+        The values of every row in the column.
+    arrow_type : pyarrow DataType
+        The type of the column in the schema.
+
+    Returns
+    -------
+    pyarrow Array
+        An array of every value where NaN is stored as null.
+    """
+    if arrow_type == pyarrow.string():
+        values = [_string(value) for value in values]
+    return pyarrow.array(values, type=arrow_type, from_pandas=True)
+
+
+def _record_batch(pyarrow, declared, instance):
+    """
+    Convert the DataFrame of an object to an Arrow record batch.
+
+    Columns in the schema which aren't included in the DataFrame, such as a
+    player's name, are read from the object's property for every row.
+
+    Parameters
+    ----------
+    pyarrow : module
+        The pyarrow module.
+    declared : pyarrow Schema
+        The schema of the object's class.
+    instance : object
+        An instance of any Team, Game, Boxscore, or Player class.
+
+    Returns
+    -------
+    pyarrow RecordBatch
+        A record batch with a row for every row in the DataFrame, or None if
+        the object doesn't have a DataFrame, such as a game which hasn't been
+        played yet.
+    """
+    dataframe = instance.dataframe
+    if dataframe is None:
+        return None
+    index = INDEX_COLUMNS.get(type(instance).__name__)
+    arrays = []
+    for field in declared:
+        if field.name == index:
+            values = [value[0] if isinstance(value, tuple) else value
+                      for value in dataframe.index]
+        elif field.name in dataframe:
+            values = dataframe[field.name]
+        else:
+            values = [getattr(instance, field.name)] * len(dataframe)
+        arrays.append(_array(pyarrow, values, field.type))
+    return pyarrow.RecordBatch.from_arrays(arrays, schema=declared)
+
+
+def _record_batches(objects):
+    """
+    Convert every object to a record batch, one object at a time.
+
+    Parameters
+    ----------
+    objects : iterable
+        Any iterable of instances of the same class, such as a Teams
+        instance or a generator of Boxscore instances.
+
+    Returns
+    -------
+    generator
+        A generator of a record batch for every object with a DataFrame.
+
+    Raises
+    ------
+    ValueError
+        If the objects aren't all instances of the same class.
+    """
+    pyarrow = _pyarrow()
+    cls = None
+    for instance in objects:
+        if cls is None:
+            cls = type(instance)
+            declared = schema(cls)
+        elif type(instance) is not cls:
+            raise ValueError('Every object must be an instance of %s.%s'
+                             % (cls.__module__, cls.__name__))
+        batch = _record_batch(pyarrow, declared, instance)
+        if batch is not None:
+            yield batch
+
+
+def _summary_batches(games, key):
+    """
+    Convert the games found by a Boxscores class to record batches, one day
+    or week at a time.
+
+    Parameters
+    ----------
+    games : OrderedDict
+        A dictionary where every key is a day or week and every value is a
+        list of dictionaries of the games during that day or week, such as
+        the 'games_by_date' property of a Boxscores instance.
+    key : string
+        The name of the column holding the day or week, such as 'date'.
+
+    Returns
+    -------
+    generator
+        A generator of a record batch for every day or week with any games.
+    """
+    pyarrow = _pyarrow()
+    declared = None
+    for value, day in games.items():
+        if not day:
+            continue
+        if declared is None:
+            names = [key] + [name for name in day[0] if name != key]
+            declared = pyarrow.schema([
+                pyarrow.field(name, _arrow_type(pyarrow,
+                                                SUMMARY_TYPES.get(name,
+                                                                  'string')))
+                for name in names])
+        arrays = []
+        for field in declared:
+            if field.name == key:
+                values = [value] * len(day)
+            else:
+                values = [game.get(field.name) for game in day]
+            arrays.append(_array(pyarrow, values, field.type))
+        yield pyarrow.RecordBatch.from_arrays(arrays, schema=declared)
+
+
+def _table(batches):
+    """
+    Combine record batches into a single Arrow table.
+
+    Returns
+    -------
+    pyarrow Table
+        A table of every batch, or None if there aren't any batches.
+    """
+    batches = list(batches)
+    if not batches:
+        return None
+    return _pyarrow().Table.from_batches(batches)
+
+
+def _write(path, batches, batch_size=DEFAULT_BATCH_SIZE):
+    """
+    Stream record batches to a Parquet file.
+
+    At most 'batch_size' rows are held in memory before they are written as a
+    row group, so any number of batches can be written.
+
+    Parameters
+    ----------
+    path : string
+        The path of the Parquet file to create.
+    batches : iterable
+        Any iterable of record batches which share the same schema.
+    batch_size : int (optional)
+        The number of rows to write in each row group.
+
+    Returns
+    -------
+    int
+        The number of rows written. The file isn't created if there aren't
+        any rows.
+    """
+    pyarrow = _pyarrow()
+    writer = None
+    pending = []
+    pending_rows = 0
+    rows = 0
+    try:
+        for batch in batches:
+            if writer is None:
+                writer = pyarrow.parquet.ParquetWriter(path, batch.schema)
+            pending.append(batch)
+            pending_rows += batch.num_rows
+            if pending_rows >= batch_size:
+                writer.write_table(pyarrow.Table.from_batches(pending))
+                rows += pending_rows
+                pending = []
+                pending_rows = 0
+        if pending:
+            writer.write_table(pyarrow.Table.from_batches(pending))
+            rows += pending_rows
+    finally:
+        if writer is not None:
+            writer.close()
+    return rows
+
+
+def to_arrow(objects):
+    """
+    Returns a ``pyarrow Table`` of the DataFrames of every object, typed by
+    the schema of their class.
+
+    Parameters
+    ----------
+    objects : iterable
+        Any iterable of instances of the same Team, Game, Boxscore, or Player
+        class.
+
+    Returns
+    -------
+    pyarrow Table
+        A table with a row for every row in each object's DataFrame, or None
+        if none of the objects have a DataFrame.
+    """
+    return _table(_record_batches(objects))
+
+
+def to_parquet(path, objects, batch_size=DEFAULT_BATCH_SIZE):
+    """
+    Write the DataFrames of every object to a Parquet file, typed by the
+    schema of their class.
+
+    Objects are converted and written one at a time, so a generator can be
+    used to write any number of objects without holding them all in memory,
+    such as every boxscore in several seasons::
+
+        to_parquet('boxscores.parquet', (Boxscore(uri) for uri in uris))
+
+    Parameters
+    ----------
+    path : string
+        The path of the Parquet file to create.
+    objects : iterable
+        Any iterable of instances of the same Team, Game, Boxscore, or Player
+        class.
+    batch_size : int (optional)
+        The number of rows to write in each row group.
+
+    Returns
+    -------
+    int
+        The number of rows written.
+    """
+    return _write(path, _record_batches(objects), batch_size)
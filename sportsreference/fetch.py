@@ -0,0 +1,523 @@
+import threading
+from collections import OrderedDict
+from copy import deepcopy
+from concurrent.futures import ThreadPoolExecutor
+from pyquery import PyQuery as pq
+from requests import Session
+from requests.adapters import HTTPAdapter
+from requests.compat import urlparse
+from requests.exceptions import HTTPError
+from . import instrument
+
+
+# Number of seconds to wait for a server to respond before giving up on a
+# request. This matches the default previously used by PyQuery.
+DEFAULT_TIMEOUT = 60
+# Number of per-host connection pools to cache and the maximum number of
+# connections to keep alive in each pool.
+DEFAULT_POOL_CONNECTIONS = 10
+DEFAULT_POOL_MAXSIZE = 10
+# Default number of pages to download simultaneously when fetching in bulk.
+# This is kept below the connection pool size so every worker is able to
+# reuse a pooled connection.
+DEFAULT_WORKERS = 8
+# Number of parsed pages to keep in memory while a page cache is set. Only
+# pages the server has confirmed are unchanged, such as current-season pages
+# which are refreshed periodically, are kept, and every caller receives its
+# own copy of the page instead of parsing it again.
+DEFAULT_PARSED_PAGES = 16
+
+
+class _TimeoutHTTPAdapter(HTTPAdapter):
+    """
+    An HTTPAdapter which applies a default timeout to every request.
+
+    The requests library doesn't support a session-wide timeout, so the
+    timeout is injected whenever a request is sent without one.
+
+    Parameters
+    ----------
+    timeout : float or tuple
+        The number of seconds to wait for the server to respond, or a tuple
+        of the connect and read timeouts.
+    """
+    def __init__(self, timeout, *args, **kwargs):
+        self._timeout = timeout
+        super(_TimeoutHTTPAdapter, self).__init__(*args, **kwargs)
+
+    def send(self, request, **kwargs):
+        if kwargs.get('timeout') is None:
+            kwargs['timeout'] = self._timeout
+        return super(_TimeoutHTTPAdapter, self).send(request, **kwargs)
+
+
+class Transport(object):
+    """
+    A pool of keep-alive HTTP sessions, one for each host.
+
+    Every page on the sports-reference family of websites is downloaded
+    through a single Transport which keeps a ``requests.Session`` open for
+    each host. Subsequent requests to the same host reuse the pooled
+    connections instead of paying for a new TCP and TLS handshake for every
+    page.
+
+    Parameters
+    ----------
+    timeout : float or tuple (optional)
+        The number of seconds to wait for the server to respond, or a tuple of
+        the connect and read timeouts. Defaults to 60 seconds.
+    pool_connections : int (optional)
+        The number of connection pools to cache per session.
+    pool_maxsize : int (optional)
+        The maximum number of connections to keep alive in each pool. This
+        should be at least as large as the number of threads downloading pages
+        concurrently.
+    headers : dict (optional)
+        A dictionary of headers to include with every request, such as a
+        custom 'User-Agent'.
+    """
+    def __init__(self, timeout=DEFAULT_TIMEOUT,
+                 pool_connections=DEFAULT_POOL_CONNECTIONS,
+                 pool_maxsize=DEFAULT_POOL_MAXSIZE, headers=None):
+        self._timeout = timeout
+        self._pool_connections = pool_connections
+        self._pool_maxsize = pool_maxsize
+        self._headers = headers or {}
+        self._sessions = {}
+        self._lock = threading.Lock()
+
+    def _create_session(self):
+        """
+        Create a new session with the configured pool and default headers.
+
+        Returns
+        -------
+        requests.Session
+            A new session which applies the configured timeout and headers to
+            every request.
+        """
+        session = Session()
+        adapter = _TimeoutHTTPAdapter(self._timeout,
+                                      pool_connections=self._pool_connections,
+                                      pool_maxsize=self._pool_maxsize)
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        session.headers.update(self._headers)
+        return session
+
+    def session(self, url):
+        """
+        Return the pooled session for the URL's host.
+
+        Sessions are created the first time a host is requested and are reused
+        for every subsequent request to that host.
+
+        Parameters
+        ----------
+        url : string
+            The full URL which will be requested.
+
+        Returns
+        -------
+        requests.Session
+            The session which owns the connection pool for the URL's host.
+        """
+        parsed = urlparse(url)
+        host = '%s://%s' % (parsed.scheme, parsed.netloc)
+        with self._lock:
+            try:
+                return self._sessions[host]
+            except KeyError:
+                session = self._create_session()
+                self._sessions[host] = session
+                return session
+
+    def get(self, url, headers=None):
+        """
+        Download the requested URL.
+
+        Parameters
+        ----------
+        url : string
+            The full URL to download.
+        headers : dict (optional)
+            Additional headers to include with this request only.
+
+        Returns
+        -------
+        requests.Response
+            The response received from the server.
+        """
+        session = self.session(url)
+        if headers:
+            return session.get(url, headers=headers)
+        return session.get(url)
+
+    def close(self):
+        """
+        Close every open session and its pooled connections.
+        """
+        with self._lock:
+            for session in self._sessions.values():
+                session.close()
+            self._sessions = {}
+
+
+_transport = Transport()
+_cache = None
+_rate_limiter = None
+_parsed = OrderedDict()
+_parsed_lock = threading.Lock()
+
+
+def configure(**kwargs):
+    """
+    Configure the transport used to download every page.
+
+    Replaces the shared transport with a new one using the requested settings
+    and closes any connections held by the previous transport.
+
+    Parameters
+    ----------
+    **kwargs
+        Any of the keyword arguments accepted by ``Transport``, such as
+        'timeout', 'pool_connections', 'pool_maxsize', or 'headers'.
+
+    Returns
+    -------
+    Transport
+        The newly configured transport.
+    """
+    global _transport
+    previous = _transport
+    _transport = Transport(**kwargs)
+    previous.close()
+    return _transport
+
+
+def get_transport():
+    """
+    Return the shared transport used to download every page.
+
+    Returns
+    -------
+    Transport
+        The transport currently in use.
+    """
+    return _transport
+
+
+def set_transport(transport):
+    """
+    Set the transport used to download every page without closing the
+    previous transport.
+
+    Parameters
+    ----------
+    transport : Transport
+        Any object with the same 'get' and 'close' methods as ``Transport``,
+        such as a ``sportsreference.archive.ReplayTransport``.
+
+    Returns
+    -------
+    Transport
+        The previous transport, which can be restored with another call to
+        ``set_transport``.
+    """
+    global _transport
+    previous = _transport
+    _transport = transport
+    return previous
+
+
+def set_cache(cache):
+    """
+    Set the page cache every download is read from and written to.
+
+    Parameters
+    ----------
+    cache : PageCache
+        A ``sportsreference.cache.PageCache`` instance, or None to disable
+        caching.
+    """
+    global _cache
+    _cache = cache
+    with _parsed_lock:
+        _parsed.clear()
+
+
+def get_cache():
+    """
+    Return the page cache currently in use.
+
+    Returns
+    -------
+    PageCache
+        The page cache currently in use, or None if caching is disabled.
+    """
+    return _cache
+
+
+def set_rate_limiter(rate_limiter):
+    """
+    Set the rate limiter which paces every request.
+
+    Parameters
+    ----------
+    rate_limiter : RateLimiter
+        A ``sportsreference.ratelimit.RateLimiter`` instance, or None to
+        disable pacing.
+    """
+    global _rate_limiter
+    _rate_limiter = rate_limiter
+
+
+def get_rate_limiter():
+    """
+    Return the rate limiter currently in use.
+
+    Returns
+    -------
+    RateLimiter
+        The rate limiter currently in use, or None if pacing is disabled.
+    """
+    return _rate_limiter
+
+
+def _request(url, headers=None):
+    """
+    Download the requested URL, pacing and retrying the request if a rate
+    limiter has been set.
+
+    Parameters
+    ----------
+    url : string
+        The full URL to download.
+    headers : dict (optional)
+        Additional headers to include with the request, such as the headers
+        to revalidate a cached page.
+
+    Returns
+    -------
+    requests.Response
+        The response received from the server.
+    """
+    rate_limiter = _rate_limiter
+    if rate_limiter is None:
+        return _transport.get(url, headers)
+    attempt = 0
+    while True:
+        rate_limiter.acquire(url)
+        response = _transport.get(url, headers)
+        if not rate_limiter.should_retry(response, attempt):
+            return response
+        rate_limiter.backoff(url, response, attempt)
+        attempt += 1
+
+
+def _validators(response):
+    """
+    Find the headers the server sent to revalidate a page.
+
+    Parameters
+    ----------
+    response : requests.Response
+        The response received from the server.
+
+    Returns
+    -------
+    dict
+        A dictionary of the 'etag' and 'last_modified' values, which are None
+        if the server didn't send the matching header.
+    """
+    headers = getattr(response, 'headers', None) or {}
+    return {'etag': headers.get('ETag'),
+            'last_modified': headers.get('Last-Modified')}
+
+
+def get_html(url):
+    """
+    Download the requested page and return its contents.
+
+    If a page cache has been set and holds a fresh copy of the page, the
+    cached contents are returned without making a request. If the cached copy
+    has expired but was sent with an 'ETag' or 'Last-Modified' header, the
+    request asks the server to only send the page if it has changed. When the
+    server responds with '304 Not Modified', the cached copy is marked as
+    fresh and returned without downloading the page again.
+
+    Parameters
+    ----------
+    url : string
+        The full URL of the page to download.
+
+    Returns
+    -------
+    string
+        The HTML contents of the requested page.
+
+    Raises
+    ------
+    requests.exceptions.HTTPError
+        If the server responds with a non-2xx status code.
+    """
+    return _get_html(url)[0]
+
+
+def _get_html(url):
+    """
+    Download the requested page, or read it from the page cache, and time the
+    'fetch' stage.
+
+    Returns
+    -------
+    tuple
+        A tuple of the HTML contents of the page and a boolean which is True
+        if the server confirmed an expired cached copy is still current.
+    """
+    if not instrument.enabled:
+        return _download(url)
+    with instrument.stage('fetch', url) as fetching:
+        html, revalidated = _download(url)
+        fetching.bytes = len(html)
+    return html, revalidated
+
+
+def _download(url):
+    """
+    Download the requested page, or read it from the page cache.
+
+    Returns
+    -------
+    tuple
+        A tuple of the HTML contents of the page and a boolean which is True
+        if the server confirmed an expired cached copy is still current.
+    """
+    cache = _cache
+    stale = None
+    headers = None
+    if cache is not None:
+        stale, headers = cache.lookup(url)
+        if stale is not None and headers is None:
+            return stale, False
+    response = _request(url, headers)
+    if response.status_code == 304 and stale is not None:
+        cache.refresh(url)
+        return stale, True
+    if not 200 <= response.status_code < 300:
+        raise HTTPError('%s error for url: %s' % (response.status_code, url),
+                        response=response)
+    html = response.text
+    if cache is not None:
+        cache.set(url, html, _validators(response))
+    return html, False
+
+
+def _load(url, html):
+    """
+    Parse the HTML contents of a page into a PyQuery object.
+    """
+    if not instrument.enabled:
+        return pq(html, parser='html')
+    with instrument.stage('load', url, len(html)):
+        return pq(html, parser='html')
+
+
+def get_page(url):
+    """
+    Download the requested page and return it as a PyQuery object.
+
+    Every call returns a separate object, as callers modify the pages they
+    parse. While a page cache is set, pages the server has confirmed are
+    unchanged, such as an expired page which is still current, are kept in
+    memory once parsed. Every later confirmation returns a copy of the parsed
+    page, which is faster than parsing the page again.
+
+    Parameters
+    ----------
+    url : string
+        The full URL of the page to download.
+
+    Returns
+    -------
+    PyQuery object
+        The requested page as a queriable PyQuery object.
+
+    Raises
+    ------
+    requests.exceptions.HTTPError
+        If the server responds with a non-2xx status code.
+    """
+    html, revalidated = _get_html(url)
+    if not revalidated:
+        return _load(url, html)
+    with _parsed_lock:
+        parsed = _parsed.pop(url, None)
+        if parsed is not None and parsed[0] == html:
+            _parsed[url] = parsed
+            # Copying the tree while holding the lock ensures it's never read
+            # by more than one thread at a time.
+            return pq(deepcopy(parsed[1]))
+    page = _load(url, html)
+    with _parsed_lock:
+        _parsed[url] = (html, deepcopy(page[0]))
+        while len(_parsed) > DEFAULT_PARSED_PAGES:
+            _parsed.popitem(last=False)
+    return page
+
+
+def map_concurrent(function, items, workers=DEFAULT_WORKERS):
+    """
+    Apply a function to every item using a bounded pool of worker threads.
+
+    Downloading pages spends most of its time waiting on the network, so
+    running the downloads in a pool of threads allows the total time to scale
+    with the number of workers instead of the number of pages.
+
+    Parameters
+    ----------
+    function : function
+        The function to call with each item, such as a Boxscore class.
+    items : iterable
+        The items to pass to the function.
+    workers : int (optional)
+        The maximum number of items to process simultaneously. If None or 1,
+        every item is processed sequentially in the calling thread.
+
+    Returns
+    -------
+    list
+        A list of the function's results in the same order as the items.
+    """
+    items = list(items)
+    if not workers or workers <= 1 or len(items) <= 1:
+        return [function(item) for item in items]
+    function = instrument.bind(function)
+    with ThreadPoolExecutor(max_workers=min(workers, len(items))) as executor:
+        return list(executor.map(function, items))
+
+
+def fetch_many(urls, workers=DEFAULT_WORKERS):
+    """
+    Download multiple pages concurrently.
+
+    Parameters
+    ----------
+    urls : iterable
+        The full URLs of every page to download.
+    workers : int (optional)
+        The maximum number of pages to download simultaneously.
+
+    Returns
+    -------
+    list
+        A list of the HTML contents of every page in the same order as the
+        URLs. If a page couldn't be downloaded, its contents are None.
+    """
+    def _fetch(url):
+        try:
+            return get_html(url)
+        except Exception:
+            return None
+
+    return map_concurrent(_fetch, urls, workers)
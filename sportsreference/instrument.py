@@ -0,0 +1,486 @@
+import sys
+import threading
+import time
+from collections import namedtuple
+from contextlib import contextmanager
+from functools import wraps
+
+
+# Every stage of building an object from a page, in the order they run:
+#   fetch - downloading the page, or reading it from the page cache.
+#   load - parsing the page's HTML into a document tree.
+#   clean - replacing the comments hiding tables with their contents.
+#   parse - selecting tables, rows and fields from the document.
+#   build - creating the DataFrames of parsed objects.
+STAGES = ('fetch', 'load', 'clean', 'parse', 'build')
+
+# The upper bound in seconds of every bucket in the latency histograms. An
+# additional bucket holds every event slower than the last bound.
+HISTOGRAM_BUCKETS = (0.00001, 0.0001, 0.001, 0.01, 0.1, 1.0, 10.0)
+
+# The leagues whose classes events are attributed to.
+LEAGUES = ('mlb', 'nba', 'ncaab', 'ncaaf', 'nfl', 'nhl')
+
+Event = namedtuple('Event', ['stage', 'league', 'object_type', 'url',
+                             'duration', 'bytes'])
+Event.__doc__ = """
+A single timed stage.
+
+Parameters
+----------
+stage : string
+    The stage which was timed, as listed in STAGES.
+league : string
+    The league of the object the stage ran for, such as 'nba', or None if it
+    isn't known.
+object_type : string
+    The name of the class of the object the stage ran for, such as
+    'Boxscore', or None if it isn't known.
+url : string
+    The URL of the page the stage ran for, or None if it isn't known.
+duration : float
+    The number of seconds the stage took, excluding the time spent in any
+    other stage it ran.
+bytes : int
+    The size of the page in bytes for the 'fetch' and 'load' stages, or None
+    for every other stage.
+"""
+
+# True while at least one listener is registered. Every instrumented function
+# checks this flag before doing any work to time itself, so instrumentation
+# costs nothing beyond the check while it's disabled.
+enabled = False
+
+_listeners = []
+_lock = threading.Lock()
+_local = threading.local()
+# time.perf_counter isn't available on Python 2.
+_timer = getattr(time, 'perf_counter', time.time)
+
+
+def add_listener(listener):
+    """
+    Register a function which receives every event.
+
+    Parameters
+    ----------
+    listener : function
+        A function which is called with an ``Event`` every time a stage
+        finishes. It's called from the thread which ran the stage.
+    """
+    global enabled
+    with _lock:
+        _listeners.append(listener)
+        enabled = True
+
+
+def remove_listener(listener):
+    """
+    Unregister a function added with ``add_listener``.
+
+    Parameters
+    ----------
+    listener : function
+        The function to unregister.
+    """
+    global enabled
+    with _lock:
+        if listener in _listeners:
+            _listeners.remove(listener)
+        enabled = bool(_listeners)
+
+
+@contextmanager
+def listen(listener):
+    """
+    Send every event within the context to a listener.
+
+    Parameters
+    ----------
+    listener : function
+        A function which is called with an ``Event`` every time a stage
+        finishes, such as an ``Aggregator`` instance.
+
+    Returns
+    -------
+    function
+        The listener.
+    """
+    add_listener(listener)
+    try:
+        yield listener
+    finally:
+        remove_listener(listener)
+
+
+def _league_class(instance):
+    """
+    Find the league and class of an object.
+
+    Returns
+    -------
+    tuple
+        A tuple of the league and the name of the class, or None if the object
+        isn't an instance of a class in one of the league packages.
+    """
+    module = type(instance).__module__.split('.')
+    if len(module) == 3 and module[0] == 'sportsreference' and \
+       module[1] in LEAGUES:
+        return module[1], type(instance).__name__
+    return None
+
+
+def _owner(instance=None):
+    """
+    Find the league and class of the object a stage is running for.
+
+    The stack is searched for the most recent method of a class in one of the
+    league packages. If there isn't one, such as in a worker thread, the
+    object which started the worker is used instead.
+
+    Parameters
+    ----------
+    instance : object (optional)
+        The object whose method is being timed, which is used instead of
+        searching the stack if it belongs to one of the league packages.
+
+    Returns
+    -------
+    tuple
+        A tuple of the league and the name of the class, or a tuple of None
+        values if the object can't be found.
+    """
+    if instance is not None:
+        owner = _league_class(instance)
+        if owner:
+            return owner
+    frame = sys._getframe(1)
+    while frame is not None:
+        instance = frame.f_locals.get('self')
+        if instance is not None:
+            owner = _league_class(instance)
+            if owner:
+                return owner
+        frame = frame.f_back
+    return getattr(_local, 'owner', (None, None))
+
+
+class _Stage(object):
+    """
+    A context which times a single stage and sends its event to every
+    listener when it exits.
+
+    Time spent in any stage started within the context on the same thread is
+    excluded from the stage's duration, so the durations of every stage add
+    up to the total time.
+
+    Parameters
+    ----------
+    stage : string
+        The stage being timed, as listed in STAGES.
+    url : string (optional)
+        The URL of the page the stage is running for.
+    size : int (optional)
+        The size of the page in bytes. Can also be set on the context before
+        it exits.
+    instance : object (optional)
+        The object whose method is being timed.
+    """
+    def __init__(self, stage, url=None, size=None, instance=None):
+        self.stage = stage
+        self.url = url
+        self.bytes = size
+        self._instance = instance
+        self._nested = 0.0
+
+    def __enter__(self):
+        self._league, self._object_type = _owner(self._instance)
+        self._instance = None
+        stack = getattr(_local, 'stack', None)
+        if stack is None:
+            stack = _local.stack = []
+        stack.append(self)
+        self._start = _timer()
+        return self
+
+    def __exit__(self, *exc_info):
+        elapsed = _timer() - self._start
+        stack = _local.stack
+        stack.pop()
+        if stack:
+            stack[-1]._nested += elapsed
+        event = Event(self.stage, self._league, self._object_type, self.url,
+                      elapsed - self._nested, self.bytes)
+        for listener in list(_listeners):
+            listener(event)
+        return False
+
+
+def stage(name, url=None, size=None):
+    """
+    Time a block of code as a stage.
+
+    Stages should only be timed while instrumentation is enabled::
+
+        if instrument.enabled:
+            with instrument.stage('fetch', url) as fetching:
+                html = download(url)
+                fetching.bytes = len(html)
+
+    Parameters
+    ----------
+    name : string
+        The stage being timed, as listed in STAGES.
+    url : string (optional)
+        The URL of the page the stage is running for.
+    size : int (optional)
+        The size of the page in bytes. Can also be set as the 'bytes'
+        attribute of the returned context.
+
+    Returns
+    -------
+    context manager
+        A context which sends the stage's event to every listener when it
+        exits.
+    """
+    return _Stage(name, url, size)
+
+
+def timed(name):
+    """
+    Decorate a function so every call is timed as a stage.
+
+    While instrumentation is disabled, the function is called directly.
+
+    Parameters
+    ----------
+    name : string
+        The stage the function runs, as listed in STAGES.
+
+    Returns
+    -------
+    function
+        A decorator which times the function.
+    """
+    def decorator(function):
+        @wraps(function)
+        def wrapper(*args, **kwargs):
+            if not enabled:
+                return function(*args, **kwargs)
+            with _Stage(name, instance=args[0] if args else None):
+                return function(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def bind(function):
+    """
+    Attribute the events of a function run on a worker thread to the object
+    which started the worker.
+
+    Parameters
+    ----------
+    function : function
+        The function which will be run on a worker thread.
+
+    Returns
+    -------
+    function
+        The function, wrapped to carry the calling object to the worker while
+        instrumentation is enabled.
+    """
+    if not enabled:
+        return function
+    owner = _owner()
+
+    @wraps(function)
+    def wrapper(*args, **kwargs):
+        previous = getattr(_local, 'owner', None)
+        _local.owner = owner
+        try:
+            return function(*args, **kwargs)
+        finally:
+            _local.owner = previous
+    return wrapper
+
+
+def _format_duration(seconds):
+    """
+    Format a number of seconds with the most readable unit.
+    """
+    if seconds >= 1:
+        return '%gs' % seconds
+    if seconds >= 0.001:
+        return '%gms' % (seconds * 1000)
+    return '%gus' % round(seconds * 1000000, 3)
+
+
+class Aggregator(object):
+    """
+    A listener which summarizes the latency of every stage.
+
+    Only a histogram and running totals are kept for each stage, league and
+    class, so memory use doesn't grow with the number of events. Print the
+    latency histogram of every stage after a crawl with ``report``::
+
+        aggregator = instrument.Aggregator()
+        with instrument.listen(aggregator):
+            Schedule('DET', 2018).dataframe_extended
+        aggregator.report()
+
+    Parameters
+    ----------
+    buckets : tuple (optional)
+        The upper bound in seconds of every bucket in the histograms, in
+        ascending order.
+    """
+    def __init__(self, buckets=HISTOGRAM_BUCKETS):
+        self._buckets = tuple(buckets)
+        self._lock = threading.Lock()
+        self._totals = {}
+
+    def __call__(self, event):
+        index = 0
+        while index < len(self._buckets) and \
+                event.duration > self._buckets[index]:
+            index += 1
+        key = (event.stage, event.league, event.object_type)
+        with self._lock:
+            totals = self._totals.get(key)
+            if totals is None:
+                totals = self._totals[key] = {
+                    'count': 0, 'total': 0.0, 'max': 0.0, 'bytes': 0,
+                    'histogram': [0] * (len(self._buckets) + 1)
+                }
+            totals['count'] += 1
+            totals['total'] += event.duration
+            totals['max'] = max(totals['max'], event.duration)
+            totals['bytes'] += event.bytes or 0
+            totals['histogram'][index] += 1
+
+    def reset(self):
+        """
+        Discard every event received so far.
+        """
+        with self._lock:
+            self._totals.clear()
+
+    def _stage_totals(self, stage):
+        """
+        Combine the totals of every league and class for a single stage.
+        """
+        combined = {'count': 0, 'total': 0.0, 'max': 0.0, 'bytes': 0,
+                    'histogram': [0] * (len(self._buckets) + 1)}
+        with self._lock:
+            for key, totals in self._totals.items():
+                if key[0] != stage:
+                    continue
+                combined['count'] += totals['count']
+                combined['total'] += totals['total']
+                combined['max'] = max(combined['max'], totals['max'])
+                combined['bytes'] += totals['bytes']
+                combined['histogram'] = [
+                    a + b for a, b in zip(combined['histogram'],
+                                          totals['histogram'])]
+        return combined
+
+    @property
+    def stages(self):
+        """
+        Returns a ``list`` of every stage which has received an event, in the
+        order the stages run.
+        """
+        with self._lock:
+            seen = set(key[0] for key in self._totals)
+        return [name for name in STAGES if name in seen] + \
+            sorted(seen.difference(STAGES))
+
+    def histogram(self, stage):
+        """
+        Returns a ``list`` of the number of events of a stage in every
+        bucket. The last value is the number of events slower than the last
+        bucket.
+        """
+        return self._stage_totals(stage)['histogram']
+
+    def summary(self, by_object=False):
+        """
+        Summarize the latency of every stage.
+
+        Parameters
+        ----------
+        by_object : boolean (optional)
+            If True, every stage is summarized separately for every league
+            and class.
+
+        Returns
+        -------
+        list
+            A list of dictionaries with the 'stage', the number of events as
+            'count', the 'total', 'mean' and 'max' seconds, and the total
+            number of 'bytes' of every stage, in the order the stages run.
+            Each dictionary also includes the 'league' and 'object_type' if
+            'by_object' is True.
+        """
+        rows = []
+        if by_object:
+            with self._lock:
+                items = sorted(self._totals.items(),
+                               key=lambda item: (self._order(item[0][0]),
+                                                 item[0][1] or '',
+                                                 item[0][2] or ''))
+            for (name, league, object_type), totals in items:
+                row = {'stage': name, 'league': league,
+                       'object_type': object_type}
+                row.update(self._row(totals))
+                rows.append(row)
+            return rows
+        for name in self.stages:
+            row = {'stage': name}
+            row.update(self._row(self._stage_totals(name)))
+            rows.append(row)
+        return rows
+
+    def _order(self, stage):
+        """
+        Return the position of a stage when sorting stages in the order they
+        run.
+        """
+        return STAGES.index(stage) if stage in STAGES else len(STAGES)
+
+    def _row(self, totals):
+        """
+        Convert the totals of a stage to a row of the summary.
+        """
+        return {
+            'count': totals['count'],
+            'total': totals['total'],
+            'mean': totals['total'] / totals['count'],
+            'max': totals['max'],
+            'bytes': totals['bytes']
+        }
+
+    def report(self, output=sys.stdout, width=40):
+        """
+        Print the latency histogram of every stage.
+
+        Parameters
+        ----------
+        output : file (optional)
+            The file the report is printed to.
+        width : int (optional)
+            The number of characters in the longest bar of each histogram.
+        """
+        labels = ['<= %s' % _format_duration(bound)
+                  for bound in self._buckets]
+        labels.append('> %s' % _format_duration(self._buckets[-1]))
+        for row in self.summary():
+            output.write('%s: %d events, %s total, %s mean, %s max\n' % (
+                row['stage'], row['count'], _format_duration(row['total']),
+                _format_duration(row['mean']), _format_duration(row['max'])))
+            histogram = self.histogram(row['stage'])
+            largest = max(histogram)
+            for label, count in zip(labels, histogram):
+                bar = '#' * int(round(count * width / float(largest)))
+                output.write('  %10s | %-*s %d\n' % (label, width, bar,
+                                                     count))
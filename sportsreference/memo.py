@@ -0,0 +1,253 @@
+import re
+import threading
+from collections import OrderedDict
+from functools import wraps
+
+
+# Default number of objects kept by an ObjectCache before the least recently
+# used objects are evicted.
+DEFAULT_MAX_OBJECTS = 128
+# Every value identifying a memoized object, such as an abbreviation, a year,
+# or a boxscore URI, only contains these characters. Any other value, such as
+# the HTML stored in place of the boxscore URI of a game which hasn't been
+# played yet, doesn't identify an object and isn't memoized.
+KEY_PATTERN = re.compile(r'^[A-Za-z0-9/.&_-]+$')
+
+_object_cache = None
+
+
+class ObjectCache(object):
+    """
+    A size-bounded cache of built objects shared by the whole process.
+
+    Objects built by memoized properties, such as a team's schedule, are kept
+    in memory and returned to every instance requesting the same object, so
+    a schedule requested through two different Team instances is only
+    downloaded and parsed once. Every object is keyed by a tuple starting
+    with its league and type, such as ('nba', 'schedule', 'DET', '2018') or
+    ('nba', 'boxscore', '201710310LAL'). Once the cache is full, the least
+    recently used object is evicted.
+
+    Parameters
+    ----------
+    max_objects : int (optional)
+        The maximum number of objects to keep.
+    """
+    def __init__(self, max_objects=DEFAULT_MAX_OBJECTS):
+        self._max_objects = max_objects
+        self._objects = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __contains__(self, key):
+        with self._lock:
+            return key in self._objects
+
+    def __len__(self):
+        with self._lock:
+            return len(self._objects)
+
+    def get(self, key):
+        """
+        Return a cached object and mark it as the most recently used.
+
+        Parameters
+        ----------
+        key : tuple
+            The object's key, such as ('nba', 'boxscore', '201710310LAL').
+
+        Returns
+        -------
+        object
+            The cached object, or None if it isn't cached.
+        """
+        with self._lock:
+            value = self._objects.pop(key, None)
+            if value is not None:
+                self._objects[key] = value
+            return value
+
+    def set(self, key, value):
+        """
+        Store an object, evicting the least recently used objects if the
+        cache is full.
+
+        Parameters
+        ----------
+        key : tuple
+            The object's key, such as ('nba', 'boxscore', '201710310LAL').
+        value : object
+            The object to store.
+        """
+        with self._lock:
+            self._objects.pop(key, None)
+            self._objects[key] = value
+            while len(self._objects) > self._max_objects:
+                self._objects.popitem(last=False)
+
+    def invalidate(self, *prefix):
+        """
+        Remove every object whose key starts with the given values.
+
+        For example, ``invalidate('nba', 'schedule')`` removes every NBA
+        schedule and ``invalidate('nba')`` removes every NBA object.
+
+        Parameters
+        ----------
+        prefix : tuple
+            The leading values of the key of every object to remove. Every
+            object is removed if no values are given.
+
+        Returns
+        -------
+        int
+            The number of objects removed.
+        """
+        with self._lock:
+            keys = [key for key in self._objects
+                    if key[:len(prefix)] == prefix]
+            for key in keys:
+                del self._objects[key]
+        return len(keys)
+
+    def clear(self):
+        """
+        Remove every object from the cache.
+        """
+        self.invalidate()
+
+
+def set_object_cache(cache):
+    """
+    Set the cache every memoized object is shared through.
+
+    Parameters
+    ----------
+    cache : ObjectCache
+        An ``ObjectCache`` instance, or None to only memoize objects on the
+        instance which built them.
+    """
+    global _object_cache
+    _object_cache = cache
+
+
+def get_object_cache():
+    """
+    Return the object cache currently in use.
+
+    Returns
+    -------
+    ObjectCache
+        The object cache currently in use, or None if objects aren't shared.
+    """
+    return _object_cache
+
+
+class Memoized(object):
+    """
+    A base class which stores the objects built by its memoized properties.
+
+    The memoized objects are stored in a separate slot, so subclasses can
+    keep listing only their parsed fields in ``__slots__``.
+    """
+    __slots__ = ('_memo',)
+
+
+def memoized(kind, *attributes):
+    """
+    Decorate a property so the object it builds is only built once.
+
+    The object is kept on the instance, so every subsequent access returns
+    the same object. If an object cache has been set, the object is also
+    shared with every other instance requesting the same object. Objects are
+    only memoized if every identifying attribute is set and matches
+    KEY_PATTERN, otherwise a new object is built on every access.
+
+    Parameters
+    ----------
+    kind : string
+        The type of object built by the property, such as 'schedule'.
+    attributes : tuple
+        The names of the instance's attributes which identify the object,
+        such as '_abbreviation' and '_year'.
+
+    Returns
+    -------
+    function
+        A decorator which memoizes the property's function.
+    """
+    def decorator(function):
+        @wraps(function)
+        def wrapper(self):
+            memo = getattr(self, '_memo', None)
+            if memo is None:
+                memo = self._memo = {}
+            if kind in memo:
+                return memo[kind]
+            values = tuple(getattr(self, attribute)
+                           for attribute in attributes)
+            if not all(value is not None and KEY_PATTERN.match(str(value))
+                       for value in values):
+                return function(self)
+            cache = _object_cache
+            key = None
+            if cache is not None:
+                league = type(self).__module__.split('.')[1]
+                key = (league, kind) + tuple(str(value) for value in values)
+                value = cache.get(key)
+                if value is not None:
+                    memo[kind] = value
+                    return value
+            value = function(self)
+            memo[kind] = value
+            if key is not None:
+                cache.set(key, value)
+            return value
+        return wrapper
+    return decorator
+
+
+def memoized_value(instance, kind):
+    """
+    Return an object previously memoized by an instance without building it.
+
+    Parameters
+    ----------
+    instance : object
+        The instance which may have memoized the object, such as a Game.
+    kind : string
+        The type of object to return, such as 'boxscore'.
+
+    Returns
+    -------
+    object
+        The memoized object, or None if the instance hasn't memoized it.
+    """
+    memo = getattr(instance, '_memo', None)
+    if not memo:
+        return None
+    return memo.get(kind)
+
+
+def forget(instance, kind=None):
+    """
+    Discard the objects memoized by an instance so they're built again the
+    next time they're requested.
+
+    Objects shared through the object cache aren't removed from the cache.
+    Use ``ObjectCache.invalidate`` to remove them.
+
+    Parameters
+    ----------
+    instance : object
+        The instance which memoized the objects, such as a Team.
+    kind : string (optional)
+        The type of object to discard, such as 'schedule'. Every object is
+        discarded if None.
+    """
+    memo = getattr(instance, '_memo', None)
+    if not memo:
+        return
+    if kind is None:
+        memo.clear()
+    else:
+        memo.pop(kind, None)
@@ -1,4 +1,7 @@
-PARSING_SCHEME = {
+from .. import utils
+
+
+PARSING_SCHEME = utils.CompiledScheme({
     'name': 'a',
     'league': 'td[data-stat="lg_ID"]:first',
     'games': 'td[data-stat="G"]:first',
@@ -82,9 +85,116 @@ PARSING_SCHEME = {
     'strikeouts_per_base_on_balls':
     'td[data-stat="strikeouts_per_base_on_balls"]:first',
     'opposing_runners_left_on_base': 'td[data-stat="LOB"]:first'
+})
+
+# The Arrow type of every column exported from the Team class.
+TEAM_TYPES = {
+    'abbreviation': 'string',
+    'at_bats': 'int64',
+    'average_batter_age': 'float64',
+    'average_pitcher_age': 'float64',
+    'away_losses': 'int64',
+    'away_record': 'string',
+    'away_wins': 'int64',
+    'balks': 'int64',
+    'bases_on_balls': 'int64',
+    'bases_on_walks_given': 'int64',
+    'bases_on_walks_given_per_nine_innings': 'float64',
+    'batters_faced': 'int64',
+    'batting_average': 'float64',
+    'complete_game_shutouts': 'int64',
+    'complete_games': 'int64',
+    'doubles': 'int64',
+    'earned_runs_against': 'float64',
+    'earned_runs_against_plus': 'int64',
+    'extra_inning_losses': 'int64',
+    'extra_inning_record': 'string',
+    'extra_inning_wins': 'int64',
+    'fielding_independent_pitching': 'float64',
+    'games': 'int64',
+    'games_finished': 'int64',
+    'grounded_into_double_plays': 'int64',
+    'hit_pitcher': 'int64',
+    'hits': 'int64',
+    'hits_allowed': 'int64',
+    'hits_per_nine_innings': 'float64',
+    'home_losses': 'int64',
+    'home_record': 'string',
+    'home_runs': 'int64',
+    'home_runs_against': 'int64',
+    'home_runs_per_nine_innings': 'float64',
+    'home_wins': 'int64',
+    'innings_pitched': 'float64',
+    'intentional_bases_on_balls': 'int64',
+    'interleague_record': 'string',
+    'last_ten_games_record': 'string',
+    'last_thirty_games_record': 'string',
+    'last_twenty_games_record': 'string',
+    'league': 'string',
+    'losses': 'int64',
+    'losses_last_ten_games': 'int64',
+    'losses_last_thirty_games': 'int64',
+    'losses_last_twenty_games': 'int64',
+    'losses_vs_left_handed_pitchers': 'int64',
+    'losses_vs_right_handed_pitchers': 'int64',
+    'losses_vs_teams_over_500': 'int64',
+    'losses_vs_teams_under_500': 'int64',
+    'luck': 'int64',
+    'name': 'string',
+    'number_of_pitchers': 'int64',
+    'number_players_used': 'int64',
+    'on_base_percentage': 'float64',
+    'on_base_plus_slugging_percentage': 'float64',
+    'on_base_plus_slugging_percentage_plus': 'int64',
+    'opposing_runners_left_on_base': 'int64',
+    'plate_appearances': 'int64',
+    'pythagorean_win_loss': 'string',
+    'rank': 'int64',
+    'record_vs_left_handed_pitchers': 'string',
+    'record_vs_right_handed_pitchers': 'string',
+    'record_vs_teams_over_500': 'string',
+    'record_vs_teams_under_500': 'string',
+    'run_difference': 'float64',
+    'runners_left_on_base': 'int64',
+    'runs': 'float64',
+    'runs_against': 'float64',
+    'runs_allowed_per_game': 'float64',
+    'runs_batted_in': 'int64',
+    'sacrifice_flies': 'int64',
+    'sacrifice_hits': 'int64',
+    'saves': 'int64',
+    'shutouts': 'int64',
+    'simple_rating_system': 'float64',
+    'single_run_losses': 'int64',
+    'single_run_record': 'string',
+    'single_run_wins': 'int64',
+    'slugging_percentage': 'float64',
+    'stolen_bases': 'int64',
+    'streak': 'string',
+    'strength_of_schedule': 'float64',
+    'strikeouts': 'int64',
+    'strikeouts_per_base_on_balls': 'float64',
+    'strikeouts_per_nine_innings': 'float64',
+    'times_caught_stealing': 'int64',
+    'times_hit_by_pitch': 'int64',
+    'times_struck_out': 'int64',
+    'total_bases': 'int64',
+    'total_runs': 'int64',
+    'triples': 'int64',
+    'whip': 'float64',
+    'wild_pitches': 'int64',
+    'win_percentage': 'float64',
+    'wins': 'int64',
+    'wins_last_ten_games': 'int64',
+    'wins_last_thirty_games': 'int64',
+    'wins_last_twenty_games': 'int64',
+    'wins_vs_left_handed_pitchers': 'int64',
+    'wins_vs_right_handed_pitchers': 'int64',
+    'wins_vs_teams_over_500': 'int64',
+    'wins_vs_teams_under_500': 'int64'
 }
 
-SCHEDULE_SCHEME = {
+SCHEDULE_SCHEME = utils.CompiledScheme({
     'game': 'th[data-stat="team_game"]:first',
     'date': 'td[data-stat="date_game"]:first',
     'location': 'td[data-stat="homeORvis"]:first',
@@ -103,6 +213,31 @@ SCHEDULE_SCHEME = {
     'day_or_night': 'td[data-stat="day_or_night"]:first',
     'attendance': 'td[data-stat="attendance"]:first',
     'streak': 'td[data-stat="win_loss_streak"]:first'
+})
+
+# The Arrow type of every column exported from the Game class.
+SCHEDULE_TYPES = {
+    'attendance': 'int64',
+    'boxscore_index': 'string',
+    'date': 'string',
+    'datetime': 'timestamp',
+    'day_or_night': 'string',
+    'game': 'int64',
+    'game_duration': 'string',
+    'game_number_for_day': 'int64',
+    'games_behind': 'float64',
+    'innings': 'int64',
+    'location': 'string',
+    'loser': 'string',
+    'opponent_abbr': 'string',
+    'rank': 'int64',
+    'record': 'string',
+    'result': 'string',
+    'runs_allowed': 'int64',
+    'runs_scored': 'int64',
+    'save': 'string',
+    'streak': 'string',
+    'winner': 'string'
 }
 
 ELEMENT_INDEX = {
@@ -114,7 +249,7 @@ ELEMENT_INDEX = {
     'opposing_runners_left_on_base': 1
 }
 
-BOXSCORE_SCHEME = {
+BOXSCORE_SCHEME = utils.CompiledScheme({
     'date': 'div[class="scorebox_meta"]',
     'time': 'div[class="scorebox_meta"]',
     'attendance': 'div[class="scorebox_meta"]',
@@ -203,6 +338,92 @@ BOXSCORE_SCHEME = {
     'home_win_probability_by_pitcher': 'tfoot td[data-stat="wpa_def"]',
     'home_average_leverage_index': 'tfoot td[data-stat="leverage_index_avg"]',
     'home_base_out_runs_saved': 'tfoot td[data-stat="re24_def"]'
+})
+
+# The Arrow type of every column exported from the Boxscore class.
+BOXSCORE_TYPES = {
+    'attendance': 'int64',
+    'away_assists': 'int64',
+    'away_at_bats': 'int64',
+    'away_average_leverage_index': 'float64',
+    'away_base_out_runs_added': 'float64',
+    'away_base_out_runs_saved': 'float64',
+    'away_bases_on_balls': 'int64',
+    'away_batting_average': 'float64',
+    'away_earned_runs': 'float64',
+    'away_fly_balls': 'int64',
+    'away_game_score': 'int64',
+    'away_grounded_balls': 'int64',
+    'away_hits': 'int64',
+    'away_home_runs': 'int64',
+    'away_inherited_runners': 'int64',
+    'away_inherited_score': 'int64',
+    'away_innings_pitched': 'float64',
+    'away_line_drives': 'int64',
+    'away_on_base_percentage': 'float64',
+    'away_on_base_plus': 'float64',
+    'away_pitches': 'int64',
+    'away_plate_appearances': 'int64',
+    'away_putouts': 'int64',
+    'away_rbi': 'int64',
+    'away_runs': 'int64',
+    'away_slugging_percentage': 'float64',
+    'away_strikeouts': 'int64',
+    'away_strikes': 'int64',
+    'away_strikes_by_contact': 'int64',
+    'away_strikes_looking': 'int64',
+    'away_strikes_swinging': 'int64',
+    'away_unknown_bat_type': 'int64',
+    'away_win_probability_added': 'float64',
+    'away_win_probability_by_pitcher': 'float64',
+    'away_win_probability_for_offensive_player': 'float64',
+    'away_win_probability_subtracted': 'float64',
+    'boxscore': 'string',
+    'date': 'string',
+    'duration': 'string',
+    'home_assists': 'int64',
+    'home_at_bats': 'int64',
+    'home_average_leverage_index': 'float64',
+    'home_base_out_runs_added': 'float64',
+    'home_base_out_runs_saved': 'float64',
+    'home_bases_on_balls': 'int64',
+    'home_batting_average': 'float64',
+    'home_earned_runs': 'float64',
+    'home_fly_balls': 'int64',
+    'home_game_score': 'int64',
+    'home_grounded_balls': 'int64',
+    'home_hits': 'int64',
+    'home_home_runs': 'int64',
+    'home_inherited_runners': 'int64',
+    'home_inherited_score': 'int64',
+    'home_innings_pitched': 'float64',
+    'home_line_drives': 'int64',
+    'home_on_base_percentage': 'float64',
+    'home_on_base_plus': 'float64',
+    'home_pitches': 'int64',
+    'home_plate_appearances': 'int64',
+    'home_putouts': 'int64',
+    'home_rbi': 'int64',
+    'home_runs': 'int64',
+    'home_slugging_percentage': 'float64',
+    'home_strikeouts': 'int64',
+    'home_strikes': 'int64',
+    'home_strikes_by_contact': 'int64',
+    'home_strikes_looking': 'int64',
+    'home_strikes_swinging': 'int64',
+    'home_unknown_bat_type': 'int64',
+    'home_win_probability_added': 'float64',
+    'home_win_probability_by_pitcher': 'float64',
+    'home_win_probability_for_offensive_player': 'float64',
+    'home_win_probability_subtracted': 'float64',
+    'losing_abbr': 'string',
+    'losing_name': 'string',
+    'time': 'string',
+    'time_of_day': 'string',
+    'venue': 'string',
+    'winner': 'string',
+    'winning_abbr': 'string',
+    'winning_name': 'string'
 }
 
 BOXSCORE_ELEMENT_INDEX = {
@@ -5,8 +5,7 @@ from .constants import (DAY,
                         SCHEDULE_SCHEME,
                         SCHEDULE_URL)
 from datetime import datetime
-from pyquery import PyQuery as pq
-from sportsreference import utils
+from sportsreference import export, fetch, instrument, memo, utils
 from sportsreference.constants import (WIN,
                                        LOSS,
                                        HOME,
@@ -17,7 +16,7 @@ from sportsreference.constants import (WIN,
 from sportsreference.mlb.boxscore import Boxscore
 
 
-class Game(object):
+class Game(memo.Memoized):
     """
     A representation of a matchup between two teams.
 
@@ -31,6 +30,9 @@ class Game(object):
     year : string
         The year of the current season.
     """
+    __slots__ = utils._slots(SCHEDULE_SCHEME,
+                             include=['datetime', 'boxscore', 'year'])
+
     def __init__(self, game_data, year):
         self._game = None
         self._date = None
@@ -91,7 +93,7 @@ class Game(object):
         game_data : string
             A string containing all of the rows of stats for a given game.
         """
-        for field in self.__dict__:
+        for field in self.__slots__:
             # Remove the leading '_' from the name
             short_name = str(field)[1:]
             if short_name == 'datetime' or \
@@ -104,6 +106,7 @@ class Game(object):
             setattr(self, field, value)
 
     @property
+    @instrument.timed('build')
     def dataframe(self):
         """
         Returns a pandas DataFrame containing all other class properties and
@@ -138,18 +141,25 @@ class Game(object):
         return pd.DataFrame([fields_to_include], index=[self._boxscore])
 
     @property
+    @instrument.timed('build')
     def dataframe_extended(self):
         """
         Returns a pandas DataFrame representing the Boxscore class for the
         game. This property provides much richer context for the selected game,
         but takes longer to process compared to the lighter 'dataframe'
-        property. The index for the DataFrame is the boxscore string.
+        property. The index for the DataFrame is the boxscore string. The
+        boxscore isn't kept on the game unless it was already requested with
+        the 'boxscore' property, so the boxscores of a whole schedule aren't
+        kept in memory.
         """
         # If both the runs scored and allowed are None, the game hasn't been
         # played yet, and the DataFrame should be None.
         if self._runs_allowed is None and self._runs_scored is None:
             return None
-        return self.boxscore.dataframe
+        boxscore = memo.memoized_value(self, 'boxscore')
+        if boxscore is None:
+            boxscore = Boxscore(self._boxscore)
+        return boxscore.dataframe
 
     @property
     def game(self):
@@ -192,6 +202,7 @@ class Game(object):
         return int(game_number[0])
 
     @property
+    @memo.memoized('boxscore', '_boxscore')
     def boxscore(self):
         """
         Returns an instance of the Boxscore class containing more detailed
@@ -199,6 +210,14 @@ class Game(object):
         """
         return Boxscore(self._boxscore)
 
+    @property
+    def boxscore_index(self):
+        """
+        Returns a ``string`` of the URI for the game's boxscore, such as
+        'BOS/BOS201806070'.
+        """
+        return self._boxscore
+
     @property
     def location(self):
         """
@@ -448,7 +467,7 @@ class Schedule(object):
         """
         if not year:
             year = utils._find_year_for_season('mlb')
-        doc = pq(SCHEDULE_URL % (abbreviation, year))
+        doc = fetch.get_page(SCHEDULE_URL % (abbreviation, year))
         schedule = utils._get_stats_table(doc, 'table#team_schedule')
 
         for item in schedule:
@@ -458,6 +477,7 @@ class Schedule(object):
             self._games.append(game)
 
     @property
+    @instrument.timed('build')
     def dataframe(self):
         """
         Returns a pandas DataFrame where each row is a representation of the
@@ -474,6 +494,7 @@ class Schedule(object):
         return pd.concat(frames)
 
     @property
+    @instrument.timed('build')
     def dataframe_extended(self):
         """
         Returns a pandas DataFrame where each row is a representation of the
@@ -486,3 +507,48 @@ class Schedule(object):
         for game in self.__iter__():
             frames.append(game.dataframe_extended)
         return pd.concat(frames)
+
+    def concurrent_dataframe_extended(self, workers=fetch.DEFAULT_WORKERS):
+        """
+        Returns a pandas DataFrame where each row is a representation of the
+        Boxscore class for every game in the schedule, identical to the
+        'dataframe_extended' property. The boxscores are downloaded and parsed
+        by a pool of worker threads, so the total time scales with the number
+        of workers instead of the number of games.
+
+        Parameters
+        ----------
+        workers : int (optional)
+            The maximum number of boxscores to download simultaneously.
+        """
+        frames = fetch.map_concurrent(lambda game: game.dataframe_extended,
+                                      self._games,
+                                      workers)
+        return pd.concat(frames)
+
+    def to_arrow(self):
+        """
+        Returns a ``pyarrow Table`` where each row is a representation of the
+        Game class, typed by the schema declared in the league's constants.
+        Requires pyarrow.
+        """
+        return export.to_arrow(self.__iter__())
+
+    def to_parquet(self, path, batch_size=export.DEFAULT_BATCH_SIZE):
+        """
+        Write every row of the 'to_arrow' table to a Parquet file. Games which
+        haven't been played yet are excluded. Requires pyarrow.
+
+        Parameters
+        ----------
+        path : string
+            The path of the Parquet file to create.
+        batch_size : int (optional)
+            The number of rows to write in each row group.
+
+        Returns
+        -------
+        int
+            The number of rows written.
+        """
+        return export.to_parquet(path, self.__iter__(), batch_size)
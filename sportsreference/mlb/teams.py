@@ -4,12 +4,11 @@ from .constants import (ELEMENT_INDEX,
                         PARSING_SCHEME,
                         STANDINGS_URL,
                         TEAM_STATS_URL)
-from pyquery import PyQuery as pq
-from .. import utils
+from .. import export, instrument, memo, utils
 from .schedule import Schedule
 
 
-class Team:
+class Team(memo.Memoized):
     """
     An object containing all of a team's season information.
 
@@ -29,6 +28,9 @@ class Team:
     year : string (optional)
         The requested year to pull stats from.
     """
+    __slots__ = utils._slots(PARSING_SCHEME,
+                             include=['year', 'rank', 'abbreviation'])
+
     def __init__(self, team_data, rank, year=None):
         self._year = year
         self._rank = rank
@@ -157,7 +159,7 @@ class Team:
             multiple tables are being referenced, this will be comprised of
             multiple rows in a single string.
         """
-        for field in self.__dict__:
+        for field in self.__slots__:
             # The short field truncates the leading '_' in the attribute name.
             short_field = str(field)[1:]
             # The rank attribute is passed directly to the class during
@@ -181,14 +183,12 @@ class Team:
                                        index)
             setattr(self, field, value)
 
-    @property
-    def dataframe(self):
+    def _dataframe_fields(self):
         """
-        Returns a pandas DataFrame containing all other class properties and
-        values. The index for the DataFrame is the string abbreviation of the
-        team, such as 'HOU'.
+        Returns a dictionary of every value included in the DataFrame, where
+        each key is the name of a column.
         """
-        fields_to_include = {
+        return {
             'abbreviation': self.abbreviation,
             'at_bats': self.at_bats,
             'average_batter_age': self.average_batter_age,
@@ -303,7 +303,17 @@ class Team:
             'wins_vs_teams_over_500': self.wins_vs_teams_over_500,
             'wins_vs_teams_under_500': self.wins_vs_teams_under_500
         }
-        return pd.DataFrame([fields_to_include], index=[self._abbreviation])
+
+    @property
+    @instrument.timed('build')
+    def dataframe(self):
+        """
+        Returns a pandas DataFrame containing all other class properties and
+        values. The index for the DataFrame is the string abbreviation of the
+        team, such as 'HOU'.
+        """
+        return pd.DataFrame([self._dataframe_fields()],
+                            index=[self._abbreviation])
 
     @property
     def rank(self):
@@ -321,6 +331,7 @@ class Team:
         return self._abbreviation
 
     @property
+    @memo.memoized('schedule', '_abbreviation', '_year')
     def schedule(self):
         """
         Returns an instance of the Schedule class containing the team's
@@ -1269,14 +1280,13 @@ class Teams:
 
         if not year:
             year = utils._find_year_for_season('mlb')
-        doc = pq(STANDINGS_URL % year)
-        div_prefix = 'div#all_expanded_standings_overall'
-        standings = utils._get_stats_table(doc, div_prefix)
-        doc = pq(TEAM_STATS_URL % year)
         div_prefix = 'div#all_teams_standard_%s'
-        batting_stats = utils._get_stats_table(doc, div_prefix % 'batting')
-        pitching_stats = utils._get_stats_table(doc, div_prefix % 'pitching')
-        for stats_list in [standings, batting_stats, pitching_stats]:
+        stats_lists = utils._pull_stats_tables([
+            (STANDINGS_URL % year, ['div#all_expanded_standings_overall']),
+            (TEAM_STATS_URL % year, [div_prefix % 'batting',
+                                     div_prefix % 'pitching'])
+        ])
+        for stats_list in stats_lists:
             team_data_dict = self._add_stats_data(stats_list, team_data_dict)
 
         for team_data in team_data_dict.values():
@@ -1284,12 +1294,42 @@ class Teams:
             self._teams.append(team)
 
     @property
+    @instrument.timed('build')
     def dataframes(self):
         """
         Returns a pandas DataFrame where each row is a representation of the
         Team class. Rows are indexed by the team abbreviation.
         """
-        frames = []
+        rows = []
+        index = []
         for team in self.__iter__():
-            frames.append(team.dataframe)
-        return pd.concat(frames)
+            rows.append(team._dataframe_fields())
+            index.append(team._abbreviation)
+        return utils._dataframe_from_rows(rows, index)
+
+    def to_arrow(self):
+        """
+        Returns a ``pyarrow Table`` where each row is a representation of the
+        Team class, typed by the schema declared in the league's constants.
+        Requires pyarrow.
+        """
+        return export.to_arrow(self.__iter__())
+
+    def to_parquet(self, path, batch_size=export.DEFAULT_BATCH_SIZE):
+        """
+        Write every row of the 'to_arrow' table to a Parquet file. Requires
+        pyarrow.
+
+        Parameters
+        ----------
+        path : string
+            The path of the Parquet file to create.
+        batch_size : int (optional)
+            The number of rows to write in each row group.
+
+        Returns
+        -------
+        int
+            The number of rows written.
+        """
+        return export.to_parquet(path, self.__iter__(), batch_size)
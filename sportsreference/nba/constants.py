@@ -1,4 +1,7 @@
-PARSING_SCHEME = {
+from .. import utils
+
+
+PARSING_SCHEME = utils.CompiledScheme({
     'name': 'a',
     'games_played': 'td[data-stat="g"]:first',
     'minutes_played': 'td[data-stat="mp"]:first',
@@ -46,9 +49,60 @@ PARSING_SCHEME = {
     'opp_turnovers': 'td[data-stat="opp_tov"]:first',
     'opp_personal_fouls': 'td[data-stat="opp_pf"]:first',
     'opp_points': 'td[data-stat="opp_pts"]:first'
+})
+
+# The Arrow type of every column exported from the Team class.
+TEAM_TYPES = {
+    'abbreviation': 'string',
+    'assists': 'int64',
+    'blocks': 'int64',
+    'defensive_rebounds': 'int64',
+    'field_goal_attempts': 'int64',
+    'field_goal_percentage': 'float64',
+    'field_goals': 'int64',
+    'free_throw_attempts': 'int64',
+    'free_throw_percentage': 'float64',
+    'free_throws': 'int64',
+    'games_played': 'int64',
+    'minutes_played': 'int64',
+    'name': 'string',
+    'offensive_rebounds': 'int64',
+    'opp_assists': 'int64',
+    'opp_blocks': 'int64',
+    'opp_defensive_rebounds': 'int64',
+    'opp_field_goal_attempts': 'int64',
+    'opp_field_goal_percentage': 'float64',
+    'opp_field_goals': 'int64',
+    'opp_free_throw_attempts': 'int64',
+    'opp_free_throw_percentage': 'float64',
+    'opp_free_throws': 'int64',
+    'opp_offensive_rebounds': 'int64',
+    'opp_personal_fouls': 'int64',
+    'opp_points': 'int64',
+    'opp_steals': 'int64',
+    'opp_three_point_field_goal_attempts': 'int64',
+    'opp_three_point_field_goal_percentage': 'float64',
+    'opp_three_point_field_goals': 'int64',
+    'opp_total_rebounds': 'int64',
+    'opp_turnovers': 'int64',
+    'opp_two_point_field_goal_attempts': 'int64',
+    'opp_two_point_field_goal_percentage': 'float64',
+    'opp_two_point_field_goals': 'int64',
+    'personal_fouls': 'int64',
+    'points': 'int64',
+    'rank': 'int64',
+    'steals': 'int64',
+    'three_point_field_goal_attempts': 'int64',
+    'three_point_field_goal_percentage': 'float64',
+    'three_point_field_goals': 'int64',
+    'total_rebounds': 'int64',
+    'turnovers': 'int64',
+    'two_point_field_goal_attempts': 'int64',
+    'two_point_field_goal_percentage': 'float64',
+    'two_point_field_goals': 'int64'
 }
 
-SCHEDULE_SCHEME = {
+SCHEDULE_SCHEME = utils.CompiledScheme({
     'game': 'th[data-stat="ranker"]:first',
     'date': 'td[data-stat="date_game"]:first',
     'location': 'td[data-stat="game_location"]:first',
@@ -89,9 +143,54 @@ SCHEDULE_SCHEME = {
     'opp_blocks': 'td[data-stat="opp_blk"]:first',
     'opp_turnovers': 'td[data-stat="opp_tov"]:first',
     'opp_personal_fouls': 'td[data-stat="opp_pf"]:first'
+})
+
+# The Arrow type of every column exported from the Game class.
+SCHEDULE_TYPES = {
+    'assists': 'int64',
+    'blocks': 'int64',
+    'boxscore_index': 'string',
+    'date': 'string',
+    'datetime': 'timestamp',
+    'field_goal_attempts': 'int64',
+    'field_goal_percentage': 'float64',
+    'field_goals': 'int64',
+    'free_throw_attempts': 'int64',
+    'free_throw_percentage': 'float64',
+    'free_throws': 'int64',
+    'game': 'int64',
+    'location': 'string',
+    'offensive_rebounds': 'int64',
+    'opp_assists': 'int64',
+    'opp_blocks': 'int64',
+    'opp_field_goal_attempts': 'int64',
+    'opp_field_goal_percentage': 'float64',
+    'opp_field_goals': 'int64',
+    'opp_free_throw_attempts': 'int64',
+    'opp_free_throw_percentage': 'float64',
+    'opp_free_throws': 'int64',
+    'opp_offensive_rebounds': 'int64',
+    'opp_personal_fouls': 'int64',
+    'opp_steals': 'int64',
+    'opp_three_point_field_goal_attempts': 'int64',
+    'opp_three_point_field_goal_percentage': 'float64',
+    'opp_three_point_field_goals': 'int64',
+    'opp_total_rebounds': 'int64',
+    'opp_turnovers': 'int64',
+    'opponent_abbr': 'string',
+    'personal_fouls': 'int64',
+    'points_allowed': 'int64',
+    'points_scored': 'int64',
+    'result': 'string',
+    'steals': 'int64',
+    'three_point_field_goal_attempts': 'int64',
+    'three_point_field_goal_percentage': 'float64',
+    'three_point_field_goals': 'int64',
+    'total_rebounds': 'int64',
+    'turnovers': 'int64'
 }
 
-BOXSCORE_SCHEME = {
+BOXSCORE_SCHEME = utils.CompiledScheme({
     'date': 'div[class="scorebox_meta"]',
     'location': 'div[class="scorebox_meta"]',
     'away_name': 'a[itemprop="name"]:first',
@@ -173,6 +272,93 @@ BOXSCORE_SCHEME = {
     'home_turnover_percentage': 'tfoot td[data-stat="tov_pct"]',
     'home_offensive_rating': 'tfoot td[data-stat="off_rtg"]',
     'home_defensive_rating': 'tfoot td[data-stat="def_rtg"]'
+})
+
+# The Arrow type of every column exported from the Boxscore class.
+BOXSCORE_TYPES = {
+    'away_assist_percentage': 'float64',
+    'away_assists': 'int64',
+    'away_block_percentage': 'float64',
+    'away_blocks': 'int64',
+    'away_defensive_rating': 'float64',
+    'away_defensive_rebound_percentage': 'float64',
+    'away_defensive_rebounds': 'int64',
+    'away_effective_field_goal_percentage': 'float64',
+    'away_field_goal_attempts': 'int64',
+    'away_field_goal_percentage': 'float64',
+    'away_field_goals': 'int64',
+    'away_free_throw_attempt_rate': 'float64',
+    'away_free_throw_attempts': 'int64',
+    'away_free_throw_percentage': 'float64',
+    'away_free_throws': 'int64',
+    'away_losses': 'int64',
+    'away_minutes_played': 'int64',
+    'away_offensive_rating': 'float64',
+    'away_offensive_rebound_percentage': 'float64',
+    'away_offensive_rebounds': 'int64',
+    'away_personal_fouls': 'int64',
+    'away_points': 'int64',
+    'away_steal_percentage': 'float64',
+    'away_steals': 'int64',
+    'away_three_point_attempt_rate': 'float64',
+    'away_three_point_field_goal_attempts': 'int64',
+    'away_three_point_field_goal_percentage': 'float64',
+    'away_three_point_field_goals': 'int64',
+    'away_total_rebound_percentage': 'float64',
+    'away_total_rebounds': 'int64',
+    'away_true_shooting_percentage': 'float64',
+    'away_turnover_percentage': 'float64',
+    'away_turnovers': 'int64',
+    'away_two_point_field_goal_attempts': 'int64',
+    'away_two_point_field_goal_percentage': 'float64',
+    'away_two_point_field_goals': 'int64',
+    'away_wins': 'int64',
+    'boxscore': 'string',
+    'date': 'string',
+    'home_assist_percentage': 'float64',
+    'home_assists': 'int64',
+    'home_block_percentage': 'float64',
+    'home_blocks': 'int64',
+    'home_defensive_rating': 'float64',
+    'home_defensive_rebound_percentage': 'float64',
+    'home_defensive_rebounds': 'int64',
+    'home_effective_field_goal_percentage': 'float64',
+    'home_field_goal_attempts': 'int64',
+    'home_field_goal_percentage': 'float64',
+    'home_field_goals': 'int64',
+    'home_free_throw_attempt_rate': 'float64',
+    'home_free_throw_attempts': 'int64',
+    'home_free_throw_percentage': 'float64',
+    'home_free_throws': 'int64',
+    'home_losses': 'int64',
+    'home_minutes_played': 'int64',
+    'home_offensive_rating': 'float64',
+    'home_offensive_rebound_percentage': 'float64',
+    'home_offensive_rebounds': 'int64',
+    'home_personal_fouls': 'int64',
+    'home_points': 'int64',
+    'home_steal_percentage': 'float64',
+    'home_steals': 'int64',
+    'home_three_point_attempt_rate': 'float64',
+    'home_three_point_field_goal_attempts': 'int64',
+    'home_three_point_field_goal_percentage': 'float64',
+    'home_three_point_field_goals': 'int64',
+    'home_total_rebound_percentage': 'float64',
+    'home_total_rebounds': 'int64',
+    'home_true_shooting_percentage': 'float64',
+    'home_turnover_percentage': 'float64',
+    'home_turnovers': 'int64',
+    'home_two_point_field_goal_attempts': 'int64',
+    'home_two_point_field_goal_percentage': 'float64',
+    'home_two_point_field_goals': 'int64',
+    'home_wins': 'int64',
+    'location': 'string',
+    'losing_abbr': 'string',
+    'losing_name': 'string',
+    'pace': 'float64',
+    'winner': 'string',
+    'winning_abbr': 'string',
+    'winning_name': 'string'
 }
 
 BOXSCORE_ELEMENT_INDEX = {
@@ -216,7 +402,7 @@ BOXSCORE_ELEMENT_INDEX = {
     'home_defensive_rating': 1
 }
 
-PLAYER_SCHEME = {
+PLAYER_SCHEME = utils.CompiledScheme({
     'season': 'th[data-stat="season"]:first',
     'name': 'h1',
     'team_abbreviation': 'td[data-stat="team_id"]',
@@ -313,6 +499,172 @@ PLAYER_SCHEME = {
     'and_ones': 'td[data-stat="and1s"]',
     'shots_blocked': 'td[data-stat="fga_blkd"]',
     'salary': 'td[data-stat="salary"]'
+})
+
+# The Arrow type of every column exported from the Player class.
+PLAYER_TYPES = {
+    'and_ones': 'int64',
+    'assist_percentage': 'float64',
+    'assists': 'int64',
+    'birth_date': 'timestamp',
+    'block_percentage': 'float64',
+    'blocking_fouls': 'int64',
+    'blocks': 'int64',
+    'box_plus_minus': 'float64',
+    'center_percentage': 'int64',
+    'contract': 'string',
+    'defensive_box_plus_minus': 'float64',
+    'defensive_rebound_percentage': 'float64',
+    'defensive_rebounds': 'int64',
+    'defensive_win_shares': 'float64',
+    'dunks': 'int64',
+    'effective_field_goal_percentage': 'float64',
+    'field_goal_attempts': 'int64',
+    'field_goal_perc_sixteen_foot_plus_two_pointers': 'float64',
+    'field_goal_perc_ten_to_sixteen_feet': 'float64',
+    'field_goal_perc_three_to_ten_feet': 'float64',
+    'field_goal_perc_zero_to_three_feet': 'float64',
+    'field_goal_percentage': 'float64',
+    'field_goals': 'int64',
+    'free_throw_attempt_rate': 'float64',
+    'free_throw_attempts': 'int64',
+    'free_throw_percentage': 'float64',
+    'free_throws': 'int64',
+    'games_played': 'int64',
+    'games_started': 'int64',
+    'half_court_heaves': 'int64',
+    'half_court_heaves_made': 'int64',
+    'height': 'string',
+    'lost_ball_turnovers': 'int64',
+    'minutes_played': 'int64',
+    'name': 'string',
+    'nationality': 'string',
+    'net_plus_minus': 'float64',
+    'offensive_box_plus_minus': 'float64',
+    'offensive_fouls': 'int64',
+    'offensive_rebound_percentage': 'float64',
+    'offensive_rebounds': 'int64',
+    'offensive_win_shares': 'float64',
+    'on_court_plus_minus': 'float64',
+    'other_turnovers': 'int64',
+    'passing_turnovers': 'int64',
+    'percentage_field_goals_as_dunks': 'float64',
+    'percentage_of_three_pointers_from_corner': 'float64',
+    'percentage_shots_three_pointers': 'float64',
+    'percentage_shots_two_pointers': 'float64',
+    'percentage_sixteen_foot_plus_two_pointers': 'float64',
+    'percentage_ten_to_sixteen_footers': 'float64',
+    'percentage_three_to_ten_footers': 'float64',
+    'percentage_zero_to_three_footers': 'float64',
+    'personal_fouls': 'int64',
+    'player_efficiency_rating': 'float64',
+    'player_id': 'string',
+    'point_guard_percentage': 'int64',
+    'points': 'int64',
+    'points_generated_by_assists': 'int64',
+    'position': 'string',
+    'power_forward_percentage': 'int64',
+    'salary': 'int64',
+    'season': 'string',
+    'shooting_distance': 'float64',
+    'shooting_fouls': 'int64',
+    'shooting_fouls_drawn': 'int64',
+    'shooting_guard_percentage': 'int64',
+    'shots_blocked': 'int64',
+    'small_forward_percentage': 'int64',
+    'steal_percentage': 'float64',
+    'steals': 'int64',
+    'take_fouls': 'int64',
+    'team_abbreviation': 'string',
+    'three_point_attempt_rate': 'float64',
+    'three_point_attempts': 'int64',
+    'three_point_percentage': 'float64',
+    'three_point_shot_percentage_from_corner': 'float64',
+    'three_pointers': 'int64',
+    'three_pointers_assisted_percentage': 'float64',
+    'total_rebound_percentage': 'float64',
+    'total_rebounds': 'int64',
+    'true_shooting_percentage': 'float64',
+    'turnover_percentage': 'float64',
+    'turnovers': 'int64',
+    'two_point_attempts': 'int64',
+    'two_point_percentage': 'float64',
+    'two_pointers': 'int64',
+    'two_pointers_assisted_percentage': 'float64',
+    'usage_percentage': 'float64',
+    'value_over_replacement_player': 'float64',
+    'weight': 'int64',
+    'win_shares': 'float64',
+    'win_shares_per_48_minutes': 'float64'
+}
+
+# The roster and season totals tables on a team's page, which identify every
+# player with the same 'data-stat' names as the player pages.
+SLIM_PLAYER_SCHEME = utils.CompiledScheme({
+    'name': 'td[data-stat="player"]:first',
+    'position': 'td[data-stat="pos"]',
+    'height': 'td[data-stat="height"]',
+    'weight': 'td[data-stat="weight"]',
+    'games_played': 'td[data-stat="g"]',
+    'games_started': 'td[data-stat="gs"]',
+    'minutes_played': 'td[data-stat="mp"]',
+    'field_goals': 'td[data-stat="fg"]',
+    'field_goal_attempts': 'td[data-stat="fga"]',
+    'field_goal_percentage': 'td[data-stat="fg_pct"]',
+    'three_pointers': 'td[data-stat="fg3"]',
+    'three_point_attempts': 'td[data-stat="fg3a"]',
+    'three_point_percentage': 'td[data-stat="fg3_pct"]',
+    'two_pointers': 'td[data-stat="fg2"]',
+    'two_point_attempts': 'td[data-stat="fg2a"]',
+    'two_point_percentage': 'td[data-stat="fg2_pct"]',
+    'effective_field_goal_percentage': 'td[data-stat="efg_pct"]',
+    'free_throws': 'td[data-stat="ft"]',
+    'free_throw_attempts': 'td[data-stat="fta"]',
+    'free_throw_percentage': 'td[data-stat="ft_pct"]',
+    'offensive_rebounds': 'td[data-stat="orb"]',
+    'defensive_rebounds': 'td[data-stat="drb"]',
+    'total_rebounds': 'td[data-stat="trb"]',
+    'assists': 'td[data-stat="ast"]',
+    'steals': 'td[data-stat="stl"]',
+    'blocks': 'td[data-stat="blk"]',
+    'turnovers': 'td[data-stat="tov"]',
+    'personal_fouls': 'td[data-stat="pf"]',
+    'points': 'td[data-stat="pts"]'
+})
+
+# The Arrow type of every column exported from the SlimPlayer class.
+SLIM_PLAYER_TYPES = {
+    'assists': 'int64',
+    'blocks': 'int64',
+    'defensive_rebounds': 'int64',
+    'effective_field_goal_percentage': 'float64',
+    'field_goal_attempts': 'int64',
+    'field_goal_percentage': 'float64',
+    'field_goals': 'int64',
+    'free_throw_attempts': 'int64',
+    'free_throw_percentage': 'float64',
+    'free_throws': 'int64',
+    'games_played': 'int64',
+    'games_started': 'int64',
+    'height': 'string',
+    'minutes_played': 'int64',
+    'name': 'string',
+    'offensive_rebounds': 'int64',
+    'personal_fouls': 'int64',
+    'player_id': 'string',
+    'points': 'int64',
+    'position': 'string',
+    'steals': 'int64',
+    'three_point_attempts': 'int64',
+    'three_point_percentage': 'float64',
+    'three_pointers': 'int64',
+    'total_rebounds': 'int64',
+    'turnovers': 'int64',
+    'two_point_attempts': 'int64',
+    'two_point_percentage': 'float64',
+    'two_pointers': 'int64',
+    'weight': 'int64',
+    'year': 'string'
 }
 
 NATIONALITY = {
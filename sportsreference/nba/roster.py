@@ -1,9 +1,16 @@
 import pandas as pd
 import re
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
+from functools import wraps
 from pyquery import PyQuery as pq
-from .. import utils
-from .constants import NATIONALITY, PLAYER_SCHEME, PLAYER_URL, ROSTER_URL
+from .. import export, fetch, instrument, utils
+from .constants import (NATIONALITY,
+                        PLAYER_SCHEME,
+                        PLAYER_URL,
+                        ROSTER_URL,
+                        SLIM_PLAYER_SCHEME)
 
 
 def cleanup(prop):
@@ -20,6 +27,7 @@ def cleanup(prop):
 
 def int_property_decorator(func):
     @property
+    @wraps(func)
     def wrapper(*args):
         index = args[0]._index
         prop = func(*args)
@@ -34,6 +42,7 @@ def int_property_decorator(func):
 
 def float_property_decorator(func):
     @property
+    @wraps(func)
     def wrapper(*args):
         index = args[0]._index
         prop = func(*args)
@@ -48,6 +57,7 @@ def float_property_decorator(func):
 
 def most_recent_decorator(func):
     @property
+    @wraps(func)
     def wrapper(*args):
         season = args[0]._most_recent_season
         seasons = args[0]._season
@@ -57,6 +67,32 @@ def most_recent_decorator(func):
     return wrapper
 
 
+def slim_int_property_decorator(func):
+    @property
+    @wraps(func)
+    def wrapper(*args):
+        value = cleanup(func(*args))
+        try:
+            return int(value)
+        except ValueError:
+            # If there is no value, default to 0
+            return 0
+    return wrapper
+
+
+def slim_float_property_decorator(func):
+    @property
+    @wraps(func)
+    def wrapper(*args):
+        value = cleanup(func(*args))
+        try:
+            return float(value)
+        except ValueError:
+            # If there is no value, default to 0.0
+            return 0.0
+    return wrapper
+
+
 class Player(object):
     """
     Get player information and stats for all seasons.
@@ -81,8 +117,12 @@ class Player(object):
         name, 'FF', are the first 2 letters in the player's first name, and
         'NN' is a number starting at '01' for the first time that player ID has
         been used and increments by 1 for every successive player.
+    html : string (optional)
+        The contents of the player's stats page if it has already been
+        downloaded. If None, the page is downloaded when the instance is
+        created.
     """
-    def __init__(self, player_id):
+    def __init__(self, player_id, html=None):
         self._most_recent_season = ''
         self._index = None
         self._player_id = player_id
@@ -179,7 +219,7 @@ class Player(object):
         self._salary = None
         self._contract = None
 
-        self._parse_player_data()
+        self._parse_player_data(html)
         self._find_initial_index()
 
     def _build_url(self):
@@ -199,25 +239,33 @@ class Player(object):
         first_character = self._player_id[0]
         return PLAYER_URL % (first_character, self._player_id)
 
-    def _retrieve_html_page(self):
+    def _retrieve_html_page(self, html=None):
         """
         Download the requested player's stats page.
 
         Download the requested page and strip all of the comment tags before
         returning a pyquery object which will be used to parse the data.
 
+        Parameters
+        ----------
+        html : string (optional)
+            The contents of the player's stats page if it has already been
+            downloaded, in which case the page isn't requested again.
+
         Returns
         -------
         PyQuery object
             The requested page is returned as a queriable PyQuery object with
             the comment tags removed.
         """
+        if html is not None:
+            return utils._uncomment(pq(html))
         url = self._build_url()
         try:
-            url_data = pq(url)
+            url_data = fetch.get_page(url)
         except:
             return None
-        return pq(utils._remove_html_comment_tags(url_data))
+        return utils._uncomment(url_data)
 
     def _parse_season(self, row):
         """
@@ -255,31 +303,28 @@ class Player(object):
         career_stats : generator
             A generator where each element is a row in the footer of a stats
             table. Career stats are kept in the footer, hence the usage.
-        all_stats_dict : dictionary
-            A dictionary of all stats separated by season where each key is the
-            season ``string``, such as '2017-18', and the value is a
-            ``dictionary`` with a ``string`` of 'data' and ``string``
-            containing all of the data.
+        all_stats_dict : OrderedDict
+            An OrderedDict of all stats separated by season where each key is
+            the season ``string``, such as '2017-18', and the value is a
+            ``dictionary`` with a ``string`` of 'data' and a ``list`` of every
+            row element for the season.
 
         Returns
         -------
-        dictionary
+        OrderedDict
             Returns an updated version of the passed all_stats_dict which
-            includes more metrics from the provided table.
+            includes more metrics from the provided table. Seasons are kept in
+            the order they are listed in the tables.
         """
         most_recent_season = ''
         for row in table_rows:
             season = self._parse_season(row)
-            try:
-                all_stats_dict[season]['data'] += str(row)
-            except KeyError:
-                all_stats_dict[season] = {'data': str(row)}
+            all_stats_dict.setdefault(season, {'data': []})['data'] \
+                .extend(row)
             most_recent_season = season
         self._most_recent_season = most_recent_season
-        try:
-            all_stats_dict['career']['data'] += str(next(career_stats))
-        except KeyError:
-            all_stats_dict['career'] = {'data': str(next(career_stats))}
+        all_stats_dict.setdefault('career', {'data': []})['data'] \
+            .extend(next(career_stats))
         return all_stats_dict
 
     def _combine_all_stats(self, player_info):
@@ -298,11 +343,13 @@ class Player(object):
 
         Returns
         -------
-        dictionary
-            Returns a dictionary where all stats from each table are combined
-            by season to allow easy queries by year.
+        OrderedDict
+            Returns an OrderedDict where all stats from each table are combined
+            by season to allow easy queries by year. The rows for each season
+            are kept as a single PyQuery object so every field for the season
+            is served from the same index of its cells.
         """
-        all_stats_dict = {}
+        all_stats_dict = OrderedDict()
 
         for table_id in ['totals', 'advanced', 'shooting', 'advanced_pbp',
                          'all_salaries']:
@@ -314,6 +361,8 @@ class Player(object):
             all_stats_dict = self._combine_season_stats(table_items,
                                                         career_items,
                                                         all_stats_dict)
+        for data in all_stats_dict.values():
+            data['data'] = pq(data['data'])
         return all_stats_dict
 
     def _parse_nationality(self, player_info):
@@ -475,15 +524,21 @@ class Player(object):
                     setattr(self, '_contract', contract)
                     break
 
-    def _parse_player_data(self):
+    def _parse_player_data(self, html=None):
         """
         Parse all player information and set attributes.
 
         Pull the player's HTML stats page and go through each class attribute
         to parse the data from the HTML page and set attribute value with the
         result.
+
+        Parameters
+        ----------
+        html : string (optional)
+            The contents of the player's stats page if it has already been
+            downloaded.
         """
-        player_info = self._retrieve_html_page()
+        player_info = self._retrieve_html_page(html)
         all_stats_dict = self._combine_all_stats(player_info)
 
         for field in self.__dict__:
@@ -506,11 +561,10 @@ class Player(object):
             if short_field == 'contract':
                 self._parse_contract(player_info)
                 continue
-            field_stats = []
-            for year, data in all_stats_dict.items():
-                stats = pq(data['data'])
-                value = utils._parse_field(PLAYER_SCHEME, stats, short_field)
-                field_stats.append(value)
+            field_stats = [utils._parse_field(PLAYER_SCHEME,
+                                              data['data'],
+                                              short_field)
+                           for data in all_stats_dict.values()]
             setattr(self, field, field_stats)
 
     def _find_initial_index(self):
@@ -684,6 +738,7 @@ class Player(object):
         return fields_to_include
 
     @property
+    @instrument.timed('build')
     def dataframe(self):
         """
         Returns a ``pandas DataFrame`` containing all other relevant class
@@ -1461,13 +1516,425 @@ class Player(object):
         return self._contract
 
 
+class SlimPlayer(object):
+    """
+    A lightweight record of a player's season on a team's roster.
+
+    The record is built entirely from the roster and season totals tables on
+    the team's page, so no additional pages need to be downloaded. It includes
+    the player's ID, name, position, height, weight, and season totals. The
+    full Player instance with stats for every season can be loaded on demand
+    with the 'load' method.
+
+    Parameters
+    ----------
+    player_id : string
+        A player's ID according to basketball-reference.com, such as
+        'hardeja01' for James Harden.
+    player_data : PyQuery object
+        A PyQuery object containing the player's row in the roster table and,
+        if the player has played during the season, the player's row in the
+        season totals table.
+    year : string
+        The 4-digit year of the season, such as '2018'.
+    """
+    __slots__ = utils._slots(SLIM_PLAYER_SCHEME,
+                             include=['player_id', 'year'])
+
+    def __init__(self, player_id, player_data, year):
+        self._player_id = player_id
+        self._year = year
+        self._name = None
+        self._position = None
+        self._height = None
+        self._weight = None
+        self._games_played = None
+        self._games_started = None
+        self._minutes_played = None
+        self._field_goals = None
+        self._field_goal_attempts = None
+        self._field_goal_percentage = None
+        self._three_pointers = None
+        self._three_point_attempts = None
+        self._three_point_percentage = None
+        self._two_pointers = None
+        self._two_point_attempts = None
+        self._two_point_percentage = None
+        self._effective_field_goal_percentage = None
+        self._free_throws = None
+        self._free_throw_attempts = None
+        self._free_throw_percentage = None
+        self._offensive_rebounds = None
+        self._defensive_rebounds = None
+        self._total_rebounds = None
+        self._assists = None
+        self._steals = None
+        self._blocks = None
+        self._turnovers = None
+        self._personal_fouls = None
+        self._points = None
+        self._parse_player_data(player_data)
+
+    def _parse_player_data(self, player_data):
+        """
+        Parses a value for every attribute.
+
+        Parameters
+        ----------
+        player_data : PyQuery object
+            A PyQuery object containing the player's rows from the team's
+            page.
+        """
+        for field in self.__slots__:
+            if field == '_player_id' or \
+               field == '_year':
+                continue
+            value = utils._parse_field(SLIM_PLAYER_SCHEME,
+                                       player_data,
+                                       str(field)[1:])
+            setattr(self, field, value)
+
+    def load(self):
+        """
+        Download the player's stats page and return the full Player instance.
+
+        Returns
+        -------
+        Player class instance
+            Returns an instance of the Player class with stats for every
+            season the player has played.
+        """
+        return Player(self._player_id)
+
+    def _dataframe_fields(self):
+        """
+        Returns a dictionary of every value included in the DataFrame, where
+        each key is the name of a column.
+        """
+        return {
+            'assists': self.assists,
+            'blocks': self.blocks,
+            'defensive_rebounds': self.defensive_rebounds,
+            'effective_field_goal_percentage':
+            self.effective_field_goal_percentage,
+            'field_goal_attempts': self.field_goal_attempts,
+            'field_goal_percentage': self.field_goal_percentage,
+            'field_goals': self.field_goals,
+            'free_throw_attempts': self.free_throw_attempts,
+            'free_throw_percentage': self.free_throw_percentage,
+            'free_throws': self.free_throws,
+            'games_played': self.games_played,
+            'games_started': self.games_started,
+            'height': self.height,
+            'minutes_played': self.minutes_played,
+            'name': self.name,
+            'offensive_rebounds': self.offensive_rebounds,
+            'personal_fouls': self.personal_fouls,
+            'player_id': self.player_id,
+            'points': self.points,
+            'position': self.position,
+            'steals': self.steals,
+            'three_point_attempts': self.three_point_attempts,
+            'three_point_percentage': self.three_point_percentage,
+            'three_pointers': self.three_pointers,
+            'total_rebounds': self.total_rebounds,
+            'turnovers': self.turnovers,
+            'two_point_attempts': self.two_point_attempts,
+            'two_point_percentage': self.two_point_percentage,
+            'two_pointers': self.two_pointers,
+            'weight': self.weight,
+            'year': self.year
+        }
+
+    @property
+    @instrument.timed('build')
+    def dataframe(self):
+        """
+        Returns a pandas DataFrame containing all other class properties and
+        values. The index for the DataFrame is the string player ID, such as
+        'hardeja01'.
+        """
+        return pd.DataFrame([self._dataframe_fields()],
+                            index=[self._player_id])
+
+    @property
+    def player_id(self):
+        """
+        Returns a ``string`` of the player's ID on sports-reference, such as
+        'hardeja01' for James Harden.
+        """
+        return self._player_id
+
+    @property
+    def year(self):
+        """
+        Returns a ``string`` of the 4-digit year of the season, such as '2018'.
+        """
+        return self._year
+
+    @property
+    def name(self):
+        """
+        Returns a ``string`` of the players name, such as 'James Harden'.
+        """
+        return self._name
+
+    @property
+    def position(self):
+        """
+        Returns a ``string`` constant of the player's primary position.
+        """
+        return self._position
+
+    @property
+    def height(self):
+        """
+        Returns a ``string`` of the player's height in the format
+        "feet-inches".
+        """
+        return self._height
+
+    @slim_int_property_decorator
+    def weight(self):
+        """
+        Returns an ``int`` of the player's weight in pounds.
+        """
+        return self._weight
+
+    @slim_int_property_decorator
+    def games_played(self):
+        """
+        Returns an ``int`` of the number of games the player participated in.
+        """
+        return self._games_played
+
+    @slim_int_property_decorator
+    def games_started(self):
+        """
+        Returns an ``int`` of the number of games the player started.
+        """
+        return self._games_started
+
+    @slim_int_property_decorator
+    def minutes_played(self):
+        """
+        Returns an ``int`` of the total number of minutes the player played.
+        """
+        return self._minutes_played
+
+    @slim_int_property_decorator
+    def field_goals(self):
+        """
+        Returns an ``int`` of the total number of field goals the player
+        scored.
+        """
+        return self._field_goals
+
+    @slim_int_property_decorator
+    def field_goal_attempts(self):
+        """
+        Returns an ``int`` of the total number of field goals the player
+        attempted during the season.
+        """
+        return self._field_goal_attempts
+
+    @slim_float_property_decorator
+    def field_goal_percentage(self):
+        """
+        Returns a ``float`` of the player's field goal percentage during the
+        season. Percentage ranges from 0-1.
+        """
+        return self._field_goal_percentage
+
+    @slim_int_property_decorator
+    def three_pointers(self):
+        """
+        Returns an ``int`` of the total number of three point field goals the
+        player made.
+        """
+        return self._three_pointers
+
+    @slim_int_property_decorator
+    def three_point_attempts(self):
+        """
+        Returns an ``int`` of the total number of three point field goals the
+        player attempted during the season.
+        """
+        return self._three_point_attempts
+
+    @slim_float_property_decorator
+    def three_point_percentage(self):
+        """
+        Returns a ``float`` of the player's three point field goal percentage
+        during the season. Percentage ranges from 0-1.
+        """
+        return self._three_point_percentage
+
+    @slim_int_property_decorator
+    def two_pointers(self):
+        """
+        Returns an ``int`` of the total number of two point field goals the
+        player made.
+        """
+        return self._two_pointers
+
+    @slim_int_property_decorator
+    def two_point_attempts(self):
+        """
+        Returns an ``int`` of the total number of two point field goals the
+        player attempted during the season.
+        """
+        return self._two_point_attempts
+
+    @slim_float_property_decorator
+    def two_point_percentage(self):
+        """
+        Returns a ``float`` of the player's two point field goal percentage
+        during the season. Percentage ranges from 0-1.
+        """
+        return self._two_point_percentage
+
+    @slim_float_property_decorator
+    def effective_field_goal_percentage(self):
+        """
+        Returns a ``float`` of the player's field goal percentage while giving
+        extra weight to 3-point field goals. Percentage ranges from 0-1.
+        """
+        return self._effective_field_goal_percentage
+
+    @slim_int_property_decorator
+    def free_throws(self):
+        """
+        Returns an ``int`` of the total number of free throws the player made
+        during the season.
+        """
+        return self._free_throws
+
+    @slim_int_property_decorator
+    def free_throw_attempts(self):
+        """
+        Returns an ``int`` of the total number of free throws the player
+        attempted during the season.
+        """
+        return self._free_throw_attempts
+
+    @slim_float_property_decorator
+    def free_throw_percentage(self):
+        """
+        Returns a ``float`` of the player's free throw percentage during the
+        season. Percentage ranges from 0-1.
+        """
+        return self._free_throw_percentage
+
+    @slim_int_property_decorator
+    def offensive_rebounds(self):
+        """
+        Returns an ``int`` of the total number of offensive rebounds the player
+        grabbed during the season.
+        """
+        return self._offensive_rebounds
+
+    @slim_int_property_decorator
+    def defensive_rebounds(self):
+        """
+        Returns an ``int`` of the total number of defensive rebounds the player
+        grabbed during the season.
+        """
+        return self._defensive_rebounds
+
+    @slim_int_property_decorator
+    def total_rebounds(self):
+        """
+        Returns an ``int`` of the total number of offensive and defensive
+        rebounds the player grabbed during the season.
+        """
+        return self._total_rebounds
+
+    @slim_int_property_decorator
+    def assists(self):
+        """
+        Returns an ``int`` of the total number of assists the player tallied
+        during the season.
+        """
+        return self._assists
+
+    @slim_int_property_decorator
+    def steals(self):
+        """
+        Returns an ``int`` of the total number of steals the player tallied
+        during the season.
+        """
+        return self._steals
+
+    @slim_int_property_decorator
+    def blocks(self):
+        """
+        Returns an ``int`` of the total number of shots the player blocked
+        during the season.
+        """
+        return self._blocks
+
+    @slim_int_property_decorator
+    def turnovers(self):
+        """
+        Returns an ``int`` of the total number of times the player turned the
+        ball over during the season for any reason.
+        """
+        return self._turnovers
+
+    @slim_int_property_decorator
+    def personal_fouls(self):
+        """
+        Returns an ``int`` of the total number of personal fouls the player
+        committed during the season.
+        """
+        return self._personal_fouls
+
+    @slim_int_property_decorator
+    def points(self):
+        """
+        Returns an ``int`` of the total number of points the player scored
+        during the season.
+        """
+        return self._points
+
+
+def _parse_player(player):
+    """
+    Create a Player instance from a player's downloaded stats page.
+
+    The function is defined at the module level so it can be sent to the
+    worker processes which parse a roster's players.
+
+    Parameters
+    ----------
+    player : tuple
+        A tuple where the first element is the player ID and the second
+        element is the contents of the player's stats page, or None if the
+        page couldn't be downloaded.
+
+    Returns
+    -------
+    Player class instance
+        Returns an instance of the Player class for the requested player.
+    """
+    player_id, html = player
+    return Player(player_id, html)
+
+
 class Roster(object):
     """
     Get stats for all players on a roster.
 
     Request a team's roster for a given season and create instances of the
     Player class for each player, containing a detailed list of the players
-    statistics and information.
+    statistics and information. The players' pages are downloaded concurrently
+    with a pool of threads and then parsed in a pool of processes, and the
+    players are kept in the same order as the roster.
+
+    Optionally, a slim roster creates a SlimPlayer record for each player from
+    the team's page alone, requiring a single page download for the entire
+    roster. Each record can be upgraded to a full Player instance on demand.
 
     Parameters
     ----------
@@ -1477,12 +1944,20 @@ class Roster(object):
     year : string (optional)
         The 4-digit year to pull the roster from, such as '2018'. If left
         blank, defaults to the most recent season.
+    workers : int (optional)
+        The maximum number of players to download and parse simultaneously.
+        If None or 1, every player is downloaded and parsed sequentially in
+        the calling thread.
+    slim : boolean (optional)
+        If True, the players are SlimPlayer records built from the team's page
+        instead of Player instances. Defaults to False.
     """
-    def __init__(self, team, year=None):
+    def __init__(self, team, year=None, workers=fetch.DEFAULT_WORKERS,
+                 slim=False):
         self._team = team
         self._players = []
 
-        self._find_players(year)
+        self._find_players(year, workers, slim)
 
     def _pull_team_page(self, url):
         """
@@ -1501,7 +1976,7 @@ class Roster(object):
             Returns a PyQuery object of the team's HTML page.
         """
         try:
-            return pq(url)
+            return fetch.get_page(url)
         except:
             return None
 
@@ -1545,7 +2020,77 @@ class Roster(object):
         """
         return player('td[data-stat="player"]').attr('data-append-csv')
 
-    def _find_players(self, year):
+    def _find_slim_players(self, page, player_ids, year):
+        """
+        Create a SlimPlayer record for every player on the roster.
+
+        Every player's row in the season totals table is matched to the
+        player's row in the roster table by the player ID.
+
+        Parameters
+        ----------
+        page : PyQuery object
+            A PyQuery object of the team's HTML page.
+        player_ids : list
+            A list of tuples where the first element is the player ID and the
+            second element is the player's row in the roster table, in roster
+            order.
+        year : string
+            The 4-digit string representing the year of the roster.
+
+        Returns
+        -------
+        list
+            Returns a list of SlimPlayer instances in roster order.
+        """
+        # The season totals table is embedded in a comment on the team page.
+        utils._uncomment(page('div#all_totals'))
+        totals = {}
+        for row in utils._get_stats_table(page, 'table#totals'):
+            totals[self._get_id(row)] = row
+        players = []
+        for player_id, row in player_ids:
+            elements = list(row)
+            if player_id in totals:
+                elements.extend(totals[player_id])
+            players.append(SlimPlayer(player_id, pq(elements), year))
+        return players
+
+    def _parse_players(self, players, workers):
+        """
+        Create a Player instance for every downloaded stats page.
+
+        Parsing a page is bound by the CPU, so the pages are split across a
+        pool of worker processes instead of threads. Where a process pool
+        can't be created, such as on platforms without working semaphores,
+        every page is parsed sequentially instead.
+
+        Parameters
+        ----------
+        players : list
+            A list of tuples where the first element is the player ID and the
+            second element is the contents of the player's stats page, in
+            roster order.
+        workers : int
+            The maximum number of pages to parse simultaneously. If None or 1,
+            every page is parsed sequentially in the calling process.
+
+        Returns
+        -------
+        list
+            Returns a list of Player instances in roster order.
+        """
+        if not workers or workers <= 1 or len(players) <= 1:
+            return [_parse_player(player) for player in players]
+        try:
+            executor = ProcessPoolExecutor(min(workers, len(players)))
+        except (ImportError, NotImplementedError, OSError):
+            return [_parse_player(player) for player in players]
+        with executor:
+            return list(executor.map(_parse_player, players))
+
+    def _find_players(self, year, workers=fetch.DEFAULT_WORKERS,
+                      slim=False):
         """
         Find all player IDs for the requested team.
 
@@ -1560,6 +2105,12 @@ class Roster(object):
         year : string
             The 4-digit string representing the year to pull the team's roster
             from.
+        workers : int (optional)
+            The maximum number of players to download and parse
+            simultaneously.
+        slim : boolean (optional)
+            If True, create a SlimPlayer record for each player from the team
+            page instead of a Player instance.
         """
         if not year:
             year = utils._find_year_for_season('nba')
@@ -1570,15 +2121,49 @@ class Roster(object):
                       "URL exists: %s" % url)
             raise ValueError(output)
         players = page('table#roster tbody tr').items()
-        for player in players:
-            player_id = self._get_id(player)
-            player_instance = Player(player_id)
-            self._players.append(player_instance)
+        if slim:
+            player_ids = [(self._get_id(player), player) for player in players]
+            self._players = self._find_slim_players(page, player_ids, year)
+            return
+        player_ids = [self._get_id(player) for player in players]
+        urls = [PLAYER_URL % (player_id[0], player_id)
+                for player_id in player_ids]
+        pages = fetch.fetch_many(urls, workers)
+        self._players = self._parse_players(list(zip(player_ids, pages)),
+                                            workers)
 
     @property
     def players(self):
         """
         Returns a ``list`` of player instances for each player on the requested
-        team's roster.
+        team's roster. If the roster is slim, each player is a SlimPlayer
+        instance instead.
         """
         return self._players
+
+    def to_arrow(self):
+        """
+        Returns a ``pyarrow Table`` where each row is a representation of a
+        season of a Player, or of a SlimPlayer if the roster is slim, typed by
+        the schema declared in the league's constants. Requires pyarrow.
+        """
+        return export.to_arrow(self._players)
+
+    def to_parquet(self, path, batch_size=export.DEFAULT_BATCH_SIZE):
+        """
+        Write every row of the 'to_arrow' table to a Parquet file. Each player
+        is converted and written one at a time. Requires pyarrow.
+
+        Parameters
+        ----------
+        path : string
+            The path of the Parquet file to create.
+        batch_size : int (optional)
+            The number of rows to write in each row group.
+
+        Returns
+        -------
+        int
+            The number of rows written.
+        """
+        return export.to_parquet(path, self._players, batch_size)
@@ -3,8 +3,7 @@ import re
 from .constants import (SCHEDULE_SCHEME,
                         SCHEDULE_URL)
 from datetime import datetime
-from pyquery import PyQuery as pq
-from sportsreference import utils
+from sportsreference import export, fetch, instrument, memo, utils
 from sportsreference.constants import (WIN,
                                        LOSS,
                                        HOME,
@@ -15,7 +14,7 @@ from sportsreference.constants import (WIN,
 from sportsreference.nba.boxscore import Boxscore
 
 
-class Game(object):
+class Game(memo.Memoized):
     """
     A representation of a matchup between two teams.
 
@@ -27,6 +26,9 @@ class Game(object):
     game_data : string
         The row containing the specified game information.
     """
+    __slots__ = utils._slots(SCHEDULE_SCHEME,
+                             include=['datetime', 'boxscore'])
+
     def __init__(self, game_data):
         self._game = None
         self._date = None
@@ -107,7 +109,7 @@ class Game(object):
         game_data : string
             A string containing all of the rows of stats for a given game.
         """
-        for field in self.__dict__:
+        for field in self.__slots__:
             # Remove the leading '_' from the name
             short_name = str(field)[1:]
             if short_name == 'datetime':
@@ -119,6 +121,7 @@ class Game(object):
             setattr(self, field, value)
 
     @property
+    @instrument.timed('build')
     def dataframe(self):
         """
         Returns a pandas DataFrame containing all other class properties and
@@ -175,14 +178,21 @@ class Game(object):
         return pd.DataFrame([fields_to_include], index=[self._boxscore])
 
     @property
+    @instrument.timed('build')
     def dataframe_extended(self):
         """
         Returns a pandas DataFrame representing the Boxscore class for the
         game. This property provides much richer context for the selected game,
         but takes longer to process compared to the lighter 'dataframe'
-        property. The index for the DataFrame is the boxscore string.
+        property. The index for the DataFrame is the boxscore string. The
+        boxscore isn't kept on the game unless it was already requested with
+        the 'boxscore' property, so the boxscores of a whole schedule aren't
+        kept in memory.
         """
-        return self.boxscore.dataframe
+        boxscore = memo.memoized_value(self, 'boxscore')
+        if boxscore is None:
+            boxscore = Boxscore(self._boxscore)
+        return boxscore.dataframe
 
     @property
     def game(self):
@@ -209,6 +219,7 @@ class Game(object):
         return datetime.strptime(self._date, '%Y-%m-%d')
 
     @property
+    @memo.memoized('boxscore', '_boxscore')
     def boxscore(self):
         """
         Returns an instance of the Boxscore class containing more detailed
@@ -216,6 +227,14 @@ class Game(object):
         """
         return Boxscore(self._boxscore)
 
+    @property
+    def boxscore_index(self):
+        """
+        Returns a ``string`` of the URI for the game's boxscore, such as
+        '201710310LAL'.
+        """
+        return self._boxscore
+
     @property
     def location(self):
         """
@@ -631,7 +650,7 @@ class Schedule:
         """
         if not year:
             year = utils._find_year_for_season('nba')
-        doc = pq(SCHEDULE_URL % (abbreviation, year))
+        doc = fetch.get_page(SCHEDULE_URL % (abbreviation, year))
         schedule = utils._get_stats_table(doc, 'table#tgl_basic')
         self._add_games_to_schedule(schedule)
         if 'tgl_basic_playoffs' in str(doc):
@@ -640,6 +659,7 @@ class Schedule:
             self._add_games_to_schedule(playoffs)
 
     @property
+    @instrument.timed('build')
     def dataframe(self):
         """
         Returns a pandas DataFrame where each row is a representation of the
@@ -651,6 +671,7 @@ class Schedule:
         return pd.concat(frames)
 
     @property
+    @instrument.timed('build')
     def dataframe_extended(self):
         """
         Returns a pandas DataFrame where each row is a representation of the
@@ -663,3 +684,48 @@ class Schedule:
         for game in self.__iter__():
             frames.append(game.dataframe_extended)
         return pd.concat(frames)
+
+    def concurrent_dataframe_extended(self, workers=fetch.DEFAULT_WORKERS):
+        """
+        Returns a pandas DataFrame where each row is a representation of the
+        Boxscore class for every game in the schedule, identical to the
+        'dataframe_extended' property. The boxscores are downloaded and parsed
+        by a pool of worker threads, so the total time scales with the number
+        of workers instead of the number of games.
+
+        Parameters
+        ----------
+        workers : int (optional)
+            The maximum number of boxscores to download simultaneously.
+        """
+        frames = fetch.map_concurrent(lambda game: game.dataframe_extended,
+                                      self._games,
+                                      workers)
+        return pd.concat(frames)
+
+    def to_arrow(self):
+        """
+        Returns a ``pyarrow Table`` where each row is a representation of the
+        Game class, typed by the schema declared in the league's constants.
+        Requires pyarrow.
+        """
+        return export.to_arrow(self.__iter__())
+
+    def to_parquet(self, path, batch_size=export.DEFAULT_BATCH_SIZE):
+        """
+        Write every row of the 'to_arrow' table to a Parquet file. Games which
+        haven't been played yet are excluded. Requires pyarrow.
+
+        Parameters
+        ----------
+        path : string
+            The path of the Parquet file to create.
+        batch_size : int (optional)
+            The number of rows to write in each row group.
+
+        Returns
+        -------
+        int
+            The number of rows written.
+        """
+        return export.to_parquet(path, self.__iter__(), batch_size)
@@ -1,7 +1,8 @@
 import pandas as pd
 import re
+from collections import OrderedDict
 from pyquery import PyQuery as pq
-from .. import utils
+from .. import export, fetch, instrument, utils
 from .constants import (BOXSCORE_ELEMENT_INDEX,
                         BOXSCORE_SCHEME,
                         BOXSCORE_URL,
@@ -23,8 +24,15 @@ class Boxscore(object):
     uri : string
         The relative link to the boxscore HTML page, such as
         '2017-11-10-21-kansas'.
+    lazy : boolean (optional)
+        If True, the page is downloaded immediately but each attribute is only
+        parsed the first time it is requested. Defaults to False, which parses
+        every attribute up front.
     """
-    def __init__(self, uri):
+    __slots__ = utils._slots(BOXSCORE_SCHEME,
+                             include=['uri', 'winner', 'lazy_fields', 'page'])
+
+    def __init__(self, uri, lazy=False):
         self._uri = uri
         self._date = None
         self._location = None
@@ -111,7 +119,10 @@ class Boxscore(object):
         self._home_offensive_rating = None
         self._home_defensive_rating = None
 
-        self._parse_game_data(uri)
+        self._lazy_fields = None
+        self._page = None
+
+        self._parse_game_data(uri, lazy)
 
     def _retrieve_html_page(self, uri):
         """
@@ -135,10 +146,10 @@ class Boxscore(object):
         """
         url = BOXSCORE_URL % uri
         try:
-            url_data = pq(url)
+            url_data = fetch.get_page(url)
         except:
             return None
-        return pq(utils._remove_html_comment_tags(url_data))
+        return utils._uncomment(url_data)
 
     def _parse_game_date_and_location(self, field, boxscore):
         """
@@ -162,8 +173,9 @@ class Boxscore(object):
             Depending on the requested field, returns a text representation of
             either the date or location of the game.
         """
-        scheme = BOXSCORE_SCHEME[field]
-        items = [i.text() for i in boxscore(scheme).items()]
+        items = [i.text() for i in utils._select(BOXSCORE_SCHEME,
+                                                 boxscore,
+                                                 field).items()]
         game_info = items[0].split('\n')
         return game_info[BOXSCORE_ELEMENT_INDEX[field]]
 
@@ -187,8 +199,7 @@ class Boxscore(object):
         PyQuery object
             The complete text for the requested tag.
         """
-        scheme = BOXSCORE_SCHEME[field]
-        name = boxscore(scheme)
+        name = utils._select(BOXSCORE_SCHEME, boxscore, field)
         if 'cbb/schools' not in str(name):
             name = re.sub(r'.*name">', '', str(name))
             name = re.sub(r'<.*', '', str(name))
@@ -221,7 +232,7 @@ class Boxscore(object):
         """
         ranking = None
         index = BOXSCORE_ELEMENT_INDEX[field]
-        teams_boxscore = boxscore(BOXSCORE_SCHEME[field])
+        teams_boxscore = utils._select(BOXSCORE_SCHEME, boxscore, field)
         team = pq(teams_boxscore[index])
         if 'pollrank' in str(team):
             rank_str = re.findall('\(\d+\)', str(team))
@@ -229,7 +240,62 @@ class Boxscore(object):
                 ranking = int(rank_str[0].replace('(', '').replace(')', ''))
         return ranking
 
-    def _parse_game_data(self, uri):
+    def _parse_value(self, field, boxscore):
+        """
+        Parse the value of a single attribute.
+
+        Parameters
+        ----------
+        field : string
+            The name of the attribute to parse without the leading underscore,
+            such as 'home_points'.
+        boxscore : PyQuery object
+            A PyQuery object containing all of the HTML data from the boxscore.
+
+        Returns
+        -------
+        object
+            The parsed value of the requested attribute.
+        """
+        if field == 'location' or \
+           field == 'date':
+            return self._parse_game_date_and_location(field, boxscore)
+        if field == 'away_name' or \
+           field == 'home_name':
+            return self._parse_name(field, boxscore)
+        if field == 'away_ranking' or \
+           field == 'home_ranking':
+            return self._parse_ranking(field, boxscore)
+        index = 0
+        if field in BOXSCORE_ELEMENT_INDEX.keys():
+            index = BOXSCORE_ELEMENT_INDEX[field]
+        return utils._parse_field(BOXSCORE_SCHEME,
+                                  boxscore,
+                                  field,
+                                  index)
+
+    def __getattr__(self, name):
+        """
+        Parse an attribute the first time it is requested in lazy mode.
+
+        This is only called when an attribute can't be found, which in lazy
+        mode is the case for every attribute which hasn't been parsed yet.
+        Once parsed, the value is stored on the instance so it is only parsed
+        once.
+        """
+        try:
+            lazy_fields = object.__getattribute__(self, '_lazy_fields')
+        except AttributeError:
+            # The instance is still being created, such as while unpickling.
+            lazy_fields = None
+        if not lazy_fields or name not in lazy_fields:
+            raise AttributeError("'%s' object has no attribute '%s'" %
+                                 (type(self).__name__, name))
+        value = self._parse_value(name[1:], self._page)
+        setattr(self, name, value)
+        return value
+
+    def _parse_game_data(self, uri, lazy=False):
         """
         Parses a value for every attribute.
 
@@ -246,6 +312,9 @@ class Boxscore(object):
         uri : string
             The relative link to the boxscore HTML page, such as
             '2017-11-10-21-kansas'.
+        lazy : boolean (optional)
+            If True, every attribute is removed from the instance and only
+            parsed the first time it is requested.
         """
         boxscore = self._retrieve_html_page(uri)
         # If the boxscore is None, the game likely hasn't been played yet and
@@ -254,38 +323,29 @@ class Boxscore(object):
         if not boxscore:
             return
 
-        for field in self.__dict__:
+        fields = []
+        for field in self.__slots__:
             # Remove the '_' from the name
             short_field = str(field)[1:]
             if short_field == 'winner' or \
+               short_field == 'lazy_fields' or \
+               short_field == 'page' or \
                short_field == 'uri':
                 continue
-            if short_field == 'location' or \
-               short_field == 'date':
-                value = self._parse_game_date_and_location(short_field,
-                                                           boxscore)
-                setattr(self, field, value)
-                continue
-            if short_field == 'away_name' or \
-               short_field == 'home_name':
-                value = self._parse_name(short_field, boxscore)
-                setattr(self, field, value)
-                continue
-            if short_field == 'away_ranking' or \
-               short_field == 'home_ranking':
-                value = self._parse_ranking(short_field, boxscore)
-                setattr(self, field, value)
-                continue
-            index = 0
-            if short_field in BOXSCORE_ELEMENT_INDEX.keys():
-                index = BOXSCORE_ELEMENT_INDEX[short_field]
-            value = utils._parse_field(BOXSCORE_SCHEME,
-                                       boxscore,
-                                       short_field,
-                                       index)
-            setattr(self, field, value)
+            fields.append(field)
+        if lazy:
+            # Remove every attribute which should be parsed so __getattr__ is
+            # called the first time each one is requested.
+            for field in fields:
+                delattr(self, field)
+            self._lazy_fields = frozenset(fields)
+            self._page = boxscore
+            return
+        for field in fields:
+            setattr(self, field, self._parse_value(field[1:], boxscore))
 
     @property
+    @instrument.timed('build')
     def dataframe(self):
         """
         Returns a pandas DataFrame containing all other class properties and
@@ -1161,11 +1221,18 @@ class Boxscores:
     date : datetime object
         The date to search for any matches. The month, day, and year are
         required for the search, but time is not factored into the search.
+    end_date : datetime object (optional)
+        Optionally search every day from 'date' through 'end_date', inclusive.
+        The page for every day is downloaded concurrently and the games from
+        all days are combined.
+    workers : int (optional)
+        The maximum number of days to download simultaneously.
     """
-    def __init__(self, date):
+    def __init__(self, date, end_date=None, workers=fetch.DEFAULT_WORKERS):
         self._boxscores = {'boxscores': []}
+        self._boxscores_by_date = OrderedDict()
 
-        self._find_games(date)
+        self._find_games(date, end_date, workers)
 
     @property
     def games(self):
@@ -1193,10 +1260,65 @@ class Boxscores:
             }
 
         If no games were played during the requested day, the list for
-        ['boxscores'] will be empty.
+        ['boxscores'] will be empty. If a range of days was requested, the list
+        contains the games from every day in chronological order.
         """
         return self._boxscores
 
+    @property
+    def games_by_date(self):
+        """
+        Returns an ``OrderedDict`` where every key is a ``string`` of a
+        requested day in the format 'YYYY-MM-DD' and every value is a ``list``
+        of the games played on that day, in the same format as the list in
+        'games'. Days are in chronological order.
+        """
+        return self._boxscores_by_date
+
+    def to_arrow(self):
+        """
+        Returns a ``pyarrow Table`` where each row is one of the games in
+        'games', with an additional 'date' column of the day the game was
+        played. Requires pyarrow.
+        """
+        batches = export._summary_batches(self._boxscores_by_date, 'date')
+        return export._table(batches)
+
+    def to_parquet(self, path, batch_size=export.DEFAULT_BATCH_SIZE):
+        """
+        Write every row of the 'to_arrow' table to a Parquet file. Requires
+        pyarrow.
+
+        Parameters
+        ----------
+        path : string
+            The path of the Parquet file to create.
+        batch_size : int (optional)
+            The number of rows to write in each row group.
+
+        Returns
+        -------
+        int
+            The number of rows written.
+        """
+        batches = export._summary_batches(self._boxscores_by_date, 'date')
+        return export._write(path, batches, batch_size)
+
+    def concurrent_boxscores(self, workers=fetch.DEFAULT_WORKERS):
+        """
+        Returns a ``list`` of Boxscore instances for every game in 'games',
+        in the same order. The boxscores are downloaded and parsed by a pool of
+        worker threads, so the total time scales with the number of workers
+        instead of the number of games.
+
+        Parameters
+        ----------
+        workers : int (optional)
+            The maximum number of boxscores to download simultaneously.
+        """
+        uris = [game['boxscore'] for game in self._boxscores['boxscores']]
+        return fetch.map_concurrent(Boxscore, uris, workers)
+
     def _create_url(self, date):
         """
         Build the URL based on the passed datetime object.
@@ -1236,7 +1358,7 @@ class Boxscores:
             A PyQuery object containing the HTML contents of the requested
             page.
         """
-        return pq(url)
+        return fetch.get_page(url)
 
     def _get_boxscore_uri(self, url):
         """
@@ -1383,7 +1505,7 @@ class Boxscores:
             all_boxscores.append(game_info)
         return all_boxscores
 
-    def _find_games(self, date):
+    def _find_games_on_date(self, date):
         """
         Retrieve all major games played on a given day.
 
@@ -1398,9 +1520,41 @@ class Boxscores:
         date : datetime object
             The date to search for any matches. The month, day, and year are
             required for the search, but time is not factored into the search.
+
+        Returns
+        -------
+        list
+            Returns a ``list`` of dictionaries where each dictionary contains
+            the name and abbreviations for both the home and away teams, and a
+            link to the game's boxscore.
         """
         url = self._create_url(date)
         page = self._get_requested_page(url)
         games = page('table[class="teams"]').items()
-        boxscores = self._extract_game_info(games)
+        return self._extract_game_info(games)
+
+    def _find_games(self, date, end_date=None, workers=fetch.DEFAULT_WORKERS):
+        """
+        Retrieve all major games played during the requested days.
+
+        The page for every day is downloaded and parsed by a pool of worker
+        threads, so the total time scales with the number of workers instead
+        of the number of days.
+
+        Parameters
+        ----------
+        date : datetime object
+            The first day to search for any matches.
+        end_date : datetime object (optional)
+            The last day to search for any matches, inclusive. If None, only
+            the first day is searched.
+        workers : int (optional)
+            The maximum number of days to download simultaneously.
+        """
+        dates = utils._date_range(date, end_date)
+        games = fetch.map_concurrent(self._find_games_on_date, dates, workers)
+        boxscores = []
+        for day, day_games in zip(dates, games):
+            self._boxscores_by_date[day.strftime('%Y-%m-%d')] = day_games
+            boxscores.extend(day_games)
         self._boxscores = {'boxscores': boxscores}
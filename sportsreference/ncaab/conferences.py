@@ -1,7 +1,9 @@
-from pyquery import PyQuery as pq
 import re
-from .. import utils
-from .constants import CONFERENCE_URL, CONFERENCES_URL
+from requests.exceptions import HTTPError
+from .. import fetch, utils
+from .constants import (CONFERENCE_RATINGS_URL,
+                        CONFERENCE_URL,
+                        CONFERENCES_URL)
 
 
 class Conference:
@@ -41,11 +43,13 @@ class Conference:
             A string of the requested year to pull conference information from.
         """
         try:
-            return pq(CONFERENCE_URL % (conference_abbreviation, year))
+            return fetch.get_page(CONFERENCE_URL % (conference_abbreviation,
+                                                    year))
         except:
             return None
 
-    def _get_team_abbreviation(self, team):
+    @staticmethod
+    def _get_team_abbreviation(team):
         """
         Retrieve team's abbreviation.
 
@@ -57,7 +61,7 @@ class Conference:
         ----------
         team : PyQuery object
             A PyQuery object representing a single row in a table on the
-            conference page.
+            conference or ratings page.
 
         Returns
         -------
@@ -121,41 +125,69 @@ class Conferences:
     given team, or get more detailed information including all teams for each
     conference.
 
+    By default, the membership of every conference is read from the season's
+    ratings page which lists the conference for every team, requiring only two
+    page downloads for the entire season. Any conference which isn't listed on
+    the ratings page, or every conference if the ratings page can't be pulled,
+    falls back to downloading the individual conference pages concurrently.
+
     Parameters
     ----------
     year : string (optional)
         A string of the requested year to pull conferences from. Defaults to
         the most recent season.
+    single_page : boolean (optional)
+        If True, conference memberships are read from the season's ratings
+        page. If False, every individual conference page is downloaded.
+        Defaults to True.
+    workers : int (optional)
+        The maximum number of pages to download simultaneously.
     """
-    def __init__(self, year=None):
+    def __init__(self, year=None, single_page=True,
+                 workers=fetch.DEFAULT_WORKERS):
         self._conferences = {}
         self._team_conference = {}
 
-        self._find_conferences(year)
+        self._find_conferences(year, single_page, workers)
 
-    def _pull_conference_page(self, year):
+    def _pull_conference_pages(self, year, single_page, workers):
         """
-        Download the conference page.
+        Download the season and ratings pages.
 
-        Download the conference page for the requested team and create a
-        PyQuery object.
+        Download the season page listing every conference and, if requested,
+        the ratings page listing the conference for every team. Both pages are
+        downloaded concurrently.
 
         Parameters
         ----------
         year : string
-            A string of the requested year to pull rankings from.
+            A string of the requested year to pull conferences from.
+        single_page : boolean
+            If True, the ratings page is downloaded alongside the season page.
+        workers : int
+            The maximum number of pages to download simultaneously.
 
         Returns
         -------
-        PyQuery object
-            Returns a PyQuery object of the conference HTML page.
+        tuple
+            Returns a tuple of PyQuery objects of the season and ratings pages.
+            Either value is None if the server responded with an error.
         """
-        try:
-            return pq(CONFERENCES_URL % year)
-        except:
-            return None
-
-    def _get_conference_id(self, conference):
+        def _pull_page(url):
+            try:
+                return fetch.get_page(url)
+            except HTTPError:
+                return None
+
+        urls = [CONFERENCES_URL % year]
+        if single_page:
+            urls.append(CONFERENCE_RATINGS_URL % year)
+        pages = fetch.map_concurrent(_pull_page, urls, workers)
+        if not single_page:
+            pages.append(None)
+        return tuple(pages)
+
+    def _get_conference_id(self, conference, field='conf_name'):
         """
         Get the conference abbreviation, such as 'big-12'.
 
@@ -168,18 +200,50 @@ class Conferences:
         conference : PyQuery object
             A PyQuery object representing a single row in the conference table
             which can be used to find the conference abbreviation.
+        field : string (optional)
+            The 'data-stat' attribute of the cell which links to the
+            conference page. Defaults to 'conf_name'.
 
         Returns
         -------
         string
             Returns a string of the conference abbreviation, such as 'big-12'.
         """
-        name_tag = conference('td[data-stat="conf_name"] a')
+        name_tag = conference('td[data-stat="%s"] a' % field)
         conference_id = re.sub(r'.*/cbb/conferences/', '', str(name_tag))
         conference_id = re.sub(r'/.*', '', conference_id)
         return conference_id
 
-    def _find_conferences(self, year):
+    def _find_members(self, ratings):
+        """
+        Find the members of every conference listed on the ratings page.
+
+        Parameters
+        ----------
+        ratings : PyQuery object
+            A PyQuery object of the season's ratings page.
+
+        Returns
+        -------
+        dictionary
+            Returns a dictionary where each key is a string of the conference
+            abbreviation and each value is a dictionary of the abbreviation
+            and full name of every team in the conference.
+        """
+        members = {}
+        for team in ratings('table#ratings tbody tr').items():
+            team_abbreviation = Conference._get_team_abbreviation(team)
+            conference_abbreviation = self._get_conference_id(team,
+                                                              'conf_abbr')
+            if team_abbreviation == '' or conference_abbreviation == '':
+                continue
+            team_name = team('td[data-stat="school_name"]').text()
+            members.setdefault(conference_abbreviation, {})
+            members[conference_abbreviation][team_abbreviation] = team_name
+        return members
+
+    def _find_conferences(self, year, single_page=True,
+                          workers=fetch.DEFAULT_WORKERS):
         """
         Retrieve the conferences and teams for the requested season.
 
@@ -193,19 +257,34 @@ class Conferences:
         ----------
         year : string
             A string of the requested year to pull conferences from.
+        single_page : boolean (optional)
+            If True, conference memberships are read from the season's ratings
+            page instead of every individual conference page.
+        workers : int (optional)
+            The maximum number of pages to download simultaneously.
         """
         if not year:
             year = utils._find_year_for_season('ncaab')
-        page = self._pull_conference_page(year)
+        page, ratings = self._pull_conference_pages(year, single_page,
+                                                    workers)
         if not page:
             output = ("Can't pull requested conference page. Ensure the "
                       "following URL exists: %s" % (CONFERENCES_URL % year))
             raise ValueError(output)
-        conferences = page('table#conference-summary tbody tr').items()
-        for conference in conferences:
+        members = self._find_members(ratings) if ratings else {}
+        conferences = []
+        for conference in page('table#conference-summary tbody tr').items():
             conference_abbreviation = self._get_conference_id(conference)
             conference_name = conference('td[data-stat="conf_name"]').text()
-            teams_dict = Conference(conference_abbreviation, year).teams
+            conferences.append((conference_abbreviation, conference_name))
+        missing = [abbreviation for abbreviation, _ in conferences
+                   if abbreviation not in members]
+        teams = fetch.map_concurrent(lambda abbreviation:
+                                     Conference(abbreviation, year).teams,
+                                     missing, workers)
+        members.update(zip(missing, teams))
+        for conference_abbreviation, conference_name in conferences:
+            teams_dict = members[conference_abbreviation]
             conference_dict = {
                     'name': conference_name,
                     'teams': teams_dict
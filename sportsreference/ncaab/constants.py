@@ -1,4 +1,7 @@
-PARSING_SCHEME = {
+from .. import utils
+
+
+PARSING_SCHEME = utils.CompiledScheme({
     'name': 'a',
     'games_played': 'td[data-stat="g"]:first',
     'wins': 'td[data-stat="wins"]:first',
@@ -86,9 +89,97 @@ PARSING_SCHEME = {
     'opp_offensive_rebound_percentage': 'td[data-stat="opp_orb_pct"]:first',
     'opp_free_throws_per_field_goal_attempt':
     'td[data-stat="opp_ft_rate"]:first'
+})
+
+# The Arrow type of every column exported from the Team class.
+TEAM_TYPES = {
+    'abbreviation': 'string',
+    'assist_percentage': 'float64',
+    'assists': 'int64',
+    'away_losses': 'int64',
+    'away_wins': 'int64',
+    'block_percentage': 'float64',
+    'blocks': 'int64',
+    'conference': 'string',
+    'conference_losses': 'int64',
+    'conference_wins': 'int64',
+    'defensive_rebounds': 'int64',
+    'effective_field_goal_percentage': 'float64',
+    'field_goal_attempts': 'int64',
+    'field_goal_percentage': 'float64',
+    'field_goals': 'int64',
+    'free_throw_attempt_rate': 'float64',
+    'free_throw_attempts': 'int64',
+    'free_throw_percentage': 'float64',
+    'free_throws': 'int64',
+    'free_throws_per_field_goal_attempt': 'float64',
+    'games_played': 'int64',
+    'home_losses': 'int64',
+    'home_wins': 'int64',
+    'losses': 'int64',
+    'minutes_played': 'int64',
+    'name': 'string',
+    'net_rating': 'float64',
+    'offensive_rating': 'float64',
+    'offensive_rebound_percentage': 'float64',
+    'offensive_rebounds': 'int64',
+    'opp_assist_percentage': 'float64',
+    'opp_assists': 'int64',
+    'opp_block_percentage': 'float64',
+    'opp_blocks': 'int64',
+    'opp_defensive_rebounds': 'int64',
+    'opp_effective_field_goal_percentage': 'float64',
+    'opp_field_goal_attempts': 'int64',
+    'opp_field_goal_percentage': 'float64',
+    'opp_field_goals': 'int64',
+    'opp_free_throw_attempt_rate': 'float64',
+    'opp_free_throw_attempts': 'int64',
+    'opp_free_throw_percentage': 'float64',
+    'opp_free_throws': 'int64',
+    'opp_free_throws_per_field_goal_attempt': 'float64',
+    'opp_offensive_rating': 'float64',
+    'opp_offensive_rebound_percentage': 'float64',
+    'opp_offensive_rebounds': 'int64',
+    'opp_personal_fouls': 'int64',
+    'opp_points': 'int64',
+    'opp_steal_percentage': 'float64',
+    'opp_steals': 'int64',
+    'opp_three_point_attempt_rate': 'float64',
+    'opp_three_point_field_goal_attempts': 'int64',
+    'opp_three_point_field_goal_percentage': 'float64',
+    'opp_three_point_field_goals': 'int64',
+    'opp_total_rebound_percentage': 'float64',
+    'opp_total_rebounds': 'int64',
+    'opp_true_shooting_percentage': 'float64',
+    'opp_turnover_percentage': 'float64',
+    'opp_turnovers': 'int64',
+    'opp_two_point_field_goal_attempts': 'int64',
+    'opp_two_point_field_goal_percentage': 'float64',
+    'opp_two_point_field_goals': 'int64',
+    'pace': 'float64',
+    'personal_fouls': 'int64',
+    'points': 'int64',
+    'simple_rating_system': 'float64',
+    'steal_percentage': 'float64',
+    'steals': 'int64',
+    'strength_of_schedule': 'float64',
+    'three_point_attempt_rate': 'float64',
+    'three_point_field_goal_attempts': 'int64',
+    'three_point_field_goal_percentage': 'float64',
+    'three_point_field_goals': 'int64',
+    'total_rebound_percentage': 'float64',
+    'total_rebounds': 'int64',
+    'true_shooting_percentage': 'float64',
+    'turnover_percentage': 'float64',
+    'turnovers': 'int64',
+    'two_point_field_goal_attempts': 'int64',
+    'two_point_field_goal_percentage': 'float64',
+    'two_point_field_goals': 'int64',
+    'win_percentage': 'float64',
+    'wins': 'int64'
 }
 
-SCHEDULE_SCHEME = {
+SCHEDULE_SCHEME = utils.CompiledScheme({
     'game': 'th[data-stat="g"]:first',
     'date': 'td[data-stat="date_game"]:first',
     'time': 'td[data-stat="time_game"]:first',
@@ -105,9 +196,32 @@ SCHEDULE_SCHEME = {
     'season_losses': 'td[data-stat="losses"]:first',
     'streak': 'td[data-stat="game_streak"]:first',
     'arena': 'td[data-stat="arena"]:first'
+})
+
+# The Arrow type of every column exported from the Game class.
+SCHEDULE_TYPES = {
+    'arena': 'string',
+    'boxscore_index': 'string',
+    'date': 'string',
+    'datetime': 'timestamp',
+    'game': 'int64',
+    'location': 'string',
+    'opponent_abbr': 'string',
+    'opponent_conference': 'string',
+    'opponent_name': 'string',
+    'opponent_rank': 'string',
+    'overtimes': 'int64',
+    'points_against': 'int64',
+    'points_for': 'int64',
+    'result': 'string',
+    'season_losses': 'int64',
+    'season_wins': 'int64',
+    'streak': 'string',
+    'time': 'string',
+    'type': 'string'
 }
 
-BOXSCORE_SCHEME = {
+BOXSCORE_SCHEME = utils.CompiledScheme({
     'date': 'div[class="scorebox_meta"]',
     'location': 'div[class="scorebox_meta"]',
     'away_name': 'a[itemprop="name"]:first',
@@ -191,6 +305,97 @@ BOXSCORE_SCHEME = {
     'home_offensive_rating': 'tfoot td[data-stat="off_rtg"]',
     'home_defensive_rating': 'tfoot td[data-stat="def_rtg"]',
     'home_ranking': 'div[class="game_summary nohover current"] tr'
+})
+
+# The Arrow type of every column exported from the Boxscore class.
+BOXSCORE_TYPES = {
+    'away_assist_percentage': 'float64',
+    'away_assists': 'int64',
+    'away_block_percentage': 'float64',
+    'away_blocks': 'int64',
+    'away_defensive_rating': 'float64',
+    'away_defensive_rebound_percentage': 'float64',
+    'away_defensive_rebounds': 'int64',
+    'away_effective_field_goal_percentage': 'float64',
+    'away_field_goal_attempts': 'int64',
+    'away_field_goal_percentage': 'float64',
+    'away_field_goals': 'int64',
+    'away_free_throw_attempt_rate': 'float64',
+    'away_free_throw_attempts': 'int64',
+    'away_free_throw_percentage': 'float64',
+    'away_free_throws': 'int64',
+    'away_losses': 'int64',
+    'away_minutes_played': 'int64',
+    'away_offensive_rating': 'float64',
+    'away_offensive_rebound_percentage': 'float64',
+    'away_offensive_rebounds': 'int64',
+    'away_personal_fouls': 'int64',
+    'away_points': 'int64',
+    'away_ranking': 'int64',
+    'away_steal_percentage': 'float64',
+    'away_steals': 'int64',
+    'away_three_point_attempt_rate': 'float64',
+    'away_three_point_field_goal_attempts': 'int64',
+    'away_three_point_field_goal_percentage': 'float64',
+    'away_three_point_field_goals': 'int64',
+    'away_total_rebound_percentage': 'float64',
+    'away_total_rebounds': 'int64',
+    'away_true_shooting_percentage': 'float64',
+    'away_turnover_percentage': 'float64',
+    'away_turnovers': 'int64',
+    'away_two_point_field_goal_attempts': 'int64',
+    'away_two_point_field_goal_percentage': 'float64',
+    'away_two_point_field_goals': 'int64',
+    'away_win_percentage': 'float64',
+    'away_wins': 'int64',
+    'boxscore': 'string',
+    'date': 'string',
+    'home_assist_percentage': 'float64',
+    'home_assists': 'int64',
+    'home_block_percentage': 'float64',
+    'home_blocks': 'int64',
+    'home_defensive_rating': 'float64',
+    'home_defensive_rebound_percentage': 'float64',
+    'home_defensive_rebounds': 'int64',
+    'home_effective_field_goal_percentage': 'float64',
+    'home_field_goal_attempts': 'int64',
+    'home_field_goal_percentage': 'float64',
+    'home_field_goals': 'int64',
+    'home_free_throw_attempt_rate': 'float64',
+    'home_free_throw_attempts': 'int64',
+    'home_free_throw_percentage': 'float64',
+    'home_free_throws': 'int64',
+    'home_losses': 'int64',
+    'home_minutes_played': 'int64',
+    'home_offensive_rating': 'float64',
+    'home_offensive_rebound_percentage': 'float64',
+    'home_offensive_rebounds': 'int64',
+    'home_personal_fouls': 'int64',
+    'home_points': 'int64',
+    'home_ranking': 'int64',
+    'home_steal_percentage': 'float64',
+    'home_steals': 'int64',
+    'home_three_point_attempt_rate': 'float64',
+    'home_three_point_field_goal_attempts': 'int64',
+    'home_three_point_field_goal_percentage': 'float64',
+    'home_three_point_field_goals': 'int64',
+    'home_total_rebound_percentage': 'float64',
+    'home_total_rebounds': 'int64',
+    'home_true_shooting_percentage': 'float64',
+    'home_turnover_percentage': 'float64',
+    'home_turnovers': 'int64',
+    'home_two_point_field_goal_attempts': 'int64',
+    'home_two_point_field_goal_percentage': 'float64',
+    'home_two_point_field_goals': 'int64',
+    'home_win_percentage': 'float64',
+    'home_wins': 'int64',
+    'location': 'string',
+    'losing_abbr': 'string',
+    'losing_name': 'string',
+    'pace': 'float64',
+    'winner': 'string',
+    'winning_abbr': 'string',
+    'winning_name': 'string'
 }
 
 BOXSCORE_ELEMENT_INDEX = {
@@ -236,16 +441,16 @@ BOXSCORE_ELEMENT_INDEX = {
     'home_defensive_rating': 1
 }
 
-RANKINGS_SCHEME = {
+RANKINGS_SCHEME = utils.CompiledScheme({
     'name': 'td[data-stat="school_name"]',
     'week': 'th[data-stat="week_poll"]',
     'date': 'td[data-stat="date_poll"]',
     'rank': 'td[data-stat="rank"]',
     'previous': 'td[data-stat="rank_prev"]',
     'change': 'td[data-stat="rank_diff"]'
-}
+})
 
-PLAYER_SCHEME = {
+PLAYER_SCHEME = utils.CompiledScheme({
     'conference': 'td[data-stat="conf_abbr"]',
     'season': 'th[data-stat="season"]:first',
     'name': 'h1',
@@ -301,6 +506,63 @@ PLAYER_SCHEME = {
     'offensive_box_plus_minus': 'td[data-stat="obpm"]',
     'defensive_box_plus_minus': 'td[data-stat="dbpm"]',
     'box_plus_minus': 'td[data-stat="bpm"]'
+})
+
+# The Arrow type of every column exported from the Player class.
+PLAYER_TYPES = {
+    'assist_percentage': 'float64',
+    'assists': 'int64',
+    'block_percentage': 'float64',
+    'blocks': 'int64',
+    'box_plus_minus': 'float64',
+    'conference': 'string',
+    'defensive_box_plus_minus': 'float64',
+    'defensive_rebound_percentage': 'float64',
+    'defensive_rebounds': 'int64',
+    'defensive_win_shares': 'float64',
+    'effective_field_goal_percentage': 'float64',
+    'field_goal_attempts': 'int64',
+    'field_goal_percentage': 'float64',
+    'field_goals': 'int64',
+    'free_throw_attempt_rate': 'float64',
+    'free_throw_attempts': 'int64',
+    'free_throw_percentage': 'float64',
+    'free_throws': 'int64',
+    'games_played': 'int64',
+    'games_started': 'int64',
+    'height': 'string',
+    'minutes_played': 'int64',
+    'name': 'string',
+    'offensive_box_plus_minus': 'float64',
+    'offensive_rebound_percentage': 'float64',
+    'offensive_rebounds': 'int64',
+    'offensive_win_shares': 'float64',
+    'personal_fouls': 'int64',
+    'player_efficiency_rating': 'float64',
+    'player_id': 'string',
+    'points': 'int64',
+    'points_produced': 'int64',
+    'position': 'string',
+    'season': 'string',
+    'steal_percentage': 'float64',
+    'steals': 'int64',
+    'team_abbreviation': 'string',
+    'three_point_attempt_rate': 'float64',
+    'three_point_attempts': 'int64',
+    'three_point_percentage': 'float64',
+    'three_pointers': 'int64',
+    'total_rebound_percentage': 'float64',
+    'total_rebounds': 'int64',
+    'true_shooting_percentage': 'float64',
+    'turnover_percentage': 'float64',
+    'turnovers': 'int64',
+    'two_point_attempts': 'int64',
+    'two_point_percentage': 'float64',
+    'two_pointers': 'int64',
+    'usage_percentage': 'float64',
+    'weight': 'int64',
+    'win_shares': 'float64',
+    'win_shares_per_40_minutes': 'float64'
 }
 
 BASIC_STATS_URL = ('http://www.sports-reference.com/cbb/seasons/'
@@ -319,6 +581,8 @@ BOXSCORES_URL = ('https://www.sports-reference.com/cbb/boxscores/index.cgi?'
                  'month=%s&day=%s&year=%s')
 RANKINGS_URL = 'https://www.sports-reference.com/cbb/seasons/%s-polls.html'
 CONFERENCES_URL = 'https://www.sports-reference.com/cbb/seasons/%s.html'
+CONFERENCE_RATINGS_URL = ('https://www.sports-reference.com/cbb/seasons/'
+                          '%s-ratings.html')
 CONFERENCE_URL = 'https://www.sports-reference.com/cbb/conferences/%s/%s.html'
 PLAYER_URL = 'https://www.sports-reference.com/cbb/players/%s.html'
 
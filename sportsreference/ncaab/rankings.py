@@ -1,6 +1,5 @@
 import re
-from pyquery import PyQuery as pq
-from .. import utils
+from .. import fetch, utils
 from .constants import RANKINGS_SCHEME, RANKINGS_URL
 
 
@@ -41,7 +40,7 @@ class Rankings:
             Returns a PyQuery object of the rankings HTML page.
         """
         try:
-            return pq(RANKINGS_URL % year)
+            return fetch.get_page(RANKINGS_URL % year)
         except:
             return None
 
@@ -108,9 +107,10 @@ class Rankings:
             date = utils._parse_field(RANKINGS_SCHEME, team, 'date')
             previous = utils._parse_field(RANKINGS_SCHEME, team, 'previous')
             change = utils._parse_field(RANKINGS_SCHEME, team, 'change')
-            if 'decrease' in str(team(RANKINGS_SCHEME['change'])):
+            change_tag = str(utils._select(RANKINGS_SCHEME, team, 'change'))
+            if 'decrease' in change_tag:
                 change = int(change) * -1
-            elif 'increase' in str(team(RANKINGS_SCHEME['change'])):
+            elif 'increase' in change_tag:
                 change = int(change)
             else:
                 change = 0
@@ -1,7 +1,9 @@
 import pandas as pd
 import re
+from collections import OrderedDict
+from functools import wraps
 from pyquery import PyQuery as pq
-from .. import utils
+from .. import fetch, instrument, utils
 from .constants import PLAYER_SCHEME, PLAYER_URL
 
 
@@ -18,6 +20,7 @@ def cleanup(prop):
 
 def int_property_decorator(func):
     @property
+    @wraps(func)
     def wrapper(*args):
         index = args[0]._index
         prop = func(*args)
@@ -32,6 +35,7 @@ def int_property_decorator(func):
 
 def float_property_decorator(func):
     @property
+    @wraps(func)
     def wrapper(*args):
         index = args[0]._index
         prop = func(*args)
@@ -46,10 +50,10 @@ def float_property_decorator(func):
 
 def most_recent_decorator(func):
     @property
+    @wraps(func)
     def wrapper(*args):
         season = args[0]._most_recent_season
-        seasons = args[0]._season
-        index = seasons.index(season)
+        index = args[0]._season_index[season]
         prop = func(*args)
         return prop[index]
     return wrapper
@@ -83,6 +87,7 @@ class Player(object):
     def __init__(self, player_id):
         self._most_recent_season = ''
         self._index = None
+        self._season_index = {}
         self._player_id = player_id
         self._season = None
         self._name = None
@@ -155,10 +160,10 @@ class Player(object):
         """
         url = PLAYER_URL % self._player_id
         try:
-            url_data = pq(url)
+            url_data = fetch.get_page(url)
         except:
             return None
-        return pq(utils._remove_html_comment_tags(url_data))
+        return utils._uncomment(url_data)
 
     def _parse_season(self, row):
         """
@@ -196,31 +201,28 @@ class Player(object):
         career_stats : generator
             A generator where each element is a row in the footer of a stats
             table. Career stats are kept in the footer, hence the usage.
-        all_stats_dict : dictionary
-            A dictionary of all stats separated by season where each key is the
-            season ``string``, such as '2017-18', and the value is a
-            ``dictionary`` with a ``string`` of 'data' and ``string``
-            containing all of the data.
+        all_stats_dict : OrderedDict
+            An OrderedDict of all stats separated by season where each key is
+            the season ``string``, such as '2017-18', and the value is a
+            ``dictionary`` with a ``string`` of 'data' and a ``list`` of every
+            row element for the season.
 
         Returns
         -------
-        dictionary
+        OrderedDict
             Returns an updated version of the passed all_stats_dict which
-            includes more metrics from the provided table.
+            includes more metrics from the provided table. Seasons are kept in
+            the order they are listed in the tables.
         """
         most_recent_season = ''
         for row in table_rows:
             season = self._parse_season(row)
-            try:
-                all_stats_dict[season]['data'] += str(row)
-            except KeyError:
-                all_stats_dict[season] = {'data': str(row)}
+            all_stats_dict.setdefault(season, {'data': []})['data'] \
+                .extend(row)
             most_recent_season = season
         self._most_recent_season = most_recent_season
-        try:
-            all_stats_dict['career']['data'] += str(next(career_stats))
-        except KeyError:
-            all_stats_dict['career'] = {'data': str(next(career_stats))}
+        all_stats_dict.setdefault('career', {'data': []})['data'] \
+            .extend(next(career_stats))
         return all_stats_dict
 
     def _combine_all_stats(self, player_info):
@@ -239,11 +241,13 @@ class Player(object):
 
         Returns
         -------
-        dictionary
-            Returns a dictionary where all stats from each table are combined
-            by season to allow easy queries by year.
+        OrderedDict
+            Returns an OrderedDict where all stats from each table are combined
+            by season to allow easy queries by year. The rows for each season
+            are kept as a single PyQuery object so every field for the season
+            is served from the same index of its cells.
         """
-        all_stats_dict = {}
+        all_stats_dict = OrderedDict()
 
         for table_id in ['players_totals', 'players_advanced']:
             table_items = utils._get_stats_table(player_info,
@@ -254,6 +258,8 @@ class Player(object):
             all_stats_dict = self._combine_season_stats(table_items,
                                                         career_items,
                                                         all_stats_dict)
+        for data in all_stats_dict.values():
+            data['data'] = pq(data['data'])
         return all_stats_dict
 
     def _parse_player_information(self, player_info, field):
@@ -315,7 +321,7 @@ class Player(object):
         string
             Returns a string of the conference abbreviation, such as 'big-12'.
         """
-        conference_tag = stats(PLAYER_SCHEME['conference'])
+        conference_tag = utils._select(PLAYER_SCHEME, stats, 'conference')
         conference = re.sub(r'.*/cbb/conferences/',
                             '',
                             str(conference_tag('a')))
@@ -340,7 +346,7 @@ class Player(object):
             Returns a string of the team's abbreviation, such as 'PURDUE' for
             the Purdue Boilermakers.
         """
-        team_tag = stats(PLAYER_SCHEME['team_abbreviation'])
+        team_tag = utils._select(PLAYER_SCHEME, stats, 'team_abbreviation')
         team = re.sub(r'.*/cbb/schools/', '', str(team_tag('a')))
         team = re.sub(r'/.*', '', team)
         return team
@@ -360,6 +366,7 @@ class Player(object):
             short_field = str(field)[1:]
             if short_field == 'player_id' or \
                short_field == 'index' or \
+               short_field == 'season_index' or \
                short_field == 'most_recent_season':
                 continue
             if short_field == 'name' or \
@@ -372,8 +379,8 @@ class Player(object):
                 setattr(self, field, value)
                 continue
             field_stats = []
-            for year, data in all_stats_dict.items():
-                stats = pq(data['data'])
+            for data in all_stats_dict.values():
+                stats = data['data']
                 if short_field == 'conference':
                     value = self._parse_conference(stats)
                 elif short_field == 'team_abbreviation':
@@ -391,14 +398,13 @@ class Player(object):
 
         When the Player class is instantiated, the default stats to pull are
         the player's career stats. Upon being called, the index of the 'Career'
-        element should be the index value.
+        element should be the index value. The index of every season is stored
+        as well so any season can be looked up directly.
         """
-        index = 0
-        for season in self._season:
-            if season == 'Career':
-                self._index = index
-                break
-            index += 1
+        self._season_index = {}
+        for index, season in enumerate(self._season):
+            self._season_index.setdefault(season, index)
+        self._index = self._season_index.get('Career', self._index)
 
     def __call__(self, requested_season=''):
         """
@@ -422,12 +428,7 @@ class Player(object):
         if requested_season.lower() == 'career' or \
            requested_season == '':
             requested_season = 'Career'
-        index = 0
-        for season in self._season:
-            if season == requested_season:
-                self._index = index
-                break
-            index += 1
+        self._index = self._season_index.get(requested_season, self._index)
         return self
 
     def _dataframe_fields(self):
@@ -502,6 +503,7 @@ class Player(object):
         return fields_to_include
 
     @property
+    @instrument.timed('build')
     def dataframe(self):
         """
         Returns a ``pandas DataFrame`` containing all other relevant class
@@ -512,7 +514,7 @@ class Player(object):
         rows = []
         indices = []
         for season in self._season:
-            self._index = self._season.index(season)
+            self._index = self._season_index[season]
             rows.append(self._dataframe_fields())
             indices.append(season)
         self._index = temp_index
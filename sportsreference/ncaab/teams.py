@@ -5,13 +5,12 @@ from .constants import (ADVANCED_OPPONENT_STATS_URL,
                         BASIC_OPPONENT_STATS_URL,
                         BASIC_STATS_URL,
                         PARSING_SCHEME)
-from pyquery import PyQuery as pq
-from .. import utils
+from .. import export, instrument, memo, utils
 from .conferences import Conferences
 from .schedule import Schedule
 
 
-class Team(object):
+class Team(memo.Memoized):
     """
     An object containing all of a team's season information.
 
@@ -30,6 +29,11 @@ class Team(object):
     year : string (optional)
         The requested year to pull stats from.
     """
+    __slots__ = utils._slots(PARSING_SCHEME,
+                             include=['team_conference', 'year',
+                                      'abbreviation'],
+                             exclude=['opp_minutes_played'])
+
     def __init__(self, team_data, team_conference=None, year=None):
         self._team_conference = team_conference
         self._year = year
@@ -137,7 +141,7 @@ class Team(object):
             multiple tables are being referenced, this will be comprised of
             multiple rows in a single string.
         """
-        for field in self.__dict__:
+        for field in self.__slots__:
             if field == '_year' or \
                field == '_team_conference':
                 continue
@@ -147,14 +151,12 @@ class Team(object):
                                        str(field)[1:])
             setattr(self, field, value)
 
-    @property
-    def dataframe(self):
+    def _dataframe_fields(self):
         """
-        Returns a pandas DataFrame containing all other class properties and
-        values. The index for the DataFrame is the string abbreviation of the
-        team, such as 'PURDUE'.
+        Returns a dictionary of every value included in the DataFrame, where
+        each key is the name of a column.
         """
-        fields_to_include = {
+        return {
             'abbreviation': self.abbreviation,
             'assist_percentage': self.assist_percentage,
             'assists': self.assists,
@@ -253,7 +255,17 @@ class Team(object):
             'win_percentage': self.win_percentage,
             'wins': self.wins
         }
-        return pd.DataFrame([fields_to_include], index=[self._abbreviation])
+
+    @property
+    @instrument.timed('build')
+    def dataframe(self):
+        """
+        Returns a pandas DataFrame containing all other class properties and
+        values. The index for the DataFrame is the string abbreviation of the
+        team, such as 'PURDUE'.
+        """
+        return pd.DataFrame([self._dataframe_fields()],
+                            index=[self._abbreviation])
 
     @property
     def conference(self):
@@ -272,6 +284,7 @@ class Team(object):
         return self._abbreviation
 
     @property
+    @memo.memoized('schedule', '_abbreviation', '_year')
     def schedule(self):
         """
         Returns an instance of the Schedule class containing the team's
@@ -1096,16 +1109,14 @@ class Teams:
 
         if not year:
             year = utils._find_year_for_season('ncaab')
-        doc = pq(BASIC_STATS_URL % year)
-        teams_list = utils._get_stats_table(doc, 'table#basic_school_stats')
-        doc = pq(BASIC_OPPONENT_STATS_URL % year)
-        opp_list = utils._get_stats_table(doc, 'table#basic_opp_stats')
-        doc = pq(ADVANCED_STATS_URL % year)
-        adv_teams_list = utils._get_stats_table(doc, 'table#adv_school_stats')
-        doc = pq(ADVANCED_OPPONENT_STATS_URL % year)
-        adv_opp_list = utils._get_stats_table(doc, 'table#adv_opp_stats')
-
-        for stats_list in [teams_list, opp_list, adv_teams_list, adv_opp_list]:
+        stats_lists = utils._pull_stats_tables([
+            (BASIC_STATS_URL % year, ['table#basic_school_stats']),
+            (BASIC_OPPONENT_STATS_URL % year, ['table#basic_opp_stats']),
+            (ADVANCED_STATS_URL % year, ['table#adv_school_stats']),
+            (ADVANCED_OPPONENT_STATS_URL % year, ['table#adv_opp_stats'])
+        ])
+
+        for stats_list in stats_lists:
             team_data_dict = self._add_stats_data(stats_list, team_data_dict)
 
         for team_name, team_data in team_data_dict.items():
@@ -1115,12 +1126,42 @@ class Teams:
             self._teams.append(team)
 
     @property
+    @instrument.timed('build')
     def dataframes(self):
         """
         Returns a pandas DataFrame where each row is a representation of the
         Team class. Rows are indexed by the team abbreviation.
         """
-        frames = []
+        rows = []
+        index = []
         for team in self.__iter__():
-            frames.append(team.dataframe)
-        return pd.concat(frames)
+            rows.append(team._dataframe_fields())
+            index.append(team._abbreviation)
+        return utils._dataframe_from_rows(rows, index)
+
+    def to_arrow(self):
+        """
+        Returns a ``pyarrow Table`` where each row is a representation of the
+        Team class, typed by the schema declared in the league's constants.
+        Requires pyarrow.
+        """
+        return export.to_arrow(self.__iter__())
+
+    def to_parquet(self, path, batch_size=export.DEFAULT_BATCH_SIZE):
+        """
+        Write every row of the 'to_arrow' table to a Parquet file. Requires
+        pyarrow.
+
+        Parameters
+        ----------
+        path : string
+            The path of the Parquet file to create.
+        batch_size : int (optional)
+            The number of rows to write in each row group.
+
+        Returns
+        -------
+        int
+            The number of rows written.
+        """
+        return export.to_parquet(path, self.__iter__(), batch_size)
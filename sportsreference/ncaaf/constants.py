@@ -1,4 +1,7 @@
-PARSING_SCHEME = {
+from .. import utils
+
+
+PARSING_SCHEME = utils.CompiledScheme({
     'name': 'a',
     'conference': 'td[data-stat="conf_abbr"] a',
     'games': 'td[data-stat="g"]:first',
@@ -36,9 +39,47 @@ PARSING_SCHEME = {
     'first_downs': 'td[data-stat="first_down"]:first',
     'penalties': 'td[data-stat="penalty"]:first',
     'yards_from_penalties': 'td[data-stat="penalty_yds"]:first'
+})
+
+# The Arrow type of every column exported from the Team class.
+TEAM_TYPES = {
+    'abbreviation': 'string',
+    'conference_losses': 'int64',
+    'conference_win_percentage': 'float64',
+    'conference_wins': 'int64',
+    'first_downs': 'float64',
+    'first_downs_from_penalties': 'float64',
+    'fumbles_lost': 'float64',
+    'games': 'int64',
+    'interceptions': 'float64',
+    'losses': 'int64',
+    'name': 'string',
+    'pass_attempts': 'float64',
+    'pass_completion_percentage': 'float64',
+    'pass_completions': 'float64',
+    'pass_first_downs': 'float64',
+    'pass_touchdowns': 'float64',
+    'pass_yards': 'float64',
+    'penalties': 'float64',
+    'plays': 'float64',
+    'points_against_per_game': 'float64',
+    'points_per_game': 'float64',
+    'rush_attempts': 'float64',
+    'rush_first_downs': 'float64',
+    'rush_touchdowns': 'float64',
+    'rush_yards': 'float64',
+    'rush_yards_per_attempt': 'float64',
+    'simple_rating_system': 'float64',
+    'strength_of_schedule': 'float64',
+    'turnovers': 'float64',
+    'win_percentage': 'float64',
+    'wins': 'int64',
+    'yards': 'float64',
+    'yards_from_penalties': 'float64',
+    'yards_per_play': 'float64'
 }
 
-SCHEDULE_SCHEME = {
+SCHEDULE_SCHEME = utils.CompiledScheme({
     'game': 'th[data-stat="g"]:first',
     'date': 'td[data-stat="date_game"]:first',
     'time': 'td[data-stat="time_game"]:first',
@@ -55,9 +96,31 @@ SCHEDULE_SCHEME = {
     'wins': 'td[data-stat="wins"]:first',
     'losses': 'td[data-stat="losses"]:first',
     'streak': 'td[data-stat="game_streak"]:first'
+})
+
+# The Arrow type of every column exported from the Game class.
+SCHEDULE_TYPES = {
+    'boxscore_index': 'string',
+    'date': 'string',
+    'datetime': 'timestamp',
+    'day_of_week': 'string',
+    'game': 'int64',
+    'location': 'string',
+    'losses': 'int64',
+    'opponent_abbr': 'string',
+    'opponent_conference': 'string',
+    'opponent_name': 'string',
+    'opponent_rank': 'int64',
+    'points_against': 'int64',
+    'points_for': 'int64',
+    'rank': 'int64',
+    'result': 'string',
+    'streak': 'string',
+    'time': 'string',
+    'wins': 'int64'
 }
 
-BOXSCORE_SCHEME = {
+BOXSCORE_SCHEME = utils.CompiledScheme({
     'date': 'div[class="scorebox_meta"]:first',
     'time': 'div[class="scorebox_meta"]:first',
     'stadium': 'div[class="scorebox_meta"]:first',
@@ -113,9 +176,9 @@ BOXSCORE_SCHEME = {
     'home_fourth_down_conversions': 'td[data-stat="home_stat"]',
     'home_fourth_down_attempts': 'td[data-stat="home_stat"]',
     'home_time_of_possession': 'td[data-stat="home_stat"]'
-}
+})
 
-BOXSCORE_SCHEME = {
+BOXSCORE_SCHEME = utils.CompiledScheme({
     'date': 'div[class="scorebox_meta"]:first',
     'time': 'div[class="scorebox_meta"]:first',
     'stadium': 'div[class="scorebox_meta"]:first',
@@ -153,6 +216,51 @@ BOXSCORE_SCHEME = {
     'home_turnovers': 'td[data-stat="home_stat"]',
     'home_penalties': 'td[data-stat="home_stat"]',
     'home_yards_from_penalties': 'td[data-stat="home_stat"]',
+})
+
+# The Arrow type of every column exported from the Boxscore class.
+BOXSCORE_TYPES = {
+    'away_first_downs': 'int64',
+    'away_fumbles': 'int64',
+    'away_fumbles_lost': 'int64',
+    'away_interceptions': 'int64',
+    'away_pass_attempts': 'int64',
+    'away_pass_completions': 'int64',
+    'away_pass_touchdowns': 'int64',
+    'away_pass_yards': 'int64',
+    'away_penalties': 'int64',
+    'away_points': 'int64',
+    'away_rush_attempts': 'int64',
+    'away_rush_touchdowns': 'int64',
+    'away_rush_yards': 'int64',
+    'away_total_yards': 'int64',
+    'away_turnovers': 'int64',
+    'away_yards_from_penalties': 'int64',
+    'boxscore': 'string',
+    'date': 'string',
+    'home_first_downs': 'int64',
+    'home_fumbles': 'int64',
+    'home_fumbles_lost': 'int64',
+    'home_interceptions': 'int64',
+    'home_pass_attempts': 'int64',
+    'home_pass_completions': 'int64',
+    'home_pass_touchdowns': 'int64',
+    'home_pass_yards': 'int64',
+    'home_penalties': 'int64',
+    'home_points': 'int64',
+    'home_rush_attempts': 'int64',
+    'home_rush_touchdowns': 'int64',
+    'home_rush_yards': 'int64',
+    'home_total_yards': 'int64',
+    'home_turnovers': 'int64',
+    'home_yards_from_penalties': 'int64',
+    'losing_abbr': 'string',
+    'losing_name': 'string',
+    'stadium': 'string',
+    'time': 'string',
+    'winner': 'string',
+    'winning_abbr': 'string',
+    'winning_name': 'string'
 }
 
 BOXSCORE_ELEMENT_INDEX = {
@@ -1,12 +1,11 @@
 import pandas as pd
 import re
 from .constants import PARSING_SCHEME, OFFENSIVE_STATS_URL, SEASON_PAGE_URL
-from pyquery import PyQuery as pq
-from .. import utils
+from .. import export, fetch, instrument, memo, utils
 from .schedule import Schedule
 
 
-class Team(object):
+class Team(memo.Memoized):
     """
     An object containing all of a team's season information.
 
@@ -23,6 +22,11 @@ class Team(object):
     year : string (optional)
         The requested year to pull stats from.
     """
+    __slots__ = utils._slots(PARSING_SCHEME,
+                             include=['year', 'abbreviation'],
+                             exclude=['conference', 'current_rank',
+                                      'preseason_rank', 'highest_rank'])
+
     def __init__(self, team_data, year=None):
         self._year = year
         self._abbreviation = None
@@ -81,7 +85,7 @@ class Team(object):
             multiple tables are being referenced, this will be comprised of
             multiple rows in a single string.
         """
-        for field in self.__dict__:
+        for field in self.__slots__:
             if field == '_year':
                 continue
             value = utils._parse_field(PARSING_SCHEME,
@@ -89,14 +93,12 @@ class Team(object):
                                        str(field)[1:])
             setattr(self, field, value)
 
-    @property
-    def dataframe(self):
+    def _dataframe_fields(self):
         """
-        Returns a pandas DataFrame containing all other class properties and
-        values. The index for the DataFrame is the string abbreviation of the
-        team, such as 'PURDUE'.
+        Returns a dictionary of every value included in the DataFrame, where
+        each key is the name of a column.
         """
-        fields_to_include = {
+        return {
             'abbreviation': self.abbreviation,
             'conference_losses': self.conference_losses,
             'conference_win_percentage': self.conference_win_percentage,
@@ -132,7 +134,17 @@ class Team(object):
             'yards_from_penalties': self.yards_from_penalties,
             'yards_per_play': self.yards_per_play
         }
-        return pd.DataFrame([fields_to_include], index=[self._abbreviation])
+
+    @property
+    @instrument.timed('build')
+    def dataframe(self):
+        """
+        Returns a pandas DataFrame containing all other class properties and
+        values. The index for the DataFrame is the string abbreviation of the
+        team, such as 'PURDUE'.
+        """
+        return pd.DataFrame([self._dataframe_fields()],
+                            index=[self._abbreviation])
 
     @property
     def abbreviation(self):
@@ -143,6 +155,7 @@ class Team(object):
         return self._abbreviation
 
     @property
+    @memo.memoized('schedule', '_abbreviation', '_year')
     def schedule(self):
         """
         Returns an instance of the Schedule class containing the team's
@@ -557,9 +570,9 @@ class Teams:
 
         if not year:
             year = utils._find_year_for_season('ncaaf')
-        doc = pq(SEASON_PAGE_URL % year)
+        doc = fetch.get_page(SEASON_PAGE_URL % year)
         teams_list = utils._get_stats_table(doc, 'div#div_standings')
-        offense_doc = pq(OFFENSIVE_STATS_URL % year)
+        offense_doc = fetch.get_page(OFFENSIVE_STATS_URL % year)
         offense_list = utils._get_stats_table(offense_doc, 'table#offense')
         for stats_list in [teams_list, offense_list]:
             team_data_dict = self._add_stats_data(stats_list, team_data_dict)
@@ -569,12 +582,42 @@ class Teams:
             self._teams.append(team)
 
     @property
+    @instrument.timed('build')
     def dataframes(self):
         """
         Returns a pandas DataFrame where each row is a representation of the
         Team class. Rows are indexed by the team abbreviation.
         """
-        frames = []
+        rows = []
+        index = []
         for team in self.__iter__():
-            frames.append(team.dataframe)
-        return pd.concat(frames)
+            rows.append(team._dataframe_fields())
+            index.append(team._abbreviation)
+        return utils._dataframe_from_rows(rows, index)
+
+    def to_arrow(self):
+        """
+        Returns a ``pyarrow Table`` where each row is a representation of the
+        Team class, typed by the schema declared in the league's constants.
+        Requires pyarrow.
+        """
+        return export.to_arrow(self.__iter__())
+
+    def to_parquet(self, path, batch_size=export.DEFAULT_BATCH_SIZE):
+        """
+        Write every row of the 'to_arrow' table to a Parquet file. Requires
+        pyarrow.
+
+        Parameters
+        ----------
+        path : string
+            The path of the Parquet file to create.
+        batch_size : int (optional)
+            The number of rows to write in each row group.
+
+        Returns
+        -------
+        int
+            The number of rows written.
+        """
+        return export.to_parquet(path, self.__iter__(), batch_size)
@@ -1,4 +1,7 @@
-PARSING_SCHEME = {
+from .. import utils
+
+
+PARSING_SCHEME = utils.CompiledScheme({
     'name': 'a',
     'games_played': 'td[data-stat="g"]:first',
     'wins': 'td[data-stat="wins"]:first',
@@ -36,9 +39,52 @@ PARSING_SCHEME = {
     'percent_drives_with_points': 'td[data-stat="score_pct"]:first',
     'percent_drives_with_turnovers': 'td[data-stat="turnover_pct"]:first',
     'points_contributed_by_offense': 'td[data-stat="exp_pts_tot"]:first'
+})
+
+# The Arrow type of every column exported from the Team class.
+TEAM_TYPES = {
+    'abbreviation': 'string',
+    'defensive_simple_rating_system': 'float64',
+    'first_downs': 'int64',
+    'first_downs_from_penalties': 'int64',
+    'fumbles': 'int64',
+    'games_played': 'int64',
+    'interceptions': 'int64',
+    'losses': 'int64',
+    'margin_of_victory': 'float64',
+    'name': 'string',
+    'offensive_simple_rating_system': 'float64',
+    'pass_attempts': 'int64',
+    'pass_completions': 'int64',
+    'pass_first_downs': 'int64',
+    'pass_net_yards_per_attempt': 'float64',
+    'pass_touchdowns': 'int64',
+    'pass_yards': 'int64',
+    'penalties': 'int64',
+    'percent_drives_with_points': 'float64',
+    'percent_drives_with_turnovers': 'float64',
+    'plays': 'int64',
+    'points_against': 'int64',
+    'points_contributed_by_offense': 'float64',
+    'points_difference': 'int64',
+    'points_for': 'int64',
+    'rank': 'int64',
+    'rush_attempts': 'int64',
+    'rush_first_downs': 'int64',
+    'rush_touchdowns': 'int64',
+    'rush_yards': 'int64',
+    'rush_yards_per_attempt': 'float64',
+    'simple_rating_system': 'float64',
+    'strength_of_schedule': 'float64',
+    'turnovers': 'int64',
+    'win_percentage': 'float64',
+    'wins': 'int64',
+    'yards': 'int64',
+    'yards_from_penalties': 'int64',
+    'yards_per_play': 'float64'
 }
 
-SCHEDULE_SCHEME = {
+SCHEDULE_SCHEME = utils.CompiledScheme({
     'week': 'th[data-stat="week_num"]:first',
     'day': 'td[data-stat="game_day_of_week"]:first',
     'date': 'td[data-stat="game_date"]:first',
@@ -73,9 +119,51 @@ SCHEDULE_SCHEME = {
     'fourth_down_conversions': 'td[data-stat="fourth_down_success"]:first',
     'fourth_down_attempts': 'td[data-stat="fourth_down_att"]:first',
     'time_of_possession': 'td[data-stat="time_of_poss"]:first'
+})
+
+# The Arrow type of every column exported from the Game class.
+SCHEDULE_TYPES = {
+    'boxscore_index': 'string',
+    'date': 'string',
+    'datetime': 'timestamp',
+    'day': 'string',
+    'extra_points_attempted': 'int64',
+    'extra_points_made': 'int64',
+    'field_goals_attempted': 'int64',
+    'field_goals_made': 'int64',
+    'fourth_down_attempts': 'int64',
+    'fourth_down_conversions': 'int64',
+    'interceptions': 'int64',
+    'location': 'string',
+    'opponent_abbr': 'string',
+    'opponent_name': 'string',
+    'overtime': 'bool',
+    'pass_attempts': 'int64',
+    'pass_completion_rate': 'float64',
+    'pass_completions': 'int64',
+    'pass_touchdowns': 'int64',
+    'pass_yards': 'int64',
+    'pass_yards_per_attempt': 'float64',
+    'points_allowed': 'int64',
+    'points_scored': 'int64',
+    'punt_yards': 'int64',
+    'punts': 'int64',
+    'quarterback_rating': 'float64',
+    'result': 'string',
+    'rush_attempts': 'int64',
+    'rush_touchdowns': 'int64',
+    'rush_yards': 'int64',
+    'rush_yards_per_attempt': 'float64',
+    'third_down_attempts': 'int64',
+    'third_down_conversions': 'int64',
+    'time_of_possession': 'string',
+    'times_sacked': 'int64',
+    'type': 'string',
+    'week': 'int64',
+    'yards_lost_from_sacks': 'int64'
 }
 
-BOXSCORE_SCHEME = {
+BOXSCORE_SCHEME = utils.CompiledScheme({
     'date': 'div[class="scorebox_meta"]:first',
     'time': 'div[class="scorebox_meta"]:first',
     'stadium': 'div[class="scorebox_meta"]:first',
@@ -131,6 +219,69 @@ BOXSCORE_SCHEME = {
     'home_fourth_down_conversions': 'td[data-stat="home_stat"]',
     'home_fourth_down_attempts': 'td[data-stat="home_stat"]',
     'home_time_of_possession': 'td[data-stat="home_stat"]'
+})
+
+# The Arrow type of every column exported from the Boxscore class.
+BOXSCORE_TYPES = {
+    'attendance': 'int64',
+    'away_first_downs': 'int64',
+    'away_fourth_down_attempts': 'int64',
+    'away_fourth_down_conversions': 'int64',
+    'away_fumbles': 'int64',
+    'away_fumbles_lost': 'int64',
+    'away_interceptions': 'int64',
+    'away_net_pass_yards': 'int64',
+    'away_pass_attempts': 'int64',
+    'away_pass_completions': 'int64',
+    'away_pass_touchdowns': 'int64',
+    'away_pass_yards': 'int64',
+    'away_penalties': 'int64',
+    'away_points': 'int64',
+    'away_rush_attempts': 'int64',
+    'away_rush_touchdowns': 'int64',
+    'away_rush_yards': 'int64',
+    'away_third_down_attempts': 'int64',
+    'away_third_down_conversions': 'int64',
+    'away_time_of_possession': 'string',
+    'away_times_sacked': 'int64',
+    'away_total_yards': 'int64',
+    'away_turnovers': 'int64',
+    'away_yards_from_penalties': 'int64',
+    'away_yards_lost_from_sacks': 'int64',
+    'boxscore': 'string',
+    'date': 'string',
+    'duration': 'string',
+    'home_first_downs': 'int64',
+    'home_fourth_down_attempts': 'int64',
+    'home_fourth_down_conversions': 'int64',
+    'home_fumbles': 'int64',
+    'home_fumbles_lost': 'int64',
+    'home_interceptions': 'int64',
+    'home_net_pass_yards': 'int64',
+    'home_pass_attempts': 'int64',
+    'home_pass_completions': 'int64',
+    'home_pass_touchdowns': 'int64',
+    'home_pass_yards': 'int64',
+    'home_penalties': 'int64',
+    'home_points': 'int64',
+    'home_rush_attempts': 'int64',
+    'home_rush_touchdowns': 'int64',
+    'home_rush_yards': 'int64',
+    'home_third_down_attempts': 'int64',
+    'home_third_down_conversions': 'int64',
+    'home_time_of_possession': 'string',
+    'home_times_sacked': 'int64',
+    'home_total_yards': 'int64',
+    'home_turnovers': 'int64',
+    'home_yards_from_penalties': 'int64',
+    'home_yards_lost_from_sacks': 'int64',
+    'losing_abbr': 'string',
+    'losing_name': 'string',
+    'stadium': 'string',
+    'time': 'string',
+    'winner': 'string',
+    'winning_abbr': 'string',
+    'winning_name': 'string'
 }
 
 BOXSCORE_ELEMENT_INDEX = {
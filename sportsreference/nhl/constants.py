@@ -1,4 +1,7 @@
-PARSING_SCHEME = {
+from .. import utils
+
+
+PARSING_SCHEME = utils.CompiledScheme({
     'name': 'a',
     'average_age': 'td[data-stat="average_age"]:first',
     'games_played': 'td[data-stat="games"]:first',
@@ -25,9 +28,41 @@ PARSING_SCHEME = {
     'shots_against': 'td[data-stat="shots_against"]:first',
     'save_percentage': 'td[data-stat="save_pct"]:first',
     'pdo_at_even_strength': 'td[data-stat="pdo"]:first'
+})
+
+# The Arrow type of every column exported from the Team class.
+TEAM_TYPES = {
+    'abbreviation': 'string',
+    'average_age': 'float64',
+    'games_played': 'int64',
+    'goals_against': 'int64',
+    'goals_for': 'int64',
+    'losses': 'int64',
+    'name': 'string',
+    'overtime_losses': 'int64',
+    'pdo_at_even_strength': 'float64',
+    'penalty_killing_percentage': 'float64',
+    'points': 'int64',
+    'points_percentage': 'float64',
+    'power_play_goals': 'int64',
+    'power_play_goals_against': 'int64',
+    'power_play_opportunities': 'int64',
+    'power_play_opportunities_against': 'int64',
+    'power_play_percentage': 'float64',
+    'rank': 'int64',
+    'save_percentage': 'float64',
+    'shooting_percentage': 'float64',
+    'short_handed_goals': 'int64',
+    'short_handed_goals_against': 'int64',
+    'shots_against': 'int64',
+    'shots_on_goal': 'int64',
+    'simple_rating_system': 'float64',
+    'strength_of_schedule': 'float64',
+    'total_goals_per_game': 'float64',
+    'wins': 'int64'
 }
 
-SCHEDULE_SCHEME = {
+SCHEDULE_SCHEME = utils.CompiledScheme({
     'game': 'th[data-stat="games"]:first',
     'date': 'td[data-stat="date_game"]:first',
     'time': 'td[data-stat="time_game"]:first',
@@ -59,9 +94,45 @@ SCHEDULE_SCHEME = {
     'faceoff_win_percentage': 'td[data-stat="faceoff_percentage"]:first',
     'offensive_zone_start_percentage': 'td[data-stat="zs_offense_pct"]:first',
     'pdo': 'td[data-stat="pdo"]:first'
+})
+
+# The Arrow type of every column exported from the Game class.
+SCHEDULE_TYPES = {
+    'boxscore_index': 'string',
+    'corsi_against': 'int64',
+    'corsi_for': 'int64',
+    'corsi_for_percentage': 'float64',
+    'date': 'string',
+    'datetime': 'timestamp',
+    'faceoff_losses': 'int64',
+    'faceoff_win_percentage': 'float64',
+    'faceoff_wins': 'int64',
+    'fenwick_against': 'int64',
+    'fenwick_for': 'int64',
+    'fenwick_for_percentage': 'float64',
+    'game': 'int64',
+    'goals_allowed': 'int64',
+    'goals_scored': 'int64',
+    'location': 'string',
+    'offensive_zone_start_percentage': 'float64',
+    'opp_penalties_in_minutes': 'int64',
+    'opp_power_play_goals': 'int64',
+    'opp_power_play_opportunities': 'int64',
+    'opp_short_handed_goals': 'int64',
+    'opp_shots_on_goal': 'int64',
+    'opponent_abbr': 'string',
+    'opponent_name': 'string',
+    'overtime': 'int64',
+    'pdo': 'float64',
+    'penalties_in_minutes': 'int64',
+    'power_play_goals': 'int64',
+    'power_play_opportunities': 'int64',
+    'result': 'string',
+    'short_handed_goals': 'int64',
+    'shots_on_goal': 'int64'
 }
 
-BOXSCORE_SCHEME = {
+BOXSCORE_SCHEME = utils.CompiledScheme({
     'date': 'div[class="scorebox_meta"]',
     'time': 'div[class="scorebox_meta"]',
     'arena': 'div[class="scorebox_meta"]',
@@ -103,6 +174,53 @@ BOXSCORE_SCHEME = {
     'home_saves': 'td[data-stat="saves"]',
     'home_save_percentage': 'td[data-stat="save_pct"]',
     'home_shutout': 'td[data-stat="shutouts"]'
+})
+
+# The Arrow type of every column exported from the Boxscore class.
+BOXSCORE_TYPES = {
+    'arena': 'string',
+    'attendance': 'int64',
+    'away_assists': 'int64',
+    'away_even_strength_assists': 'int64',
+    'away_even_strength_goals': 'int64',
+    'away_game_winning_goals': 'int64',
+    'away_goals': 'int64',
+    'away_penalties_in_minutes': 'int64',
+    'away_points': 'int64',
+    'away_power_play_assists': 'int64',
+    'away_power_play_goals': 'int64',
+    'away_save_percentage': 'float64',
+    'away_saves': 'int64',
+    'away_shooting_percentage': 'float64',
+    'away_short_handed_assists': 'int64',
+    'away_short_handed_goals': 'int64',
+    'away_shots_on_goal': 'int64',
+    'away_shutout': 'int64',
+    'boxscore': 'string',
+    'date': 'string',
+    'duration': 'string',
+    'home_assists': 'int64',
+    'home_even_strength_assists': 'int64',
+    'home_even_strength_goals': 'int64',
+    'home_game_winning_goals': 'int64',
+    'home_goals': 'int64',
+    'home_penalties_in_minutes': 'int64',
+    'home_points': 'int64',
+    'home_power_play_assists': 'int64',
+    'home_power_play_goals': 'int64',
+    'home_save_percentage': 'float64',
+    'home_saves': 'int64',
+    'home_shooting_percentage': 'float64',
+    'home_short_handed_assists': 'int64',
+    'home_short_handed_goals': 'int64',
+    'home_shots_on_goal': 'int64',
+    'home_shutout': 'int64',
+    'losing_abbr': 'string',
+    'losing_name': 'string',
+    'time': 'string',
+    'winner': 'string',
+    'winning_abbr': 'string',
+    'winning_name': 'string'
 }
 
 BOXSCORE_ELEMENT_INDEX = {
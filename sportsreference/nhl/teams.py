@@ -1,12 +1,11 @@
 import pandas as pd
 import re
 from .constants import PARSING_SCHEME, SEASON_PAGE_URL
-from pyquery import PyQuery as pq
-from .. import utils
+from .. import export, fetch, instrument, memo, utils
 from .schedule import Schedule
 
 
-class Team:
+class Team(memo.Memoized):
     """
     An object containing all of a team's season information.
 
@@ -26,6 +25,9 @@ class Team:
     year : string (optional)
         The requested year to pull stats from.
     """
+    __slots__ = utils._slots(PARSING_SCHEME,
+                             include=['year', 'rank', 'abbreviation'])
+
     def __init__(self, team_data, rank, year=None):
         self._year = year
         self._rank = rank
@@ -78,7 +80,7 @@ class Team:
             multiple tables are being referenced, this will be comprised of
             multiple rows in a single string.
         """
-        for field in self.__dict__:
+        for field in self.__slots__:
             # The rank attribute is passed directly to the class during
             # instantiation.
             if field == '_rank' or \
@@ -89,14 +91,12 @@ class Team:
                                        str(field)[1:])
             setattr(self, field, value)
 
-    @property
-    def dataframe(self):
+    def _dataframe_fields(self):
         """
-        Returns a pandas DataFrame containing all other class properties and
-        values. The index for the DataFrame is the string abbreviation of the
-        team, such as 'DET'.
+        Returns a dictionary of every value included in the DataFrame, where
+        each key is the name of a column.
         """
-        fields_to_include = {
+        return {
             'abbreviation': self.abbreviation,
             'average_age': self.average_age,
             'games_played': self.games_played,
@@ -127,7 +127,17 @@ class Team:
             'total_goals_per_game': self.total_goals_per_game,
             'wins': self.wins
         }
-        return pd.DataFrame([fields_to_include], index=[self._abbreviation])
+
+    @property
+    @instrument.timed('build')
+    def dataframe(self):
+        """
+        Returns a pandas DataFrame containing all other class properties and
+        values. The index for the DataFrame is the string abbreviation of the
+        team, such as 'DET'.
+        """
+        return pd.DataFrame([self._dataframe_fields()],
+                            index=[self._abbreviation])
 
     @property
     def rank(self):
@@ -146,6 +156,7 @@ class Team:
         return self._abbreviation
 
     @property
+    @memo.memoized('schedule', '_abbreviation', '_year')
     def schedule(self):
         """
         Returns an instance of the Schedule class containing the team's
@@ -463,7 +474,7 @@ class Teams:
         """
         if not year:
             year = utils._find_year_for_season('nhl')
-        doc = pq(SEASON_PAGE_URL % year)
+        doc = fetch.get_page(SEASON_PAGE_URL % year)
         teams_list = utils._get_stats_table(doc, 'div#all_stats')
         # Teams are listed in terms of rank with the first team being #1
         rank = 1
@@ -473,12 +484,42 @@ class Teams:
             rank += 1
 
     @property
+    @instrument.timed('build')
     def dataframes(self):
         """
         Returns a pandas DataFrame where each row is a representation of the
         Team class. Rows are indexed by the team abbreviation.
         """
-        frames = []
+        rows = []
+        index = []
         for team in self.__iter__():
-            frames.append(team.dataframe)
-        return pd.concat(frames)
+            rows.append(team._dataframe_fields())
+            index.append(team._abbreviation)
+        return utils._dataframe_from_rows(rows, index)
+
+    def to_arrow(self):
+        """
+        Returns a ``pyarrow Table`` where each row is a representation of the
+        Team class, typed by the schema declared in the league's constants.
+        Requires pyarrow.
+        """
+        return export.to_arrow(self.__iter__())
+
+    def to_parquet(self, path, batch_size=export.DEFAULT_BATCH_SIZE):
+        """
+        Write every row of the 'to_arrow' table to a Parquet file. Requires
+        pyarrow.
+
+        Parameters
+        ----------
+        path : string
+            The path of the Parquet file to create.
+        batch_size : int (optional)
+            The number of rows to write in each row group.
+
+        Returns
+        -------
+        int
+            The number of rows written.
+        """
+        return export.to_parquet(path, self.__iter__(), batch_size)
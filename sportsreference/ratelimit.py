@@ -0,0 +1,351 @@
+import os
+import random
+import re
+import tempfile
+import threading
+import time
+from email.utils import mktime_tz, parsedate_tz
+from requests.compat import urlparse
+try:
+    import fcntl
+except ImportError:
+    # File locks are only used to share buckets between processes. Without
+    # fcntl, such as on Windows, buckets are only shared between threads.
+    fcntl = None
+
+
+# sports-reference.com asks that automated clients make no more than 20
+# requests per minute to any one of its sites.
+DEFAULT_RATE = 20 / 60.0
+# Number of requests which can be made back-to-back before being paced.
+DEFAULT_BURST = 5
+# Number of times a throttled request is retried before giving up.
+DEFAULT_MAX_RETRIES = 5
+# Base and maximum number of seconds to wait between retries when the server
+# doesn't include a Retry-After header.
+DEFAULT_BACKOFF = 2.0
+DEFAULT_MAX_BACKOFF = 120.0
+# Status codes which indicate the server is throttling requests.
+RETRY_STATUS_CODES = (429, 503)
+# Directory holding the shared state of every bucket so all processes on the
+# machine pace their requests together.
+DEFAULT_DIRECTORY = os.path.join(tempfile.gettempdir(),
+                                 'sportsreference-ratelimit')
+
+
+def _retry_after(response):
+    """
+    Parse the number of seconds to wait from a Retry-After header.
+
+    Parameters
+    ----------
+    response : requests.Response
+        The throttled response.
+
+    Returns
+    -------
+    float
+        The number of seconds requested by the server, or None if the header
+        is missing or invalid.
+    """
+    headers = getattr(response, 'headers', None) or {}
+    value = headers.get('Retry-After')
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    parsed = parsedate_tz(value)
+    if parsed is None:
+        return None
+    return max(0.0, mktime_tz(parsed) - time.time())
+
+
+class TokenBucket(object):
+    """
+    A token bucket which paces requests to a sustained rate.
+
+    The bucket holds up to 'burst' tokens and is refilled at 'rate' tokens per
+    second. Every request consumes a single token, waiting for the bucket to
+    refill if it is empty. When given a path, the state of the bucket is kept
+    in that file and guarded with a file lock so every thread and process
+    using the same path shares a single bucket.
+
+    Parameters
+    ----------
+    rate : float
+        The sustained number of requests allowed per second.
+    burst : int
+        The maximum number of requests which can be made back-to-back.
+    path : string (optional)
+        The file to store the shared state of the bucket in. If None, the
+        bucket is only shared between threads in the current process.
+    """
+    def __init__(self, rate, burst, path=None):
+        self.rate = float(rate)
+        self.burst = float(burst)
+        self._path = path if fcntl else None
+        self._lock = threading.Lock()
+        self._tokens = self.burst
+        self._updated = time.time()
+        self._blocked_until = 0.0
+
+    def _load(self, state_file):
+        """
+        Load the shared state of the bucket from the locked state file.
+        """
+        state_file.seek(0)
+        try:
+            tokens, updated, blocked_until = state_file.read().split()
+            self._tokens = float(tokens)
+            self._updated = float(updated)
+            self._blocked_until = float(blocked_until)
+        except ValueError:
+            # The file is new or was corrupted, so start with a full bucket.
+            self._tokens = self.burst
+            self._updated = time.time()
+            self._blocked_until = 0.0
+
+    def _save(self, state_file):
+        """
+        Write the state of the bucket to the locked state file.
+        """
+        state_file.seek(0)
+        state_file.truncate()
+        state_file.write('%r %r %r' % (self._tokens,
+                                       self._updated,
+                                       self._blocked_until))
+        state_file.flush()
+
+    def _update(self, function):
+        """
+        Atomically update the state of the bucket.
+
+        Parameters
+        ----------
+        function : function
+            A function which accepts the current time, updates the state of
+            the bucket, and returns a result.
+
+        Returns
+        -------
+        The value returned by the function.
+        """
+        with self._lock:
+            if self._path is None:
+                return function(time.time())
+            with open(self._path, 'a+') as state_file:
+                fcntl.flock(state_file, fcntl.LOCK_EX)
+                try:
+                    self._load(state_file)
+                    result = function(time.time())
+                    self._save(state_file)
+                finally:
+                    fcntl.flock(state_file, fcntl.LOCK_UN)
+                return result
+
+    def _take(self, now):
+        """
+        Consume a token if one is available.
+
+        Parameters
+        ----------
+        now : float
+            The current time in seconds since the epoch.
+
+        Returns
+        -------
+        float
+            The number of seconds to wait before trying again, or 0 if a token
+            was consumed.
+        """
+        if now < self._blocked_until:
+            return self._blocked_until - now
+        elapsed = max(0.0, now - self._updated)
+        self._tokens = min(self.burst, self._tokens + elapsed * self.rate)
+        self._updated = now
+        if self._tokens >= 1:
+            self._tokens -= 1
+            return 0.0
+        return (1 - self._tokens) / self.rate
+
+    def acquire(self):
+        """
+        Wait until a token is available and consume it.
+        """
+        while True:
+            wait = self._update(self._take)
+            if wait <= 0:
+                return
+            time.sleep(wait)
+
+    def block(self, seconds):
+        """
+        Prevent any tokens from being consumed for the given duration.
+
+        Parameters
+        ----------
+        seconds : float
+            The number of seconds every user of the bucket should wait.
+        """
+        def _block(now):
+            self._blocked_until = max(self._blocked_until, now + seconds)
+            self._tokens = 0.0
+            self._updated = self._blocked_until
+
+        self._update(_block)
+
+
+class RateLimiter(object):
+    """
+    Pace requests to every sports-reference host.
+
+    Maintains a separate token bucket for each host so requests to
+    basketball-reference.com don't count against the limit for
+    hockey-reference.com, for example. Throttled responses are retried after
+    waiting for the time requested by the server's Retry-After header, or an
+    exponentially increasing, jittered delay if the header is missing. The
+    delay is applied to the host's bucket, pausing every thread and process
+    sharing the bucket.
+
+    Parameters
+    ----------
+    rate : float (optional)
+        The default sustained number of requests allowed per second for each
+        host.
+    burst : int (optional)
+        The default maximum number of requests which can be made back-to-back
+        to each host.
+    limits : dict (optional)
+        A dictionary which overrides the rate and burst for specific hosts,
+        where every key is a host such as 'www.basketball-reference.com' and
+        every value is a (rate, burst) tuple.
+    directory : string (optional)
+        The directory to store the shared state of every bucket in. Every
+        process using the same directory shares the same buckets. If None,
+        buckets are only shared between threads in the current process.
+    max_retries : int (optional)
+        The number of times a throttled request is retried before giving up.
+    backoff : float (optional)
+        The base number of seconds to wait before retrying a throttled request
+        which doesn't include a Retry-After header.
+    max_backoff : float (optional)
+        The maximum number of seconds to wait before retrying a throttled
+        request which doesn't include a Retry-After header.
+    """
+    def __init__(self, rate=DEFAULT_RATE, burst=DEFAULT_BURST, limits=None,
+                 directory=DEFAULT_DIRECTORY, max_retries=DEFAULT_MAX_RETRIES,
+                 backoff=DEFAULT_BACKOFF, max_backoff=DEFAULT_MAX_BACKOFF):
+        self._rate = rate
+        self._burst = burst
+        self._limits = limits or {}
+        self._directory = directory
+        self.max_retries = max_retries
+        self._backoff = backoff
+        self._max_backoff = max_backoff
+        self._buckets = {}
+        self._lock = threading.Lock()
+        if directory and not os.path.isdir(directory):
+            try:
+                os.makedirs(directory)
+            except OSError:
+                # Another process may have created the directory.
+                pass
+
+    def bucket(self, url):
+        """
+        Return the token bucket for the URL's host.
+
+        Parameters
+        ----------
+        url : string
+            The full URL which will be requested.
+
+        Returns
+        -------
+        TokenBucket
+            The bucket which paces requests to the URL's host.
+        """
+        host = urlparse(url).netloc.lower()
+        with self._lock:
+            try:
+                return self._buckets[host]
+            except KeyError:
+                rate, burst = self._limits.get(host,
+                                               (self._rate, self._burst))
+                path = None
+                if self._directory:
+                    filename = re.sub(r'[^a-z0-9.-]', '_', host) + '.bucket'
+                    path = os.path.join(self._directory, filename)
+                bucket = TokenBucket(rate, burst, path)
+                self._buckets[host] = bucket
+                return bucket
+
+    def acquire(self, url):
+        """
+        Wait until a request to the URL's host is allowed.
+
+        Parameters
+        ----------
+        url : string
+            The full URL which will be requested.
+        """
+        self.bucket(url).acquire()
+
+    def should_retry(self, response, attempt):
+        """
+        Determine whether a response was throttled and should be retried.
+
+        Parameters
+        ----------
+        response : requests.Response
+            The response received from the server.
+        attempt : int
+            The number of times the request has already been retried.
+
+        Returns
+        -------
+        boolean
+            True if the request should be retried.
+        """
+        return response.status_code in RETRY_STATUS_CODES and \
+            attempt < self.max_retries
+
+    def delay(self, response, attempt):
+        """
+        Determine how long to wait before retrying a throttled request.
+
+        Parameters
+        ----------
+        response : requests.Response
+            The throttled response.
+        attempt : int
+            The number of times the request has already been retried.
+
+        Returns
+        -------
+        float
+            The number of seconds to wait before retrying.
+        """
+        retry_after = _retry_after(response)
+        if retry_after is not None:
+            return retry_after
+        delay = min(self._max_backoff, self._backoff * 2 ** attempt)
+        # Randomize the second half of the delay so clients which were
+        # throttled at the same time don't all retry at the same time.
+        return delay / 2 + random.uniform(0, delay / 2)
+
+    def backoff(self, url, response, attempt):
+        """
+        Pause every request to the URL's host after a throttled response.
+
+        Parameters
+        ----------
+        url : string
+            The full URL which was throttled.
+        response : requests.Response
+            The throttled response.
+        attempt : int
+            The number of times the request has already been retried.
+        """
+        self.bucket(url).block(self.delay(response, attempt))
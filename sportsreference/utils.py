@@ -1,6 +1,15 @@
+import pandas as pd
 import re
-from datetime import datetime
+import threading
+from copy import deepcopy
+from datetime import datetime, timedelta
+from numbers import Real
+from lxml import etree
+from lxml.html import fragments_fromstring
 from pyquery import PyQuery as pq
+from pyquery.cssselectpatch import JQueryTranslator
+from pyquery.text import extract_text
+from . import fetch, instrument
 
 
 # {
@@ -22,6 +31,21 @@ SEASON_START_MONTH = {
 }
 
 
+# Matches the parsing schemes which select table cells by their 'data-stat'
+# attribute, such as 'td[data-stat="wins"]:first' or
+# 'tfoot td[data-stat="points"]'. These schemes are served from a single-pass
+# index of the row instead of running a CSS selector for every field.
+DATA_STAT_SCHEME = re.compile(r'^(tfoot )?(td|th)\[data-stat="([^"]+)"\]'
+                              r'(:first)?$')
+
+# The name of the attribute each PyQuery object's row index is stored in.
+ROW_INDEX_ATTRIBUTE = '_sportsreference_row_index'
+
+# Translates CSS selectors to XPath expressions the same way PyQuery does,
+# including support for jQuery extensions such as ':first'.
+_translator = JQueryTranslator(xhtml=False)
+
+
 def _todays_date():
     """
     Get today's date.
@@ -89,6 +113,30 @@ def _find_year_for_season(league):
         return today.year
 
 
+def _date_range(start, end=None):
+    """
+    Return every day between two dates.
+
+    Parameters
+    ----------
+    start : datetime object
+        The first day in the range.
+    end : datetime object (optional)
+        The last day in the range, inclusive. If None, only the start date is
+        included.
+
+    Returns
+    -------
+    list
+        A list of datetime objects for every day in chronological order. The
+        list is empty if the end date is before the start date.
+    """
+    if end is None:
+        return [start]
+    return [start + timedelta(days=day)
+            for day in range((end - start).days + 1)]
+
+
 def _parse_abbreviation(uri_link):
     """
     Returns a team's abbreviation.
@@ -116,6 +164,246 @@ def _parse_abbreviation(uri_link):
     return abbr.upper()
 
 
+class _RowIndex(object):
+    """
+    An index of every table cell in a set of HTML elements.
+
+    Walks every element once and groups each cell by its tag and 'data-stat'
+    attribute, keeping the cells in document order. Cells within a table
+    footer are additionally indexed separately. Every field in a parsing
+    scheme can then be found with a dictionary lookup instead of evaluating a
+    CSS selector against the entire row or page.
+
+    Parameters
+    ----------
+    html_data : PyQuery object
+        A PyQuery object containing one or more rows, tables, or an entire
+        page.
+    """
+    def __init__(self, html_data):
+        self._roots = []
+        for root in html_data:
+            cells = {}
+            footer_cells = {}
+            for element in root.iter(etree.Element):
+                stat = element.get('data-stat')
+                if stat is not None:
+                    cells.setdefault((element.tag, stat), []).append(element)
+            for footer in root.iter('tfoot'):
+                for element in footer.iter(etree.Element):
+                    stat = element.get('data-stat')
+                    if stat is not None:
+                        footer_cells.setdefault((element.tag, stat), []) \
+                            .append(element)
+            self._roots.append((cells, footer_cells))
+
+    def find(self, tag, stat, footer=False, first=False):
+        """
+        Find the text of every matching cell.
+
+        Parameters
+        ----------
+        tag : string
+            The tag of the cell, such as 'td' or 'th'.
+        stat : string
+            The value of the cell's 'data-stat' attribute.
+        footer : boolean (optional)
+            Only include cells within a table footer.
+        first : boolean (optional)
+            Only include the first matching cell within each element that was
+            indexed, matching the behavior of the ':first' selector.
+
+        Returns
+        -------
+        list
+            A list of the text contents of every matching cell in document
+            order.
+        """
+        items = []
+        for cells, footer_cells in self._roots:
+            matches = (footer_cells if footer else cells).get((tag, stat), [])
+            if first:
+                matches = matches[:1]
+            items.extend(extract_text(element) for element in matches)
+        return items
+
+
+def _row_index(html_data):
+    """
+    Return the index of the given HTML data.
+
+    The index is built the first time a set of HTML data is parsed and stored
+    on the PyQuery object itself, so it is reused for every subsequent field
+    parsed from the same data for as long as the data is kept, even when
+    fields from several pages are parsed in turn.
+
+    Parameters
+    ----------
+    html_data : PyQuery object
+        A PyQuery object containing one or more rows, tables, or an entire
+        page.
+
+    Returns
+    -------
+    _RowIndex instance
+        The index of every table cell in the HTML data.
+    """
+    cached = getattr(html_data, ROW_INDEX_ATTRIBUTE, None)
+    if cached is not None and cached[0] == len(html_data):
+        return cached[1]
+    index = _RowIndex(html_data)
+    setattr(html_data, ROW_INDEX_ATTRIBUTE, (len(html_data), index))
+    return index
+
+
+class CompiledScheme(dict):
+    """
+    A parsing scheme which compiles every selector once.
+
+    Behaves exactly like the dictionary of CSS selectors it wraps, but the
+    first time a field is selected its selector is translated to an XPath
+    expression and compiled, and the compiled expression is reused for every
+    subsequent selection. This avoids translating the same selector with
+    cssselect every time a field is parsed. Compiled expressions are kept per
+    thread as lxml's XPath evaluators are not safe to share between threads.
+
+    Parameters
+    ----------
+    scheme : dict
+        A dictionary where every key is the name of an attribute and every
+        value is a PyQuery-readable parsing scheme as a string, such as
+        'td[data-stat="wins"]'.
+    """
+    def __init__(self, *args, **kwargs):
+        super(CompiledScheme, self).__init__(*args, **kwargs)
+        self._expressions = {}
+        self._compiled = threading.local()
+
+    def xpath(self, field):
+        """
+        Return the compiled XPath expression for the requested field.
+
+        Parameters
+        ----------
+        field : string
+            The name of the attribute to select. Field must be a key in the
+            scheme.
+
+        Returns
+        -------
+        lxml.etree.XPath instance
+            The compiled expression which selects the field from an element,
+            or None if the field's selector is empty and never matches.
+        """
+        compiled = getattr(self._compiled, 'expressions', None)
+        if compiled is None:
+            compiled = self._compiled.expressions = {}
+        try:
+            return compiled[field]
+        except KeyError:
+            pass
+        try:
+            expression = self._expressions[field]
+        except KeyError:
+            selector = self[field]
+            expression = None
+            if selector:
+                expression = _translator.css_to_xpath(
+                    selector.replace('[@', '['), 'descendant-or-self::')
+            self._expressions[field] = expression
+        compiled[field] = etree.XPath(expression) if expression else None
+        return compiled[field]
+
+    def select(self, html_data, field):
+        """
+        Select every element matching the requested field.
+
+        Equivalent to calling the PyQuery object with the field's selector.
+
+        Parameters
+        ----------
+        html_data : PyQuery object
+            A PyQuery object containing the HTML data to search.
+        field : string
+            The name of the attribute to select. Field must be a key in the
+            scheme.
+
+        Returns
+        -------
+        PyQuery object
+            A PyQuery object containing every matching element in document
+            order.
+        """
+        expression = self.xpath(field)
+        elements = []
+        if expression is not None:
+            for root in html_data:
+                elements.extend(expression(root))
+        return pq(elements)
+
+
+def _select(parsing_scheme, html_data, field):
+    """
+    Select every element matching the requested field.
+
+    Uses the scheme's compiled expression when possible and falls back to
+    evaluating the selector string otherwise.
+
+    Parameters
+    ----------
+    parsing_scheme : dict
+        A dictionary of the parsing scheme to be used to find the desired
+        field, optionally a CompiledScheme.
+    html_data : PyQuery object
+        A PyQuery object containing the HTML data to search.
+    field : string
+        The name of the attribute to select. Field must be a key in
+        parsing_scheme.
+
+    Returns
+    -------
+    PyQuery object
+        A PyQuery object containing every matching element.
+    """
+    if isinstance(parsing_scheme, CompiledScheme) and \
+       isinstance(html_data, pq):
+        return parsing_scheme.select(html_data, field)
+    return html_data(parsing_scheme[field])
+
+
+def _slots(parsing_scheme, include=(), exclude=()):
+    """
+    Build the names of every attribute stored by a record class.
+
+    Every field parsed with a parsing scheme is stored in an attribute named
+    after the field with a leading underscore. Using these names as a class's
+    __slots__ stores each instance's values in a fixed array instead of a
+    per-instance dictionary, which uses a fraction of the memory when many
+    instances are kept.
+
+    Parameters
+    ----------
+    parsing_scheme : dict
+        A dictionary of the parsing scheme used to parse the class's fields.
+    include : list (optional)
+        Additional fields which are stored by the class but aren't in the
+        parsing scheme, such as the season's year.
+    exclude : list (optional)
+        Fields in the parsing scheme which aren't stored by the class.
+
+    Returns
+    -------
+    tuple
+        A tuple of the name of every attribute, each with a leading
+        underscore.
+    """
+    fields = list(include) + [field for field in parsing_scheme
+                              if field not in exclude and
+                              field not in include]
+    return tuple('_%s' % field for field in fields)
+
+
+@instrument.timed('parse')
 def _parse_field(parsing_scheme, html_data, field, index=0):
     """
     Parse an HTML table to find the requested field's value.
@@ -155,7 +443,15 @@ def _parse_field(parsing_scheme, html_data, field, index=0):
     if field == 'abbreviation':
         return _parse_abbreviation(html_data)
     scheme = parsing_scheme[field]
-    items = [i.text() for i in html_data(scheme).items()]
+    match = DATA_STAT_SCHEME.match(scheme)
+    if match and isinstance(html_data, pq):
+        footer, tag, stat, first = match.groups()
+        items = _row_index(html_data).find(tag, stat, bool(footer),
+                                           bool(first))
+    else:
+        items = [i.text() for i in _select(parsing_scheme,
+                                           html_data,
+                                           field).items()]
     # Stats can be added and removed on a yearly basis. If not stats are found,
     # return None and have the be the value.
     if len(items) == 0:
@@ -187,6 +483,89 @@ def _remove_html_comment_tags(html):
     return str(html).replace('<!--', '').replace('-->', '')
 
 
+def _append_text(parent, previous, text):
+    """
+    Append text after an element's previous sibling.
+
+    Parameters
+    ----------
+    parent : lxml.etree.Element
+        The parent of the position the text is added at.
+    previous : lxml.etree.Element
+        The sibling directly before the position the text is added at, or None
+        if the text is added before the parent's first child.
+    text : string
+        The text to add.
+    """
+    if not text:
+        return
+    if previous is not None:
+        previous.tail = (previous.tail or '') + text
+    else:
+        parent.text = (parent.text or '') + text
+
+
+@instrument.timed('clean')
+def _uncomment_element(element):
+    """
+    Replace every comment within an element with its parsed contents.
+
+    Only the text of each comment is parsed, so the rest of the element is
+    left untouched instead of being serialized and parsed again. The element
+    is modified in place.
+
+    Parameters
+    ----------
+    element : lxml.etree.Element
+        The element whose comments should be replaced.
+    """
+    for comment in list(element.iter(etree.Comment)):
+        parent = comment.getparent()
+        if parent is None:
+            continue
+        contents = comment.text or ''
+        nodes = fragments_fromstring(contents) if contents.strip() else []
+        leading = ''
+        if nodes and not hasattr(nodes[0], 'tag'):
+            leading = nodes.pop(0)
+        if not nodes:
+            leading = contents
+        previous = comment.getprevious()
+        index = parent.index(comment)
+        tail = comment.tail or ''
+        parent.remove(comment)
+        _append_text(parent, previous, leading)
+        for offset, node in enumerate(nodes):
+            parent.insert(index + offset, node)
+        _append_text(parent, nodes[-1] if nodes else previous, tail)
+
+
+def _uncomment(html):
+    """
+    Replace every comment tag with the HTML contents within the tag.
+
+    Some pages embed the HTML contents in comments. Instead of removing the
+    comment tags from the serialized page and parsing the entire page again,
+    the text of every comment is parsed into fragments which replace the
+    comment in place.
+
+    Parameters
+    ----------
+    html : PyQuery object
+        A PyQuery object which contains the requested HTML page contents. The
+        object is modified in place.
+
+    Returns
+    -------
+    PyQuery object
+        The passed PyQuery object with every comment replaced by its contents.
+    """
+    for element in html:
+        _uncomment_element(element)
+    return html
+
+
+@instrument.timed('parse')
 def _get_stats_table(html_page, div, footer=False):
     """
     Returns a generator of all rows in a requested table.
@@ -212,10 +591,112 @@ def _get_stats_table(html_page, div, footer=False):
     generator
         A generator of all row items in a given table.
     """
-    stats_html = html_page(div)
-    stats_table = pq(_remove_html_comment_tags(stats_html))
+    tables = []
+    for element in html_page(div):
+        # Copy the table before replacing its comments so the passed page is
+        # left unchanged.
+        if next(element.iter(etree.Comment), None) is not None:
+            element = deepcopy(element)
+            _uncomment_element(element)
+        tables.append(element)
+    stats_table = pq(tables)
     if footer:
         teams_list = stats_table('tfoot tr').items()
     else:
         teams_list = stats_table('tbody tr').items()
     return teams_list
+
+
+def _pull_stats_tables(pages, workers=fetch.DEFAULT_WORKERS):
+    """
+    Download multiple pages concurrently and return the requested tables.
+
+    Every page is downloaded, parsed, and split into table rows on its own
+    worker thread, so the total time tracks the slowest page instead of the
+    sum of every page.
+
+    Parameters
+    ----------
+    pages : list
+        A list of tuples where the first element is the full URL of the page
+        to download and the second element is a list of the requested tables
+        on that page in the format "<tag>#<id name>", such as
+        "table#basic_school_stats".
+    workers : int (optional)
+        The maximum number of pages to download simultaneously.
+
+    Returns
+    -------
+    list
+        A list with a list of every row in each requested table, in the same
+        order the pages and tables were requested.
+
+    Raises
+    ------
+    requests.exceptions.HTTPError
+        If any of the pages can't be downloaded.
+    """
+    def _pull(page):
+        url, divs = page
+        doc = fetch.get_page(url)
+        return [list(_get_stats_table(doc, div)) for div in divs]
+
+    tables = []
+    for page_tables in fetch.map_concurrent(_pull, pages, workers):
+        tables.extend(page_tables)
+    return tables
+
+
+def _is_number(value):
+    """
+    Determine whether a value is an integer or float, excluding booleans.
+
+    Parameters
+    ----------
+    value : object
+        The value to check.
+
+    Returns
+    -------
+    boolean
+        True if the value is numeric.
+    """
+    return isinstance(value, Real) and not isinstance(value, bool)
+
+
+@instrument.timed('build')
+def _dataframe_from_rows(rows, index):
+    """
+    Build a single DataFrame from the values of multiple objects.
+
+    Every column is collected into a single array and the DataFrame is
+    constructed once, instead of building a one-row DataFrame for each object
+    and concatenating them. Numeric columns with missing values are stored as
+    floats with NaN in place of None so they keep a numeric dtype.
+
+    Parameters
+    ----------
+    rows : list
+        A list of dictionaries where each key is the name of a column and each
+        value is the object's value for that column. Every dictionary should
+        have the same keys in the same order.
+    index : list
+        A list of the index of each row, such as the team abbreviation.
+
+    Returns
+    -------
+    Pandas DataFrame
+        A DataFrame with a row for each dictionary, or None if there are no
+        rows.
+    """
+    if not rows:
+        return None
+    columns = {}
+    for name in rows[0]:
+        values = [row[name] for row in rows]
+        present = [value for value in values if value is not None]
+        if present and len(present) < len(values) and \
+           all(_is_number(value) for value in present):
+            values = pd.Series(values, dtype='float64').values
+        columns[name] = values
+    return pd.DataFrame(columns, index=index, columns=list(rows[0]))
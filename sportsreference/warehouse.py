@@ -0,0 +1,527 @@
+import json
+import math
+import pandas as pd
+import sqlite3
+from datetime import date, datetime
+from .cache import GAME_DATE_PATTERN
+
+
+# {
+#   table name: {
+#       'key': The columns which uniquely identify every row, in order.
+#       'indexes': The columns of every additional index on the table.
+#   }
+# }
+TABLES = {
+    'teams': {
+        'key': ['abbreviation', 'season'],
+        'indexes': []
+    },
+    'games': {
+        'key': ['team', 'season', 'boxscore'],
+        'indexes': [['datetime']]
+    },
+    'boxscores': {
+        'key': ['boxscore'],
+        'indexes': [['game_date']]
+    },
+    'players': {
+        'key': ['player_id'],
+        'indexes': []
+    },
+    'player_seasons': {
+        'key': ['player_id', 'season'],
+        'indexes': []
+    }
+}
+
+# Player information which doesn't change between seasons and is stored in
+# the players table instead of the player_seasons table.
+PLAYER_COLUMNS = ['name', 'height', 'weight', 'birth_date', 'nationality']
+
+
+def _league(instance):
+    """
+    Find the league an object was created by.
+
+    Parameters
+    ----------
+    instance : object
+        An instance of any class in one of the league packages, such as a
+        Boxscore.
+
+    Returns
+    -------
+    string
+        The league name, such as 'nba'.
+    """
+    return type(instance).__module__.split('.')[1]
+
+
+def _game_date(uri):
+    """
+    Find the date a game was played from its boxscore URI.
+
+    The 'date' field of every boxscore is formatted differently by each
+    league, such as '7:30 PM, October 31, 2017', while every boxscore URI
+    includes the date in the same order, such as '201710310LAL' or
+    '2017-11-10-19-kansas'.
+
+    Parameters
+    ----------
+    uri : string
+        The boxscore's URI.
+
+    Returns
+    -------
+    string
+        The date of the game in ISO 8601 format, such as '2017-10-31', or
+        None if the URI doesn't include a valid date.
+    """
+    match = GAME_DATE_PATTERN.search(uri)
+    if not match:
+        return None
+    try:
+        return date(*[int(value) for value in match.groups()]).isoformat()
+    except ValueError:
+        return None
+
+
+def _iso_date(value):
+    """
+    Convert a date, datetime, or ISO 8601 string to a date string such as
+    '2017-10-31'. Returns None if the value is None.
+    """
+    if isinstance(value, datetime):
+        value = value.date()
+    if isinstance(value, date):
+        return value.isoformat()
+    return value
+
+
+def _value(value):
+    """
+    Convert a value to a type which can be stored in SQLite.
+
+    NumPy scalars are converted to the equivalent Python type, NaN is stored
+    as NULL, dates are stored as ISO 8601 strings, and dictionaries are stored
+    as JSON.
+    """
+    if value is pd.NaT:
+        return None
+    if hasattr(value, 'item') and not isinstance(value, (list, dict)):
+        value = value.item()
+    if isinstance(value, float) and math.isnan(value):
+        return None
+    if isinstance(value, datetime):
+        return value.isoformat(' ')
+    if isinstance(value, date):
+        return value.isoformat()
+    if isinstance(value, (dict, list)):
+        return json.dumps(value)
+    return value
+
+
+def _column_type(value):
+    """
+    Return the SQLite type of a column based on one of its values.
+    """
+    if isinstance(value, (bool, int)):
+        return 'INTEGER'
+    if isinstance(value, float):
+        return 'REAL'
+    return 'TEXT'
+
+
+def _records(dataframe):
+    """
+    Convert every row in a DataFrame to a dictionary of storable values.
+
+    Parameters
+    ----------
+    dataframe : Pandas DataFrame
+        The DataFrame to convert.
+
+    Returns
+    -------
+    list
+        A list of tuples where the first element is the row's index and the
+        second element is a dictionary of every column's value.
+    """
+    if dataframe is None:
+        return []
+    records = []
+    for index, row in zip(dataframe.index, dataframe.to_dict('records')):
+        if isinstance(index, tuple):
+            index = index[0]
+        records.append((index, dict((column, _value(value))
+                                    for column, value in row.items())))
+    return records
+
+
+class Warehouse(object):
+    """
+    A local SQLite database of parsed teams, schedules, boxscores and players.
+
+    Every league has its own set of normalized tables named after the league,
+    such as 'nba_teams', 'nba_games', 'nba_boxscores', 'nba_players', and
+    'nba_player_seasons'. The columns of every table are created from the
+    fields of the objects saved to it, keeping each field's integer, float,
+    or string type. Saving an object which was already saved replaces the
+    previous row, and every save is written in a single transaction.
+
+    Once saved, the data can be queried without downloading any pages, such
+    as every game Detroit played in 2017::
+
+        warehouse.games('nba', team='DET', season=2017)
+
+    Parameters
+    ----------
+    path : string
+        The path of the SQLite database file. It will be created if it doesn't
+        already exist. Use ':memory:' for a temporary in-memory database.
+    """
+    def __init__(self, path):
+        self._connection = sqlite3.connect(path)
+        self._columns = {}
+
+    def close(self):
+        """
+        Close the connection to the database.
+        """
+        self._connection.close()
+
+    def _table_columns(self, table):
+        """
+        Return the names of every column in a table.
+
+        Parameters
+        ----------
+        table : string
+            The full name of the table, such as 'nba_teams'.
+
+        Returns
+        -------
+        list
+            A list of the name of every column, or an empty list if the table
+            doesn't exist.
+        """
+        if table not in self._columns:
+            cursor = self._connection.execute('PRAGMA table_info("%s")'
+                                              % table)
+            self._columns[table] = [row[1] for row in cursor.fetchall()]
+        return self._columns[table]
+
+    def _create_table(self, league, kind, rows):
+        """
+        Create a table, or add any missing columns to an existing table.
+
+        Parameters
+        ----------
+        league : string
+            The league name, such as 'nba'.
+        kind : string
+            The type of table as listed in TABLES, such as 'teams'.
+        rows : list
+            A list of dictionaries of every row which will be saved to the
+            table.
+
+        Returns
+        -------
+        string
+            The full name of the table, such as 'nba_teams'.
+        """
+        table = '%s_%s' % (league, kind)
+        key = TABLES[kind]['key']
+        types = {}
+        for row in rows:
+            for column, value in row.items():
+                if value is not None and column not in types:
+                    types[column] = _column_type(value)
+        existing = self._table_columns(table)
+        if not existing:
+            definitions = ['"%s" %s' % (column, types.get(column, 'TEXT'))
+                           for column in key]
+            definitions += ['"%s" %s' % (column, types.get(column, 'TEXT'))
+                            for column in rows[0] if column not in key]
+            self._connection.execute(
+                'CREATE TABLE "%s" (%s, PRIMARY KEY (%s))'
+                % (table, ', '.join(definitions),
+                   ', '.join('"%s"' % column for column in key)))
+        else:
+            for column in rows[0]:
+                if column not in existing:
+                    self._connection.execute(
+                        'ALTER TABLE "%s" ADD COLUMN "%s" %s'
+                        % (table, column, types.get(column, 'TEXT')))
+        self._columns.pop(table, None)
+        # Indexes are created whenever their columns exist, so columns added
+        # to an existing table are indexed too.
+        columns = self._table_columns(table)
+        for index in TABLES[kind]['indexes']:
+            if not all(column in columns for column in index):
+                continue
+            self._connection.execute(
+                'CREATE INDEX IF NOT EXISTS "%s_%s" ON "%s" (%s)'
+                % (table, '_'.join(index), table,
+                   ', '.join('"%s"' % column for column in index)))
+        return table
+
+    def _upsert(self, league, kind, rows):
+        """
+        Insert or replace every row in a single transaction.
+
+        Parameters
+        ----------
+        league : string
+            The league name, such as 'nba'.
+        kind : string
+            The type of table as listed in TABLES, such as 'teams'.
+        rows : list
+            A list of dictionaries where every key is the name of a column.
+            Every dictionary should have the same keys.
+
+        Returns
+        -------
+        int
+            The number of rows saved.
+        """
+        if not rows:
+            return 0
+        with self._connection:
+            table = self._create_table(league, kind, rows)
+            columns = list(rows[0])
+            self._connection.executemany(
+                'INSERT OR REPLACE INTO "%s" (%s) VALUES (%s)'
+                % (table, ', '.join('"%s"' % column for column in columns),
+                   ', '.join('?' for _ in columns)),
+                [[row.get(column) for column in columns] for row in rows])
+        return len(rows)
+
+    def save_teams(self, teams, season=None):
+        """
+        Save every team in a season.
+
+        Parameters
+        ----------
+        teams : Teams instance
+            The Teams instance of any league.
+        season : string (optional)
+            The season the teams played in. Defaults to the year the teams
+            were requested for.
+
+        Returns
+        -------
+        int
+            The number of teams saved.
+        """
+        team_list = list(teams)
+        if not team_list:
+            return 0
+        if season is None:
+            season = team_list[0]._year
+        rows = []
+        for abbreviation, record in _records(teams.dataframes):
+            record.pop('abbreviation', None)
+            row = {'abbreviation': abbreviation, 'season': str(season)}
+            row.update(record)
+            rows.append(row)
+        return self._upsert(_league(team_list[0]), 'teams', rows)
+
+    def save_schedule(self, schedule, team, season):
+        """
+        Save every completed game in a team's schedule.
+
+        Parameters
+        ----------
+        schedule : Schedule instance
+            The Schedule instance of any league.
+        team : string
+            The team's abbreviation, such as 'DET'.
+        season : string
+            The season the schedule is for, such as '2017'.
+
+        Returns
+        -------
+        int
+            The number of games saved.
+        """
+        rows = []
+        league = None
+        for game in schedule:
+            league = _league(game)
+            for boxscore, record in _records(game.dataframe):
+                row = {'team': team, 'season': str(season),
+                       'boxscore': boxscore}
+                row.update(record)
+                rows.append(row)
+        return self._upsert(league, 'games', rows)
+
+    def save_boxscores(self, boxscores):
+        """
+        Save the stats of every game.
+
+        Parameters
+        ----------
+        boxscores : list
+            A list of Boxscore instances of any league.
+
+        Returns
+        -------
+        int
+            The number of boxscores saved. Boxscores for games which haven't
+            been played are skipped.
+        """
+        rows = {}
+        for boxscore in boxscores:
+            for uri, record in _records(boxscore.dataframe):
+                row = {'boxscore': uri, 'game_date': _game_date(uri)}
+                row.update(record)
+                rows.setdefault(_league(boxscore), []).append(row)
+        return sum(self._upsert(league, 'boxscores', league_rows)
+                   for league, league_rows in rows.items())
+
+    def save_players(self, players):
+        """
+        Save the information and every season of stats for players.
+
+        Parameters
+        ----------
+        players : list
+            A list of Player instances of any league, such as the players of
+            a Roster.
+
+        Returns
+        -------
+        int
+            The number of players saved.
+        """
+        players_rows = {}
+        seasons_rows = {}
+        for player in players:
+            league = _league(player)
+            records = _records(player.dataframe)
+            if not records:
+                continue
+            row = {'player_id': player.player_id,
+                   'name': _value(player.name)}
+            for column in PLAYER_COLUMNS:
+                if column in records[-1][1]:
+                    row[column] = records[-1][1][column]
+            players_rows.setdefault(league, []).append(row)
+            for season, record in records:
+                season_row = {'player_id': player.player_id,
+                              'season': season}
+                season_row.update((column, value)
+                                  for column, value in record.items()
+                                  if column not in PLAYER_COLUMNS and
+                                  column != 'player_id')
+                seasons_rows.setdefault(league, []).append(season_row)
+        for league, rows in seasons_rows.items():
+            self._upsert(league, 'player_seasons', rows)
+        return sum(self._upsert(league, 'players', rows)
+                   for league, rows in players_rows.items())
+
+    def query(self, sql, params=()):
+        """
+        Run a SQL query against the database.
+
+        Parameters
+        ----------
+        sql : string
+            The SQL query to run.
+        params : tuple (optional)
+            The values of every parameter in the query.
+
+        Returns
+        -------
+        Pandas DataFrame
+            A DataFrame with a row for every result.
+        """
+        return pd.read_sql_query(sql, self._connection, params=params)
+
+    def _select(self, league, kind, ranges=None, **filters):
+        """
+        Select every row in a table matching the requested values.
+
+        Parameters
+        ----------
+        league : string
+            The league name, such as 'nba'.
+        kind : string
+            The type of table as listed in TABLES, such as 'teams'.
+        ranges : dict (optional)
+            A dictionary where each key is the name of a column and each value
+            is a tuple of the lowest and highest values to match, inclusive.
+            Either value can be None to leave that end of the range open.
+        filters : dict
+            The requested value of any column. Filters with a value of None
+            are ignored.
+
+        Returns
+        -------
+        Pandas DataFrame
+            A DataFrame with a row for every match indexed by the table's key,
+            or None if nothing has been saved to the table.
+        """
+        table = '%s_%s' % (league, kind)
+        if not self._table_columns(table):
+            return None
+        # Seasons are always stored as strings so '2017' and 2017 both match.
+        conditions = [('"%s" = ?' % column,
+                       str(value) if column == 'season' else value)
+                      for column, value in filters.items()
+                      if value is not None]
+        for column, (low, high) in (ranges or {}).items():
+            if low is not None:
+                conditions.append(('"%s" >= ?' % column, _value(low)))
+            if high is not None:
+                conditions.append(('"%s" <= ?' % column, _value(high)))
+        sql = 'SELECT * FROM "%s"' % table
+        if conditions:
+            sql += ' WHERE ' + ' AND '.join(condition
+                                            for condition, _ in conditions)
+        dataframe = self.query(sql, [value for _, value in conditions])
+        return dataframe.set_index(TABLES[kind]['key'])
+
+    def teams(self, league, season=None):
+        """
+        Returns a pandas DataFrame of every saved team in a league, optionally
+        only for the requested season.
+        """
+        return self._select(league, 'teams', season=season)
+
+    def games(self, league, team=None, season=None):
+        """
+        Returns a pandas DataFrame of every saved game in a league, optionally
+        only for the requested team and season.
+        """
+        return self._select(league, 'games', team=team, season=season)
+
+    def boxscores(self, league, boxscore=None, start_date=None,
+                  end_date=None):
+        """
+        Returns a pandas DataFrame of every saved boxscore in a league,
+        optionally only for the requested boxscore URI or for the games played
+        between the requested start and end dates, inclusive. Dates can be
+        either ``date`` objects or ISO 8601 strings, such as '2017-10-31'.
+        """
+        return self._select(league, 'boxscores',
+                            ranges={'game_date': (_iso_date(start_date),
+                                                  _iso_date(end_date))},
+                            boxscore=boxscore)
+
+    def players(self, league, player_id=None):
+        """
+        Returns a pandas DataFrame of every saved player in a league,
+        optionally only for the requested player ID.
+        """
+        return self._select(league, 'players', player_id=player_id)
+
+    def player_seasons(self, league, player_id=None, season=None):
+        """
+        Returns a pandas DataFrame of every saved season of every player in a
+        league, optionally only for the requested player ID and season.
+        """
+        return self._select(league, 'player_seasons', player_id=player_id,
+                            season=season)
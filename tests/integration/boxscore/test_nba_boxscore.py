@@ -40,7 +40,7 @@ class MockDateTime:
 
 
 class TestNBABoxscore:
-    @mock.patch('requests.get', side_effect=mock_pyquery)
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
     def setup_method(self, *args, **kwargs):
         self.results = {
             'date': '10:30 PM, October 31, 2017',
@@ -136,6 +136,21 @@ class TestNBABoxscore:
         for attribute, value in self.results.items():
             assert getattr(self.boxscore, attribute) == value
 
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
+    def test_lazy_boxscore_parses_fields_on_first_access(self, *args,
+                                                         **kwargs):
+        boxscore = Boxscore(BOXSCORE, lazy=True)
+        parse_value = Boxscore._parse_value
+
+        with mock.patch.object(Boxscore, '_parse_value', autospec=True,
+                               side_effect=parse_value) as mock_parse:
+            assert boxscore.date == self.results['date']
+            assert boxscore.date == self.results['date']
+
+        mock_parse.assert_called_once_with(boxscore, 'date', mock.ANY)
+        for attribute, value in self.results.items():
+            assert getattr(boxscore, attribute) == value
+
     def test_invalid_url_yields_empty_class(self):
         flexmock(Boxscore) \
             .should_receive('_retrieve_html_page') \
@@ -143,10 +158,10 @@ class TestNBABoxscore:
 
         boxscore = Boxscore(BOXSCORE)
 
-        for key, value in boxscore.__dict__.items():
+        for key in boxscore.__slots__:
             if key == '_uri':
                 continue
-            assert value is None
+            assert getattr(boxscore, key) is None
 
     def test_nba_boxscore_dataframe_returns_dataframe_of_all_values(self):
         df = pd.DataFrame([self.results], index=[BOXSCORE])
@@ -164,7 +179,7 @@ class TestNBABoxscore:
 
 
 class TestNBABoxscores:
-    @mock.patch('requests.get', side_effect=mock_pyquery)
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
     def test_boxscores_search(self, *args, **kwargs):
         expected = {
             'boxscores': [
@@ -224,3 +239,42 @@ class TestNBABoxscores:
         result = Boxscores(datetime(2017, 2, 4)).games
 
         assert result == expected
+
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
+    def test_concurrent_boxscores_returns_games_in_order(self, *args,
+                                                         **kwargs):
+        flexmock(Boxscore) \
+            .should_receive('_parse_game_data') \
+            .and_return(None)
+
+        boxscores = Boxscores(datetime(2017, 2, 4))
+        result = boxscores.concurrent_boxscores(workers=4)
+
+        uris = [game['boxscore'] for game in boxscores.games['boxscores']]
+        assert len(result) == len(uris)
+        assert [boxscore._uri for boxscore in result] == uris
+
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
+    def test_boxscores_search_date_range(self, *args, **kwargs):
+        single = Boxscores(datetime(2017, 2, 4)).games
+
+        boxscores = Boxscores(datetime(2017, 2, 3), datetime(2017, 2, 5))
+
+        assert list(boxscores.games_by_date) == ['2017-02-03', '2017-02-04',
+                                                 '2017-02-05']
+        assert boxscores.games_by_date['2017-02-03'] == []
+        assert boxscores.games_by_date['2017-02-04'] == single['boxscores']
+        assert boxscores.games_by_date['2017-02-05'] == []
+        assert boxscores.games == single
+
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
+    def test_boxscores_to_arrow_adds_date_column(self, *args, **kwargs):
+        boxscores = Boxscores(datetime(2017, 2, 3), datetime(2017, 2, 5))
+
+        table = boxscores.to_arrow()
+
+        assert table.schema.names[0] == 'date'
+        assert table.num_rows == len(boxscores.games['boxscores'])
+        assert set(table.column('date').to_pylist()) == set(['2017-02-04'])
+        assert table.column('boxscore').to_pylist() == \
+            [game['boxscore'] for game in boxscores.games['boxscores']]
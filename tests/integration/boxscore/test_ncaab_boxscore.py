@@ -43,7 +43,7 @@ class MockDateTime:
 
 
 class TestNCAABBoxscore:
-    @mock.patch('requests.get', side_effect=mock_pyquery)
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
     def setup_method(self, *args, **kwargs):
         self.results = {
             'date': 'November 24, 2017',
@@ -143,6 +143,21 @@ class TestNCAABBoxscore:
         for attribute, value in self.results.items():
             assert getattr(self.boxscore, attribute) == value
 
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
+    def test_lazy_boxscore_parses_fields_on_first_access(self, *args,
+                                                         **kwargs):
+        boxscore = Boxscore(BOXSCORE, lazy=True)
+        parse_value = Boxscore._parse_value
+
+        with mock.patch.object(Boxscore, '_parse_value', autospec=True,
+                               side_effect=parse_value) as mock_parse:
+            assert boxscore.date == self.results['date']
+            assert boxscore.date == self.results['date']
+
+        mock_parse.assert_called_once_with(boxscore, 'date', mock.ANY)
+        for attribute, value in self.results.items():
+            assert getattr(boxscore, attribute) == value
+
     def test_invalid_url_yields_empty_class(self):
         flexmock(Boxscore) \
             .should_receive('_retrieve_html_page') \
@@ -150,10 +165,10 @@ class TestNCAABBoxscore:
 
         boxscore = Boxscore(BOXSCORE)
 
-        for key, value in boxscore.__dict__.items():
+        for key in boxscore.__slots__:
             if key == '_uri':
                 continue
-            assert value is None
+            assert getattr(boxscore, key) is None
 
     def test_ncaab_boxscore_dataframe_returns_dataframe_of_all_values(self):
         df = pd.DataFrame([self.results], index=[BOXSCORE])
@@ -171,7 +186,7 @@ class TestNCAABBoxscore:
 
 
 class TestNCAABBoxscores:
-    @mock.patch('requests.get', side_effect=mock_pyquery)
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
     def test_boxscores_search(self, *args, **kwargs):
         expected = {
             'boxscores': [
@@ -397,3 +412,17 @@ class TestNCAABBoxscores:
         result = Boxscores(datetime(2017, 11, 11)).games
 
         assert result == expected
+
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
+    def test_concurrent_boxscores_returns_games_in_order(self, *args,
+                                                         **kwargs):
+        flexmock(Boxscore) \
+            .should_receive('_parse_game_data') \
+            .and_return(None)
+
+        boxscores = Boxscores(datetime(2017, 11, 11))
+        result = boxscores.concurrent_boxscores(workers=4)
+
+        uris = [game['boxscore'] for game in boxscores.games['boxscores']]
+        assert len(result) == len(uris)
+        assert [boxscore._uri for boxscore in result] == uris
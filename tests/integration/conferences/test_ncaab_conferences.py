@@ -2,6 +2,7 @@ import mock
 import pytest
 from flexmock import flexmock
 from os.path import join, dirname
+from pyquery import PyQuery as pq
 from sportsreference import utils
 from sportsreference.ncaab.conferences import Conference, Conferences
 
@@ -26,6 +27,9 @@ def mock_pyquery(url):
 
     if 'BAD' in url:
         return MockPQ('', 404)
+    if '-ratings' in url:
+        html_contents = read_file('%s-ratings-synthetic.html' % YEAR)
+        return MockPQ(html_contents)
     if 'big-12' in url:
         html_contents = read_file('%s-big-12.html' % YEAR)
         return MockPQ(html_contents)
@@ -36,78 +40,143 @@ def mock_pyquery(url):
     return MockPQ(html_contents)
 
 
+def real_ratings_rows():
+    # Captured pages list teams with the same 'school_name' and 'conf_abbr'
+    # cells as the ratings page, so the rows of the real 2018 AP poll are
+    # parsed as a ratings table.
+    filepath = join(dirname(__file__), '..', 'rankings', 'ncaab',
+                    '%s-polls.html' % YEAR)
+    polls = pq(open(filepath, 'r').read())
+    rows = ''.join(str(row) for row in polls('table#ap tbody tr').items())
+    return pq('<table id="ratings"><tbody>%s</tbody></table>' % rows)
+
+
+def mock_missing_ratings(url):
+    if '-ratings' in url:
+        return mock_pyquery('BAD')
+    return mock_pyquery(url)
+
+
 class TestNCAABConferences:
-    @mock.patch('requests.get', side_effect=mock_pyquery)
+    def setup_method(self, *args, **kwargs):
+        self.team_conference = {'kansas': 'big-12',
+                                'texas-tech': 'big-12',
+                                'west-virginia': 'big-12',
+                                'kansas-state': 'big-12',
+                                'texas-christian': 'big-12',
+                                'oklahoma-state': 'big-12',
+                                'oklahoma': 'big-12',
+                                'baylor': 'big-12',
+                                'texas': 'big-12',
+                                'iowa-state': 'big-12',
+                                'xavier': 'big-east',
+                                'villanova': 'big-east',
+                                'seton-hall': 'big-east',
+                                'creighton': 'big-east',
+                                'providence': 'big-east',
+                                'butler': 'big-east',
+                                'marquette': 'big-east',
+                                'georgetown': 'big-east',
+                                'st-johns-ny': 'big-east',
+                                'depaul': 'big-east'}
+        self.conferences_result = {
+            'big-12': {
+                'name': 'Big 12 Conference',
+                'teams': {'kansas': 'Kansas',
+                          'texas-tech': 'Texas Tech',
+                          'west-virginia': 'West Virginia',
+                          'kansas-state': 'Kansas State',
+                          'texas-christian': 'Texas Christian',
+                          'oklahoma-state': 'Oklahoma State',
+                          'oklahoma': 'Oklahoma',
+                          'baylor': 'Baylor',
+                          'texas': 'Texas',
+                          'iowa-state': 'Iowa State'}
+            },
+            'big-east': {
+                'name': 'Big East Conference',
+                'teams': {'xavier': 'Xavier',
+                          'villanova': 'Villanova',
+                          'seton-hall': 'Seton Hall',
+                          'creighton': 'Creighton',
+                          'providence': 'Providence',
+                          'butler': 'Butler',
+                          'marquette': 'Marquette',
+                          'georgetown': 'Georgetown',
+                          'st-johns-ny': "St. John's (NY)",
+                          'depaul': 'DePaul'}
+            }
+        }
+
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
     def test_conferences_integration(self, *args, **kwargs):
-        team_conference = {'kansas': 'big-12',
-                           'texas-tech': 'big-12',
-                           'west-virginia': 'big-12',
-                           'kansas-state': 'big-12',
-                           'texas-christian': 'big-12',
-                           'oklahoma-state': 'big-12',
-                           'oklahoma': 'big-12',
-                           'baylor': 'big-12',
-                           'texas': 'big-12',
-                           'iowa-state': 'big-12',
-                           'xavier': 'big-east',
-                           'villanova': 'big-east',
-                           'seton-hall': 'big-east',
-                           'creighton': 'big-east',
-                           'providence': 'big-east',
-                           'butler': 'big-east',
-                           'marquette': 'big-east',
-                           'georgetown': 'big-east',
-                           'st-johns-ny': 'big-east',
-                           'depaul': 'big-east'}
-        conferences_result = {'big-12': {
-                                  'name': 'Big 12 Conference',
-                                  'teams': {'kansas': 'Kansas',
-                                            'texas-tech': 'Texas Tech',
-                                            'west-virginia': 'West Virginia',
-                                            'kansas-state': 'Kansas State',
-                                            'texas-christian':
-                                            'Texas Christian',
-                                            'oklahoma-state': 'Oklahoma State',
-                                            'oklahoma': 'Oklahoma',
-                                            'baylor': 'Baylor',
-                                            'texas': 'Texas',
-                                            'iowa-state': 'Iowa State'}
-                                    },
-                              'big-east': {
-                                    'name': 'Big East Conference',
-                                    'teams': {'xavier': 'Xavier',
-                                              'villanova': 'Villanova',
-                                              'seton-hall': 'Seton Hall',
-                                              'creighton': 'Creighton',
-                                              'providence': 'Providence',
-                                              'butler': 'Butler',
-                                              'marquette': 'Marquette',
-                                              'georgetown': 'Georgetown',
-                                              'st-johns-ny': "St. John's (NY)",
-                                              'depaul': 'DePaul'}
-                                    }
-                              }
-
         flexmock(utils) \
             .should_receive('_find_year_for_season') \
             .and_return(YEAR)
 
         conferences = Conferences()
 
-        assert conferences.team_conference == team_conference
-        assert conferences.conferences == conferences_result
-
-    @mock.patch('requests.get', side_effect=mock_pyquery)
+        assert conferences.team_conference == self.team_conference
+        assert conferences.conferences == self.conferences_result
+
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
+    def test_conferences_single_page_only_pulls_season_pages(self, *args,
+                                                             **kwargs):
+        conferences = Conferences(YEAR)
+
+        urls = [call[0][0] for call in args[0].call_args_list]
+        assert len(urls) == 2
+        assert not any('/cbb/conferences/' in url for url in urls)
+        assert conferences.team_conference == self.team_conference
+        assert conferences.conferences == self.conferences_result
+
+    @mock.patch('requests.Session.get', side_effect=mock_missing_ratings)
+    def test_conferences_fall_back_to_conference_pages(self, *args,
+                                                       **kwargs):
+        conferences = Conferences(YEAR)
+
+        assert len(args[0].call_args_list) == 4
+        assert conferences.team_conference == self.team_conference
+        assert conferences.conferences == self.conferences_result
+
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
+    def test_conferences_without_single_page_pull_conference_pages(
+            self, *args, **kwargs):
+        conferences = Conferences(YEAR, single_page=False)
+
+        urls = [call[0][0] for call in args[0].call_args_list]
+        assert not any('-ratings' in url for url in urls)
+        assert len(urls) == 3
+        assert conferences.team_conference == self.team_conference
+        assert conferences.conferences == self.conferences_result
+
+    def test_members_are_read_from_real_ratings_markup(self):
+        flexmock(Conferences) \
+            .should_receive('_find_conferences') \
+            .and_return(None)
+
+        members = Conferences(YEAR)._find_members(real_ratings_rows())
+
+        assert members['acc']['virginia'] == 'Virginia'
+        assert members['big-east']['villanova'] == 'Villanova'
+        assert members['big-12']['kansas'] == 'Kansas'
+
+    @mock.patch('requests.Session.get', side_effect=TypeError)
+    def test_conferences_raise_unexpected_errors(self, *args, **kwargs):
+        with pytest.raises(TypeError):
+            Conferences(YEAR)
+
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
     def test_conferences_integration_bad_url(self, *args, **kwargs):
         with pytest.raises(ValueError):
             conferences = Conferences('BAD')
 
-    @mock.patch('requests.get', side_effect=mock_pyquery)
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
     def test_conference_integration_bad_url(self, *args, **kwargs):
         with pytest.raises(ValueError):
             conference = Conference('BAD')
 
-    @mock.patch('requests.get', side_effect=mock_pyquery)
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
     def test_conference_with_no_names_is_empty(self, *args, **kwargs):
         flexmock(Conference) \
             .should_receive('_get_team_abbreviation') \
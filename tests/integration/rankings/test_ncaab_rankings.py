@@ -31,7 +31,7 @@ def mock_pyquery(url):
 
 
 class TestNCAABRankings:
-    @mock.patch('requests.get', side_effect=mock_pyquery)
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
     def test_rankings_integration(self, *args, **kwargs):
         results_extended = [
             {
@@ -652,7 +652,7 @@ class TestNCAABRankings:
         assert rankings.current == results
         assert rankings.complete == results_complete
 
-    @mock.patch('requests.get', side_effect=mock_pyquery)
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
     def test_rankings_integration_bad_url(self, *args, **kwargs):
         with pytest.raises(ValueError):
             rankings = Rankings('BAD')
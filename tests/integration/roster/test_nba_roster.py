@@ -2,6 +2,7 @@ import mock
 import os
 import pandas as pd
 import pytest
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 from flexmock import flexmock
 from sportsreference import utils
@@ -35,7 +36,7 @@ def mock_pyquery(url):
 
 
 class TestNBAPlayer:
-    @mock.patch('requests.get', side_effect=mock_pyquery)
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
     def setup_method(self, *args, **kwargs):
         self.results_career = {
             'player_id': 'hardeja01',
@@ -1167,7 +1168,7 @@ class TestNBAPlayer:
 
 
 class TestNBARoster:
-    @mock.patch('requests.get', side_effect=mock_pyquery)
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
     def test_roster_class_pulls_all_player_stats(self, *args, **kwargs):
         flexmock(utils) \
             .should_receive('_find_year_for_season') \
@@ -1180,19 +1181,92 @@ class TestNBARoster:
             assert player.name in ['James Harden', 'Tarik Black',
                                    'Ryan Anderson', 'Trevor Ariza']
 
-    @mock.patch('requests.get', side_effect=mock_pyquery)
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
+    def test_concurrent_roster_keeps_roster_order(self, *args, **kwargs):
+        flexmock(utils) \
+            .should_receive('_find_year_for_season') \
+            .and_return('2018')
+        sequential = Roster('HOU', workers=1)
+        concurrent = Roster('HOU', workers=4)
+
+        assert [player.player_id for player in concurrent.players] == \
+            [player.player_id for player in sequential.players]
+
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
+    def test_roster_players_are_parsed_in_process_pool(self, *args,
+                                                       **kwargs):
+        flexmock(utils) \
+            .should_receive('_find_year_for_season') \
+            .and_return('2018')
+        with mock.patch('sportsreference.nba.roster.ProcessPoolExecutor',
+                        wraps=ProcessPoolExecutor) as executor:
+            roster = Roster('HOU', workers=4)
+
+        executor.assert_called_once_with(4)
+        assert args[0].call_count == 5
+        assert [player.player_id for player in roster.players] == \
+            ['anderry01', 'arizatr01', 'blackta01', 'hardeja01']
+        assert roster.players[-1].name == 'James Harden'
+        assert roster.players[-1].points == 15809
+
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
+    def test_roster_parses_without_process_pool(self, *args, **kwargs):
+        flexmock(utils) \
+            .should_receive('_find_year_for_season') \
+            .and_return('2018')
+        with mock.patch('sportsreference.nba.roster.ProcessPoolExecutor',
+                        side_effect=NotImplementedError):
+            roster = Roster('HOU', workers=4)
+
+        assert [player.player_id for player in roster.players] == \
+            ['anderry01', 'arizatr01', 'blackta01', 'hardeja01']
+        assert roster.players[-1].name == 'James Harden'
+
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
+    def test_slim_roster_only_pulls_team_page(self, *args, **kwargs):
+        flexmock(utils) \
+            .should_receive('_find_year_for_season') \
+            .and_return('2018')
+        roster = Roster('HOU', slim=True)
+
+        assert args[0].call_count == 1
+        assert [player.player_id for player in roster.players] == \
+            ['anderry01', 'arizatr01', 'blackta01', 'hardeja01']
+        harden = roster.players[-1]
+        assert harden.name == 'James Harden'
+        assert harden.position == 'SG'
+        assert harden.height == '6-5'
+        assert harden.weight == 220
+        assert harden.games_played == 72
+        assert harden.points == 2191
+        assert harden.field_goal_percentage == 0.449
+        assert harden.year == '2018'
+
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
+    def test_slim_player_loads_full_player(self, *args, **kwargs):
+        flexmock(utils) \
+            .should_receive('_find_year_for_season') \
+            .and_return('2018')
+        roster = Roster('HOU', slim=True)
+
+        player = roster.players[-1].load()
+
+        assert isinstance(player, Player)
+        assert player.player_id == 'hardeja01'
+        assert player.name == 'James Harden'
+
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
     def test_bad_url_raises_value_error(self, *args, **kwargs):
         with pytest.raises(ValueError):
             roster = Roster('BAD')
 
-    @mock.patch('requests.get', side_effect=mock_pyquery)
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
     def test_roster_from_team_class(self, *args, **kwargs):
         flexmock(Team) \
             .should_receive('_parse_team_data') \
             .and_return(None)
         team = Team(None, 1, '2018')
-        mock_abbreviation = mock.PropertyMock(return_value='HOU')
-        type(team)._abbreviation = mock_abbreviation
+        team._abbreviation = 'HOU'
 
         assert len(team.roster.players) == 4
 
@@ -1200,4 +1274,16 @@ class TestNBARoster:
             assert player.name in ['James Harden', 'Tarik Black',
                                    'Ryan Anderson', 'Trevor Ariza']
 
-        type(team)._abbreviation = None
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
+    def test_slim_roster_to_arrow_is_typed(self, *args, **kwargs):
+        flexmock(utils) \
+            .should_receive('_find_year_for_season') \
+            .and_return('2018')
+        roster = Roster('HOU', slim=True)
+
+        table = roster.to_arrow()
+
+        assert table.column('player_id').to_pylist() == \
+            ['anderry01', 'arizatr01', 'blackta01', 'hardeja01']
+        assert str(table.schema.field('points').type) == 'int64'
+        assert table.column('points').to_pylist()[-1] == 2191
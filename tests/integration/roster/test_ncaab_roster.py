@@ -27,7 +27,7 @@ def mock_pyquery(url):
 
 
 class TestNCAABPlayer:
-    @mock.patch('requests.get', side_effect=mock_pyquery)
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
     def setup_method(self, *args, **kwargs):
         self.results_career = {
             'assist_percentage': 17.3,
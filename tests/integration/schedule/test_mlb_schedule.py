@@ -43,7 +43,7 @@ class MockDateTime:
 
 
 class TestMLBSchedule:
-    @mock.patch('requests.get', side_effect=mock_pyquery)
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
     def setup_method(self, *args, **kwargs):
         self.results = {
             'game': 2,
@@ -167,6 +167,18 @@ class TestMLBSchedule:
 
         assert len(result) == NUM_GAMES_IN_SCHEDULE
 
+    def test_mlb_schedule_concurrent_dataframe_extended_matches(self):
+        flexmock(Boxscore) \
+            .should_receive('_parse_game_data') \
+            .and_return(None)
+        flexmock(Boxscore) \
+            .should_receive('dataframe') \
+            .and_return(pd.DataFrame([{'key': 'value'}]))
+
+        result = self.schedule.concurrent_dataframe_extended(workers=4)
+
+        assert len(result) == NUM_GAMES_IN_SCHEDULE
+
     def test_no_games_for_date_raises_value_error(self):
         with pytest.raises(ValueError):
             self.schedule(datetime.now())
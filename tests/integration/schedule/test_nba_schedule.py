@@ -45,7 +45,7 @@ class MockDateTime:
 
 
 class TestNBASchedule:
-    @mock.patch('requests.get', side_effect=mock_pyquery)
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
     def setup_method(self, *args, **kwargs):
         self.results = {
             'game': 2,
@@ -160,6 +160,43 @@ class TestNBASchedule:
 
         assert len(result) == NUM_GAMES_IN_SCHEDULE
 
+    def test_nba_schedule_concurrent_dataframe_extended_matches(self):
+        flexmock(Boxscore) \
+            .should_receive('_parse_game_data') \
+            .and_return(None)
+        flexmock(Boxscore) \
+            .should_receive('dataframe') \
+            .and_return(pd.DataFrame([{'key': 'value'}]))
+
+        result = self.schedule.concurrent_dataframe_extended(workers=4)
+
+        assert len(result) == NUM_GAMES_IN_SCHEDULE
+
     def test_no_games_for_date_raises_value_error(self):
         with pytest.raises(ValueError):
             self.schedule(datetime.now())
+
+    def test_nba_schedule_to_arrow_is_typed(self):
+        pytest.importorskip('pyarrow')
+        table = self.schedule.to_arrow()
+
+        assert table.num_rows == NUM_GAMES_IN_SCHEDULE
+        assert table.schema.names[0] == 'boxscore_index'
+        assert str(table.schema.field('points_scored').type) == 'int64'
+        assert str(table.schema.field('field_goal_percentage').type) == \
+            'double'
+        assert str(table.schema.field('datetime').type) == 'timestamp[us]'
+        row = table.slice(1, 1).to_pylist()[0]
+        for attribute, value in self.results.items():
+            assert row[attribute] == value
+
+    def test_nba_schedule_to_parquet_writes_every_game(self, tmpdir):
+        parquet = pytest.importorskip('pyarrow.parquet')
+        path = str(tmpdir.join('schedule.parquet'))
+
+        result = self.schedule.to_parquet(path, batch_size=25)
+
+        assert result == NUM_GAMES_IN_SCHEDULE
+        table = parquet.read_table(path)
+        assert table.num_rows == NUM_GAMES_IN_SCHEDULE
+        assert table.schema.equals(self.schedule.to_arrow().schema)
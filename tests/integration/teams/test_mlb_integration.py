@@ -48,7 +48,7 @@ class MockDateTime:
 
 
 class TestMLBIntegration:
-    @mock.patch('requests.get', side_effect=mock_pyquery)
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
     def setup_method(self, *args, **kwargs):
         self.results = {
             'rank': 3,
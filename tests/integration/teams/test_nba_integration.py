@@ -41,7 +41,7 @@ class MockDateTime:
 
 
 class TestNBAIntegration:
-    @mock.patch('requests.get', side_effect=mock_pyquery)
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
     def setup_method(self, *args, **kwargs):
         self.results = {
             'rank': 26,
@@ -138,6 +138,18 @@ class TestNBAIntegration:
         assert len(result) == len(self.abbreviations)
         assert set(result.columns.values) == set(self.results.keys())
 
+    def test_nba_integration_to_arrow_is_typed(self):
+        table = self.teams.to_arrow()
+
+        assert table.num_rows == len(self.abbreviations)
+        assert set(table.schema.names) == set(self.results.keys())
+        assert str(table.schema.field('points').type) == 'int64'
+        assert str(table.schema.field('field_goal_percentage').type) == \
+            'double'
+        detroit = [row for row in table.to_pylist()
+                   if row['abbreviation'] == 'DET'][0]
+        assert detroit == self.results
+
     def test_nba_invalid_team_name_raises_value_error(self):
         with pytest.raises(ValueError):
             self.teams('INVALID_NAME')
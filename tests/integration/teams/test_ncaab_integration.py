@@ -60,7 +60,7 @@ class MockDateTime:
 
 
 class TestNCAABIntegration:
-    @mock.patch('requests.get', side_effect=mock_pyquery)
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
     def setup_method(self, *args, **kwargs):
         self.results = {
             'conference': 'big-ten',
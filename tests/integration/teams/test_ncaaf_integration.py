@@ -46,7 +46,7 @@ class MockDateTime:
 
 
 class TestNCAAFIntegration:
-    @mock.patch('requests.get', side_effect=mock_pyquery)
+    @mock.patch('requests.Session.get', side_effect=mock_pyquery)
     def setup_method(self, *args, **kwargs):
         self.results = {
             'abbreviation': 'PURDUE',
@@ -0,0 +1,102 @@
+import os
+import pytest
+from mock import patch
+from requests.exceptions import HTTPError
+from sportsreference import archive, fetch
+from sportsreference.archive import PageArchive
+from sportsreference.nba.constants import SEASON_PAGE_URL
+from sportsreference.nba.teams import Teams
+
+
+class MockResponse:
+    def __init__(self, text, status_code=200):
+        self.status_code = status_code
+        self.text = text
+        self.headers = {}
+
+
+def mock_request(url, headers=None):
+    if 'error' in url:
+        return MockResponse('', 500)
+    if 'missing' in url:
+        return MockResponse('Not Found', 404)
+    return MockResponse('<html><body>%s</body></html>' % url)
+
+
+def no_network(url, headers=None):
+    raise AssertionError('Replayed pages must not be downloaded: %s' % url)
+
+
+class TestPageArchive:
+    def test_pages_are_stored_and_indexed_by_url(self, tmpdir):
+        path = str(tmpdir.join('pages.archive'))
+        pages = PageArchive(path)
+
+        pages.add('http://www.example.com/1.html', '<html>1</html>')
+        pages.add('http://www.example.com/2.html', 'Not Found', 404)
+        pages.add('http://www.example.com/1.html', '<html>one</html>')
+        pages.close()
+        pages = PageArchive(path)
+
+        assert len(pages) == 2
+        assert pages.urls == ['http://www.example.com/1.html',
+                              'http://www.example.com/2.html']
+        assert pages.get('http://www.example.com/1.html') == \
+            ('<html>one</html>', 200)
+        assert pages.get('http://www.example.com/2.html') == \
+            ('Not Found', 404)
+        assert pages.get('http://www.example.com/3.html') is None
+        assert 'http://www.example.com/1.html' in pages
+        assert 'http://www.example.com/3.html' not in pages
+
+    @patch('requests.Session.get', side_effect=mock_request)
+    def test_record_saves_every_downloaded_page(self, mock_get, tmpdir):
+        path = str(tmpdir.join('pages.archive'))
+        previous = fetch.get_transport()
+
+        with archive.record(path) as pages:
+            fetch.get_html('http://www.example.com/1.html')
+            with pytest.raises(HTTPError):
+                fetch.get_html('http://www.example.com/missing.html')
+            with pytest.raises(HTTPError):
+                fetch.get_html('http://www.example.com/error.html')
+            assert len(pages) == 2
+
+        assert fetch.get_transport() is previous
+        assert PageArchive(path).urls == [
+            'http://www.example.com/1.html',
+            'http://www.example.com/missing.html'
+        ]
+
+    @patch('requests.Session.get', side_effect=mock_request)
+    def test_replay_serves_recorded_pages_offline(self, mock_get, tmpdir):
+        path = str(tmpdir.join('pages.archive'))
+        url = 'http://www.example.com/1.html'
+        with archive.record(path):
+            recorded = fetch.get_page(url)('body').text()
+        mock_get.side_effect = no_network
+
+        with archive.replay(path) as transport:
+            replayed = fetch.get_page(url)('body').text()
+            with pytest.raises(HTTPError):
+                fetch.get_html('http://www.example.com/2.html')
+
+        assert replayed == recorded
+        assert transport.missing == ['http://www.example.com/2.html']
+        assert mock_get.call_count == 1
+
+    @patch('requests.Session.get', side_effect=no_network)
+    def test_replay_builds_teams_from_archive(self, mock_get, tmpdir):
+        path = str(tmpdir.join('pages.archive'))
+        fixture = os.path.join(os.path.dirname(__file__), '..', 'integration',
+                               'teams', 'nba_stats', 'NBA_2017.html')
+        pages = PageArchive(path)
+        pages.add(SEASON_PAGE_URL % 2017, open(fixture, 'r').read())
+        pages.close()
+
+        with archive.replay(path):
+            teams = Teams(2017)
+
+        assert len(teams) == 30
+        assert teams('DET').name == 'Detroit Pistons'
+        assert mock_get.call_count == 0
@@ -0,0 +1,64 @@
+import os
+import pytest
+from sportsreference import fetch
+
+
+# Measuring memory requires tracemalloc, which isn't available on Python 2.
+pytest.importorskip('tracemalloc')
+from benchmarks import parsers  # noqa: E402
+
+
+def benchmark(key):
+    return [benchmark for benchmark in parsers.BENCHMARKS
+            if benchmark.key == key][0]
+
+
+class TestParserBenchmarks:
+    def test_every_fixture_exists(self):
+        for benchmark in parsers.BENCHMARKS:
+            for _, path in benchmark.pages:
+                assert os.path.exists(os.path.join(parsers.FIXTURES, path))
+
+    def test_every_benchmark_has_a_baseline(self):
+        baselines = parsers.load_baselines()
+
+        for benchmark in parsers.BENCHMARKS:
+            assert set(parsers.METRICS) <= set(baselines[benchmark.key])
+
+    def test_measure_builds_object_from_fixtures(self):
+        previous = fetch.get_transport()
+
+        result = parsers.measure(benchmark('nba.Boxscores'), repeat=2)
+
+        assert fetch.get_transport() is previous
+        assert 0 < result['best'] <= result['latency']
+        assert result['peak_memory'] > 0
+        assert result['allocations'] > 0
+
+    def test_measure_raises_value_error_for_missing_fixture(self):
+        missing = parsers.Benchmark('nba', 'Boxscores',
+                                    benchmark('nba.Boxscores').build, [])
+
+        with pytest.raises(ValueError):
+            parsers.measure(missing, repeat=1)
+
+    def test_compare_reports_metrics_over_tolerance(self):
+        baseline = {'latency': 0.1, 'peak_memory': 1000, 'allocations': 100}
+        result = {'latency': 0.2, 'peak_memory': 1100, 'allocations': 200}
+
+        assert parsers.compare(result, baseline, 0.25) == ['allocations']
+        assert parsers.compare(result, baseline, 0.25, parsers.METRICS) == \
+            ['latency', 'allocations']
+        assert parsers.compare(result, baseline, 1.0, parsers.METRICS) == []
+        assert parsers.compare(result, None) == []
+
+    def test_save_baselines_keeps_other_benchmarks(self, tmpdir):
+        path = str(tmpdir.join('baselines.json'))
+        parsers.save_baselines({'nba.Teams': {'latency': 0.1}}, path)
+
+        parsers.save_baselines({'nhl.Teams': {'latency': 0.2}}, path)
+
+        assert parsers.load_baselines(path) == {
+            'nba.Teams': {'latency': 0.1},
+            'nhl.Teams': {'latency': 0.2}
+        }
@@ -0,0 +1,341 @@
+import os
+import time
+from flexmock import flexmock
+from mock import patch
+from sportsreference import fetch, utils
+from sportsreference.cache import IMMUTABLE, LOW_WATER_MARK, PageCache
+
+
+class MockDateTime:
+    def __init__(self, year, month, day=1):
+        self.year = year
+        self.month = month
+        self.day = day
+
+
+class MockResponse:
+    def __init__(self, text, status_code=200, headers=None):
+        self.status_code = status_code
+        self.text = text
+        self.headers = headers or {}
+
+
+def mock_request(url):
+    return MockResponse('<html><body>%s</body></html>' % url)
+
+
+class TestPageCache:
+    def setup_method(self, *args, **kwargs):
+        flexmock(utils) \
+            .should_receive('_todays_date') \
+            .and_return(MockDateTime(2018, 1, 15))
+
+    def teardown_method(self, *args, **kwargs):
+        fetch.set_cache(None)
+
+    def test_completed_boxscore_pages_never_expire(self, tmpdir):
+        cache = PageCache(str(tmpdir))
+
+        urls = [
+            'https://www.basketball-reference.com/boxscores/201710310LAL.html',
+            'https://www.baseball-reference.com/boxes/BOS/BOS201706070.shtml',
+            'https://www.pro-football-reference.com/boxscores/'
+            '201801130nwe.htm',
+            'https://www.sports-reference.com/cbb/boxscores/'
+            '2018-01-13-12-kansas.html'
+        ]
+        for url in urls:
+            assert cache.ttl(url) is IMMUTABLE
+
+    def test_unfinished_boxscore_pages_use_default_ttl(self, tmpdir):
+        cache = PageCache(str(tmpdir), default_ttl=30)
+
+        urls = [
+            'https://www.basketball-reference.com/boxscores/201801140LAL.html',
+            'https://www.basketball-reference.com/boxscores/201801150LAL.html',
+            'https://www.pro-football-reference.com/boxscores/'
+            '201802040nwe.htm',
+            'https://www.sports-reference.com/cbb/boxscores/'
+            '2018-01-20-12-kansas.html',
+            'https://www.example.com/boxscores/game.html'
+        ]
+        for url in urls:
+            assert cache.ttl(url) == 30
+
+    def test_completed_season_pages_never_expire(self, tmpdir):
+        cache = PageCache(str(tmpdir))
+
+        url = 'http://www.basketball-reference.com/leagues/NBA_2017.html'
+        assert cache.ttl(url) is IMMUTABLE
+
+    def test_current_season_pages_use_default_ttl(self, tmpdir):
+        cache = PageCache(str(tmpdir), default_ttl=30)
+
+        url = 'http://www.basketball-reference.com/leagues/NBA_2018.html'
+        assert cache.ttl(url) == 30
+
+    def test_boxscore_index_pages_use_default_ttl(self, tmpdir):
+        cache = PageCache(str(tmpdir), default_ttl=30)
+
+        url = ('https://www.basketball-reference.com/boxscores/'
+               '?month=1&day=15&year=2018')
+        assert cache.ttl(url) == 30
+
+    def test_completed_boxscore_index_pages_never_expire(self, tmpdir):
+        cache = PageCache(str(tmpdir), default_ttl=30)
+
+        urls = [
+            'https://www.basketball-reference.com/boxscores/'
+            '?month=1&day=5&year=2018',
+            'https://www.baseball-reference.com/boxes/'
+            '?year=2017&month=6&day=7'
+        ]
+        for url in urls:
+            assert cache.ttl(url) is IMMUTABLE
+
+    def test_december_index_pages_of_current_season_expire(self, tmpdir):
+        flexmock(utils) \
+            .should_receive('_todays_date') \
+            .and_return(MockDateTime(2017, 12, 15))
+        cache = PageCache(str(tmpdir), default_ttl=30)
+
+        urls = [
+            'https://www.basketball-reference.com/boxscores/'
+            '?month=12&day=15&year=2017',
+            'https://www.hockey-reference.com/boxscores/index.fcgi?'
+            'month=12&day=14&year=2017',
+            'https://www.sports-reference.com/cbb/boxscores/index.cgi?'
+            'month=12&day=16&year=2017'
+        ]
+        for url in urls:
+            assert cache.ttl(url) == 30
+
+    def test_custom_ttl_overrides_defaults(self, tmpdir):
+        cache = PageCache(str(tmpdir), ttls=[(r'/players/', 5)])
+
+        url = 'https://www.basketball-reference.com/players/h/hardeja01.html'
+        assert cache.ttl(url) == 5
+
+    def test_page_is_returned_from_cache(self, tmpdir):
+        cache = PageCache(str(tmpdir))
+        url = 'http://www.example.com/page.html'
+
+        cache.set(url, '<html>contents</html>')
+
+        assert cache.get(url) == '<html>contents</html>'
+
+    def test_missing_page_returns_none(self, tmpdir):
+        cache = PageCache(str(tmpdir))
+
+        assert cache.get('http://www.example.com/page.html') is None
+
+    def test_expired_page_returns_none(self, tmpdir):
+        cache = PageCache(str(tmpdir), default_ttl=30)
+        url = 'http://www.example.com/page.html'
+
+        cache.set(url, '<html>contents</html>')
+        expired = time.time() + 60
+        flexmock(time).should_receive('time').and_return(expired)
+
+        assert cache.get(url) is None
+
+    def test_stale_page_returns_revalidation_headers(self, tmpdir):
+        cache = PageCache(str(tmpdir), default_ttl=30)
+        url = 'http://www.example.com/page.html'
+
+        cache.set(url, '<html>contents</html>',
+                  {'etag': '"abc"',
+                   'last_modified': 'Wed, 31 Oct 2018 00:00:00 GMT'})
+        html, headers = cache.stale(url)
+
+        assert html == '<html>contents</html>'
+        assert headers == {
+            'If-None-Match': '"abc"',
+            'If-Modified-Since': 'Wed, 31 Oct 2018 00:00:00 GMT'
+        }
+
+    def test_stale_page_without_validators_returns_none(self, tmpdir):
+        cache = PageCache(str(tmpdir))
+        url = 'http://www.example.com/page.html'
+
+        cache.set(url, '<html>contents</html>',
+                  {'etag': None, 'last_modified': None})
+
+        assert cache.stale(url) == (None, None)
+        assert cache.stale('http://www.example.com/missing.html') == \
+            (None, None)
+
+    def test_refresh_marks_expired_page_fresh(self, tmpdir):
+        cache = PageCache(str(tmpdir), default_ttl=30)
+        url = 'http://www.example.com/page.html'
+
+        cache.set(url, '<html>contents</html>', {'etag': '"abc"'})
+        expired = time.time() + 60
+        flexmock(time).should_receive('time').and_return(expired)
+        assert cache.get(url) is None
+        cache.refresh(url)
+
+        assert cache.get(url) == '<html>contents</html>'
+        assert cache.stale(url)[1] == {'If-None-Match': '"abc"'}
+
+    def test_pages_are_stored_compressed(self, tmpdir):
+        cache = PageCache(str(tmpdir))
+        html = '<html>%s</html>' % ('<td>1</td>' * 10000)
+
+        cache.set('http://www.example.com/page.html', html)
+
+        assert 0 < cache.size < len(html) / 10
+
+    def test_least_recently_used_pages_are_evicted(self, tmpdir):
+        cache = PageCache(str(tmpdir))
+        first = 'http://www.example.com/1.html'
+        second = 'http://www.example.com/2.html'
+        third = 'http://www.example.com/3.html'
+
+        cache.set(first, '<html>page</html>')
+        cache.set(second, '<html>page</html>')
+        os.utime(cache._path(first), (1, 1))
+        os.utime(cache._path(second), (2, 2))
+        # Fit the third page in the cache once the first is evicted, allowing
+        # for a few bytes of difference in the stored fetch times.
+        cache._max_bytes = int(cache.size * 1.25)
+        cache.set(third, '<html>page</html>')
+
+        assert cache.get(first) is None
+        assert cache.get(second) == '<html>page</html>'
+        assert cache.get(third) == '<html>page</html>'
+        assert cache.size <= cache._max_bytes
+
+    def test_eviction_shrinks_cache_to_low_water_mark(self, tmpdir):
+        cache = PageCache(str(tmpdir))
+        urls = ['http://www.example.com/%s.html' % page for page in range(4)]
+
+        for index, url in enumerate(urls[:3]):
+            cache.set(url, '<html>page</html>')
+            os.utime(cache._path(url), (index + 1, index + 1))
+        cache._max_bytes = cache.size + 8
+        cache.set(urls[3], '<html>page</html>')
+
+        assert cache.get(urls[0]) is None
+        assert cache.get(urls[1]) is None
+        assert cache.get(urls[2]) == '<html>page</html>'
+        assert cache.get(urls[3]) == '<html>page</html>'
+        assert cache.size <= cache._max_bytes * LOW_WATER_MARK
+
+    def test_invalidate_removes_page(self, tmpdir):
+        cache = PageCache(str(tmpdir))
+        url = 'http://www.example.com/page.html'
+
+        cache.set(url, '<html>contents</html>')
+        cache.invalidate(url)
+
+        assert cache.get(url) is None
+        assert cache.size == 0
+
+    def test_clear_removes_all_pages(self, tmpdir):
+        cache = PageCache(str(tmpdir))
+
+        cache.set('http://www.example.com/first.html', '<html></html>')
+        cache.set('http://www.example.com/second.html', '<html></html>')
+        cache.clear()
+
+        assert cache.size == 0
+        assert cache._entries() == []
+
+    @patch('requests.Session.get', side_effect=mock_request)
+    def test_fetch_reads_pages_from_cache(self, mock_get, tmpdir):
+        fetch.set_cache(PageCache(str(tmpdir)))
+        url = ('https://www.basketball-reference.com/boxscores/'
+               '201710310LAL.html')
+
+        first = fetch.get_html(url)
+        second = fetch.get_html(url)
+
+        assert first == second
+        assert mock_get.call_count == 1
+
+    @patch('requests.Session.get')
+    def test_fetch_revalidates_expired_pages(self, mock_get, tmpdir):
+        def conditional_request(url, headers=None):
+            if headers and headers.get('If-None-Match') == '"abc"':
+                return MockResponse('', 304)
+            return MockResponse('<html><body>teams</body></html>',
+                                headers={'ETag': '"abc"'})
+
+        mock_get.side_effect = conditional_request
+        fetch.set_cache(PageCache(str(tmpdir), default_ttl=30))
+        url = 'http://www.basketball-reference.com/leagues/NBA_2018.html'
+
+        fetch.get_page(url)
+        expired = time.time() + 60
+        flexmock(time).should_receive('time').and_return(expired)
+        second = fetch.get_page(url)
+
+        assert mock_get.call_count == 2
+        assert mock_get.call_args[1]['headers'] == {'If-None-Match': '"abc"'}
+        assert second('body').text() == 'teams'
+        assert fetch.get_cache().get(url) == \
+            '<html><body>teams</body></html>'
+
+    @patch('requests.Session.get')
+    def test_revalidated_pages_are_copied_instead_of_parsed(self, mock_get,
+                                                            tmpdir):
+        def conditional_request(url, headers=None):
+            if headers and headers.get('If-None-Match') == '"abc"':
+                return MockResponse('', 304)
+            return MockResponse('<html><body>teams</body></html>',
+                                headers={'ETag': '"abc"'})
+
+        mock_get.side_effect = conditional_request
+        fetch.set_cache(PageCache(str(tmpdir), default_ttl=30))
+        url = 'http://www.basketball-reference.com/leagues/NBA_2018.html'
+        pages = [fetch.get_page(url)]
+        clock = [time.time()]
+        flexmock(time).should_receive('time').replace_with(lambda: clock[0])
+
+        texts = []
+
+        with patch.object(fetch, '_load', wraps=fetch._load) as load:
+            for _ in range(2):
+                clock[0] += 60
+                pages.append(fetch.get_page(url))
+                texts.append(pages[-1]('body').text())
+                pages[-1]('body').text('changed')
+
+        assert mock_get.call_count == 3
+        assert load.call_count == 1
+        assert pages[2] is not pages[1]
+        assert texts == ['teams', 'teams']
+
+    @patch('requests.Session.get', side_effect=mock_request)
+    def test_cached_pages_are_parsed_for_every_caller(self, mock_get, tmpdir):
+        fetch.set_cache(PageCache(str(tmpdir)))
+        url = ('https://www.basketball-reference.com/boxscores/'
+               '201710310LAL.html')
+
+        first = fetch.get_page(url)
+        first('body').text('changed')
+        second = fetch.get_page(url)
+
+        assert mock_get.call_count == 1
+        assert second is not first
+        assert second('body').text() == url
+
+    @patch('requests.Session.get')
+    def test_fetch_replaces_changed_pages(self, mock_get, tmpdir):
+        responses = [MockResponse('<html><body>old</body></html>',
+                                  headers={'ETag': '"old"'}),
+                     MockResponse('<html><body>new</body></html>',
+                                  headers={'ETag': '"new"'})]
+        mock_get.side_effect = lambda url, headers=None: responses.pop(0)
+        fetch.set_cache(PageCache(str(tmpdir), default_ttl=30))
+        url = 'http://www.basketball-reference.com/leagues/NBA_2018.html'
+
+        first = fetch.get_page(url)
+        expired = time.time() + 60
+        flexmock(time).should_receive('time').and_return(expired)
+        second = fetch.get_page(url)
+
+        assert second is not first
+        assert second('body').text() == 'new'
+        assert fetch.get_cache().stale(url)[1] == {'If-None-Match': '"new"'}
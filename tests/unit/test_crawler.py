@@ -0,0 +1,111 @@
+import gc
+import pandas as pd
+import pytest
+import weakref
+from flexmock import flexmock
+from sportsreference import crawler
+from sportsreference.crawler import SeasonCrawler
+
+
+class MockGame:
+    def __init__(self, boxscore_index):
+        self.boxscore_index = boxscore_index
+
+
+class MockTeam:
+    def __init__(self, boxscores):
+        self.schedule = [MockGame(boxscore) for boxscore in boxscores]
+
+
+class MockBoxscore:
+    created = []
+    live = weakref.WeakSet()
+    most_live = 0
+
+    def __init__(self, uri):
+        MockBoxscore.created.append(uri)
+        MockBoxscore.live.add(self)
+        self.uri = uri
+
+    @property
+    def dataframe(self):
+        gc.collect()
+        MockBoxscore.most_live = max(MockBoxscore.most_live,
+                                     len(MockBoxscore.live))
+        if self.uri == 'bad':
+            return None
+        return pd.DataFrame([{'home_points': len(self.uri),
+                              'winning_name': self.uri}],
+                            index=[self.uri])
+
+
+class MockTeams:
+    def __init__(self, year):
+        self.teams = [MockTeam(['201710170GSW', '201710180LAL',
+                                '<td data-stat="date_game">Oct 20</td>']),
+                      MockTeam(['201710170GSW', 'bad'])]
+
+    def __iter__(self):
+        return iter(self.teams)
+
+
+class MockModule:
+    Teams = MockTeams
+    Boxscore = MockBoxscore
+
+
+class TestSeasonCrawler:
+    def setup_method(self, *args, **kwargs):
+        MockBoxscore.created = []
+        MockBoxscore.most_live = 0
+        flexmock(crawler) \
+            .should_receive('_league_module') \
+            .and_return(MockModule)
+
+    def test_unknown_league_raises_value_error(self):
+        with pytest.raises(ValueError):
+            SeasonCrawler('xfl', '2018')
+
+    def test_boxscore_uris_are_unique_and_completed(self, tmpdir):
+        season = SeasonCrawler('nba', '2018', str(tmpdir.join('nba.jsonl')))
+
+        assert season.boxscore_uris == ['201710170GSW', '201710180LAL', 'bad']
+
+    def test_crawl_saves_every_boxscore(self, tmpdir):
+        season = SeasonCrawler('nba', '2018', str(tmpdir.join('nba.jsonl')))
+
+        result = season.crawl()
+
+        assert result == 2
+        assert season.failed == ['bad']
+        assert sorted(MockBoxscore.created) == \
+            ['201710170GSW', '201710180LAL', 'bad']
+        df = season.dataframes
+        assert sorted(df.index) == ['201710170GSW', '201710180LAL']
+        assert df.loc['201710170GSW', 'home_points'] == 12
+
+    def test_crawl_resumes_from_checkpoint(self, tmpdir):
+        checkpoint = tmpdir.join('nba.jsonl')
+        checkpoint.write('{"uri": "201710170GSW", "data": {"home_points": '
+                         '12, "winning_name": "201710170GSW"}}\n'
+                         '{"uri": "201710180LAL", "da')
+        season = SeasonCrawler('nba', '2018', str(checkpoint))
+
+        result = season.crawl()
+
+        assert result == 1
+        assert sorted(MockBoxscore.created) == ['201710180LAL', 'bad']
+        assert season.completed == set(['201710170GSW', '201710180LAL'])
+        assert len(season.dataframes) == 2
+
+    def test_crawl_only_keeps_a_window_of_boxscores(self, tmpdir):
+        uris = ['2017101%02dGSW' % day for day in range(20)]
+        season = SeasonCrawler('nba', '2018', str(tmpdir.join('nba.jsonl')),
+                               workers=2)
+        season._boxscore_uris = uris
+
+        result = season.crawl()
+
+        assert result == 20
+        assert sorted(MockBoxscore.created) == uris
+        assert MockBoxscore.most_live <= 2 * crawler.BOXSCORES_PER_WORKER
@@ -0,0 +1,231 @@
+import mock
+import pandas as pd
+import pytest
+import sys
+from collections import OrderedDict
+from importlib import import_module
+from types import ModuleType
+from sportsreference import export
+
+
+parquet = pytest.importorskip('pyarrow.parquet')
+
+
+def mock_constants():
+    package = ModuleType('sportsreference.test')
+    constants = ModuleType('sportsreference.test.constants')
+    constants.SCHEDULE_TYPES = {
+        'boxscore_index': 'string',
+        'contract': 'string',
+        'percentage': 'float64',
+        'points': 'int64',
+        'result': 'string'
+    }
+    constants.PLAYER_TYPES = {
+        'name': 'string',
+        'points': 'int64',
+        'season': 'string'
+    }
+    return {'sportsreference.test': package,
+            'sportsreference.test.constants': constants}
+
+
+class Game(object):
+    __module__ = 'sportsreference.test.schedule'
+
+    def __init__(self, boxscore, points, percentage):
+        self._boxscore = boxscore
+        self._points = points
+        self._percentage = percentage
+
+    @property
+    def dataframe(self):
+        if self._points is None:
+            return None
+        return pd.DataFrame([{'points': self._points,
+                              'percentage': self._percentage,
+                              'result': 'Win'}],
+                            index=[self._boxscore])
+
+    @property
+    def boxscore_index(self):
+        """
+        Returns a ``string`` of the URI for a boxscore.
+        """
+        return self._boxscore
+
+    @property
+    def points(self):
+        """
+        Returns an ``int`` of the number of points scored.
+        """
+        return self._points
+
+    @property
+    def percentage(self):
+        """
+        Returns a ``float`` of the field goal percentage.
+        """
+        return self._percentage
+
+    @property
+    def result(self):
+        """
+        Returns a ``string`` of the result.
+        """
+        return 'Win'
+
+    @property
+    def contract(self):
+        """
+        Returns a ``dictionary`` of the wages.
+        """
+        return {'2017-18': '$100'}
+
+    @property
+    def boxscore(self):
+        """
+        Returns an instance of the Boxscore class.
+        """
+        return None
+
+
+class Player(object):
+    __module__ = 'sportsreference.test.roster'
+
+    @property
+    def dataframe(self):
+        return pd.DataFrame([{'points': 10}, {'points': 15}],
+                            index=[['2016-17', 'Career']])
+
+    @property
+    def season(self):
+        """
+        Returns a ``string`` of the season.
+        """
+        return 'Career'
+
+    @property
+    def name(self):
+        """
+        Returns a ``string`` of the player's name.
+        """
+        return 'James Harden'
+
+    @property
+    def points(self):
+        """
+        Returns an ``int`` of the number of points scored.
+        """
+        return 15
+
+
+class TestExport:
+    def setup_method(self):
+        export._schemas.clear()
+        self.patcher = mock.patch.dict(sys.modules, mock_constants())
+        self.patcher.start()
+
+    def teardown_method(self):
+        self.patcher.stop()
+        export._schemas.clear()
+
+    def test_schema_is_declared_by_league_constants(self):
+        schema = export.schema(Game)
+
+        assert schema.names == ['boxscore_index', 'contract', 'percentage',
+                                'points', 'result']
+        assert str(schema.field('points').type) == 'int64'
+        assert str(schema.field('percentage').type) == 'double'
+        assert str(schema.field('contract').type) == 'string'
+
+    def test_undeclared_class_raises_value_error(self):
+        class Conference(object):
+            __module__ = 'sportsreference.test.conferences'
+
+        with pytest.raises(ValueError):
+            export.schema(Conference)
+
+    def test_every_declared_column_is_a_property(self):
+        for league in ['mlb', 'nba', 'ncaab', 'ncaaf', 'nfl', 'nhl']:
+            for module, name in [('teams', 'Team'), ('schedule', 'Game'),
+                                 ('boxscore', 'Boxscore')]:
+                cls = getattr(import_module('sportsreference.%s.%s'
+                                            % (league, module)), name)
+                index = export.INDEX_COLUMNS.get(name)
+                for column in export._declared_types(cls):
+                    if column != index:
+                        assert isinstance(getattr(cls, column), property)
+
+    def test_to_arrow_skips_objects_without_dataframe(self):
+        games = [Game('201710170GSW', 108, 0.5),
+                 Game('201710190GSW', None, None),
+                 Game('201710210GSW', 117, None)]
+
+        table = export.to_arrow(games)
+
+        assert table.to_pylist() == [
+            {'boxscore_index': '201710170GSW',
+             'contract': '{"2017-18": "$100"}',
+             'percentage': 0.5,
+             'points': 108,
+             'result': 'Win'},
+            {'boxscore_index': '201710210GSW',
+             'contract': '{"2017-18": "$100"}',
+             'percentage': None,
+             'points': 117,
+             'result': 'Win'}
+        ]
+
+    def test_to_arrow_returns_none_without_rows(self):
+        assert export.to_arrow([]) is None
+        assert export.to_arrow([Game('201710190GSW', None, None)]) is None
+
+    def test_index_column_is_read_from_dataframe_index(self):
+        table = export.to_arrow([Player()])
+
+        assert table.to_pylist() == [
+            {'season': '2016-17', 'name': 'James Harden', 'points': 10},
+            {'season': 'Career', 'name': 'James Harden', 'points': 15}
+        ]
+
+    def test_mixed_classes_raise_value_error(self):
+        with pytest.raises(ValueError):
+            export.to_arrow([Game('201710170GSW', 108, 0.5), Player()])
+
+    def test_to_parquet_streams_row_groups(self, tmpdir):
+        path = str(tmpdir.join('games.parquet'))
+        games = (Game('2017101%s0GSW' % i, 100 + i, 0.5) for i in range(5))
+
+        result = export.to_parquet(path, games, batch_size=2)
+
+        assert result == 5
+        parquet_file = parquet.ParquetFile(path)
+        assert parquet_file.metadata.num_row_groups == 3
+        assert parquet_file.schema_arrow.equals(export.schema(Game))
+        assert parquet_file.read().column('points').to_pylist() == \
+            [100, 101, 102, 103, 104]
+
+    def test_to_parquet_without_rows_doesnt_create_file(self, tmpdir):
+        path = tmpdir.join('games.parquet')
+
+        result = export.to_parquet(str(path), [])
+
+        assert result == 0
+        assert not path.exists()
+
+    def test_summary_batches_add_key_column(self):
+        games = OrderedDict([
+            ('2017-11-10', []),
+            ('2017-11-11', [{'boxscore': '2017-11-11-19-purdue',
+                             'away_name': 'Chicago State',
+                             'home_name': 'Purdue',
+                             'non_di': False}])
+        ])
+
+        table = export._table(export._summary_batches(games, 'date'))
+
+        assert table.schema.names == ['date', 'boxscore', 'away_name',
+                                      'home_name', 'non_di']
+        assert str(table.schema.field('non_di').type) == 'bool'
+        assert table.column('date').to_pylist() == ['2017-11-11']
@@ -0,0 +1,105 @@
+import pytest
+from mock import patch
+from requests.exceptions import HTTPError
+from sportsreference import fetch
+
+
+class MockResponse:
+    def __init__(self, text, status_code=200):
+        self.status_code = status_code
+        self.text = text
+
+
+def mock_request(url, headers=None):
+    if url.endswith('404'):
+        return MockResponse('Not Found', 404)
+    return MockResponse('<html><body><p>%s</p></body></html>' % url)
+
+
+class TestFetch:
+    def setup_method(self, *args, **kwargs):
+        self.transport = fetch.Transport(timeout=5,
+                                         headers={'User-Agent': 'test'})
+
+    def teardown_method(self, *args, **kwargs):
+        fetch.configure()
+
+    def test_session_is_reused_for_same_host(self):
+        first = self.transport.session('https://www.example.com/a.html')
+        second = self.transport.session('https://www.example.com/b.html')
+
+        assert first is second
+
+    def test_session_is_unique_per_host(self):
+        first = self.transport.session('https://www.example.com/a.html')
+        second = self.transport.session('https://www.example.org/a.html')
+
+        assert first is not second
+
+    def test_session_applies_configured_headers_and_timeout(self):
+        session = self.transport.session('https://www.example.com/')
+        adapter = session.get_adapter('https://www.example.com/')
+
+        assert session.headers['User-Agent'] == 'test'
+        assert adapter._timeout == 5
+
+    def test_close_drops_all_sessions(self):
+        first = self.transport.session('https://www.example.com/')
+        self.transport.close()
+        second = self.transport.session('https://www.example.com/')
+
+        assert first is not second
+
+    def test_configure_replaces_shared_transport(self):
+        previous = fetch.get_transport()
+        transport = fetch.configure(timeout=10)
+
+        assert transport is fetch.get_transport()
+        assert transport is not previous
+        assert transport._timeout == 10
+
+    @patch('requests.Session.get', side_effect=mock_request)
+    def test_get_html_returns_page_contents(self, *args, **kwargs):
+        html = fetch.get_html('https://www.example.com/page')
+
+        assert 'https://www.example.com/page' in html
+
+    @patch('requests.Session.get', side_effect=mock_request)
+    def test_get_page_returns_pyquery_object(self, *args, **kwargs):
+        page = fetch.get_page('https://www.example.com/page')
+
+        assert page('p').text() == 'https://www.example.com/page'
+
+    @patch('requests.Session.get', side_effect=mock_request)
+    def test_non_successful_status_raises_error(self, *args, **kwargs):
+        with pytest.raises(HTTPError):
+            fetch.get_html('https://www.example.com/404')
+
+    def test_map_concurrent_preserves_order(self):
+        result = fetch.map_concurrent(lambda item: item * 2, range(20), 4)
+
+        assert result == [item * 2 for item in range(20)]
+
+    def test_map_concurrent_without_workers_runs_sequentially(self):
+        result = fetch.map_concurrent(lambda item: item * 2, range(5), None)
+
+        assert result == [0, 2, 4, 6, 8]
+
+    @patch('requests.Session.get', side_effect=mock_request)
+    def test_fetch_many_returns_pages_in_order(self, *args, **kwargs):
+        urls = ['https://www.example.com/%s' % page for page in range(10)]
+
+        result = fetch.fetch_many(urls, workers=4)
+
+        assert len(result) == len(urls)
+        for url, html in zip(urls, result):
+            assert '<p>%s</p>' % url in html
+
+    @patch('requests.Session.get', side_effect=mock_request)
+    def test_fetch_many_returns_none_for_failed_pages(self, *args, **kwargs):
+        urls = ['https://www.example.com/1', 'https://www.example.com/404']
+
+        result = fetch.fetch_many(urls, workers=2)
+
+        assert result[0] is not None
+        assert result[1] is None
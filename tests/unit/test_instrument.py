@@ -0,0 +1,127 @@
+import os
+from io import StringIO
+from mock import patch
+from sportsreference import fetch, instrument
+from sportsreference.instrument import Aggregator, Event
+from sportsreference.nba.constants import SEASON_PAGE_URL
+from sportsreference.nba.teams import Teams
+
+
+class MockResponse:
+    def __init__(self, text, status_code=200):
+        self.status_code = status_code
+        self.text = text
+        self.headers = {}
+
+
+def mock_request(url, headers=None):
+    fixture = os.path.join(os.path.dirname(__file__), '..', 'integration',
+                           'teams', 'nba_stats', 'NBA_2017.html')
+    return MockResponse(open(fixture, 'r').read())
+
+
+@instrument.timed('parse')
+def inner():
+    return 'inner'
+
+
+@instrument.timed('build')
+def outer():
+    return inner()
+
+
+class Fake(object):
+    __module__ = 'sportsreference.nba.fake'
+
+    def run(self):
+        return fetch.map_concurrent(lambda item: inner(), range(4), 2)
+
+
+class TestInstrument:
+    def test_stages_are_not_timed_while_disabled(self):
+        with patch.object(instrument, '_timer') as timer:
+            assert outer() == 'inner'
+
+        assert not instrument.enabled
+        assert timer.call_count == 0
+
+    def test_listen_enables_instrumentation_within_context(self):
+        events = []
+
+        with instrument.listen(events.append):
+            assert instrument.enabled
+            outer()
+        outer()
+
+        assert not instrument.enabled
+        assert [event.stage for event in events] == ['parse', 'build']
+
+    def test_nested_stages_are_excluded_from_duration(self):
+        events = []
+
+        with patch.object(instrument, '_timer',
+                          side_effect=[0.0, 1.0, 3.0, 6.0]):
+            with instrument.listen(events.append):
+                outer()
+
+        assert events == [
+            Event('parse', None, None, None, 2.0, None),
+            Event('build', None, None, None, 4.0, None)
+        ]
+
+    @patch('requests.Session.get', side_effect=mock_request)
+    def test_every_stage_of_building_teams_is_timed(self, *args, **kwargs):
+        events = []
+
+        with instrument.listen(events.append):
+            Teams(2017).dataframes
+
+        assert set(event.stage for event in events) == \
+            set(instrument.STAGES)
+        fetches = [event for event in events if event.stage == 'fetch']
+        assert len(fetches) == 1
+        assert fetches[0].url == SEASON_PAGE_URL % 2017
+        assert fetches[0].bytes > 0
+        assert (fetches[0].league, fetches[0].object_type) == \
+            ('nba', 'Teams')
+        assert ('nba', 'Team') in set((event.league, event.object_type)
+                                      for event in events
+                                      if event.stage == 'parse')
+
+    def test_worker_events_belong_to_calling_object(self):
+        events = []
+
+        with instrument.listen(events.append):
+            Fake().run()
+
+        assert len(events) == 4
+        assert set((event.league, event.object_type)
+                   for event in events) == set([('nba', 'Fake')])
+
+    def test_aggregator_summarizes_every_stage(self):
+        aggregator = Aggregator(buckets=(0.001, 0.01))
+        output = StringIO()
+
+        for duration in [0.0005, 0.005, 0.005, 0.5]:
+            aggregator(Event('parse', 'nba', 'Team', None, duration, None))
+        aggregator(Event('fetch', 'nba', 'Teams', 'http://a', 0.2, 1000))
+        aggregator.report(output)
+
+        assert aggregator.stages == ['fetch', 'parse']
+        assert aggregator.histogram('parse') == [1, 2, 1]
+        assert aggregator.summary()[1] == {
+            'stage': 'parse',
+            'count': 4,
+            'total': 0.5105,
+            'mean': 0.5105 / 4,
+            'max': 0.5,
+            'bytes': 0
+        }
+        assert aggregator.summary(by_object=True)[0]['object_type'] == \
+            'Teams'
+        assert 'fetch: 1 events' in output.getvalue()
+        assert 'parse: 4 events' in output.getvalue()
+
+        aggregator.reset()
+
+        assert aggregator.summary() == []
@@ -0,0 +1,136 @@
+from flexmock import flexmock
+from sportsreference import memo
+from sportsreference.memo import ObjectCache
+from sportsreference.nba import schedule
+from sportsreference.nba.schedule import Game, Schedule
+from sportsreference.nba.teams import Team
+
+
+class Fake(memo.Memoized):
+    __module__ = 'sportsreference.nba.fake'
+    __slots__ = ('_abbreviation', '_year', 'builds')
+
+    def __init__(self, abbreviation='DET', year=2018):
+        self._abbreviation = abbreviation
+        self._year = year
+        self.builds = 0
+
+    @property
+    @memo.memoized('schedule', '_abbreviation', '_year')
+    def schedule(self):
+        self.builds += 1
+        return [self._abbreviation, self._year]
+
+
+class MockBoxscore:
+    def __init__(self, uri):
+        self.dataframe = uri
+
+
+class TestObjectCache:
+    def test_least_recently_used_object_is_evicted(self):
+        cache = ObjectCache(max_objects=2)
+
+        cache.set(('nba', 'schedule', 'DET'), 1)
+        cache.set(('nba', 'schedule', 'BOS'), 2)
+        cache.get(('nba', 'schedule', 'DET'))
+        cache.set(('nba', 'schedule', 'LAL'), 3)
+
+        assert len(cache) == 2
+        assert ('nba', 'schedule', 'DET') in cache
+        assert ('nba', 'schedule', 'BOS') not in cache
+        assert cache.get(('nba', 'schedule', 'LAL')) == 3
+        assert cache.get(('nba', 'schedule', 'BOS')) is None
+
+    def test_invalidate_removes_objects_by_key_prefix(self):
+        cache = ObjectCache()
+        cache.set(('nba', 'schedule', 'DET', '2018'), 1)
+        cache.set(('nba', 'roster', 'DET', '2018'), 2)
+        cache.set(('nhl', 'schedule', 'DET', '2018'), 3)
+
+        assert cache.invalidate('nba', 'schedule') == 1
+        assert ('nba', 'roster', 'DET', '2018') in cache
+        assert cache.invalidate('nba') == 1
+        assert len(cache) == 1
+
+        cache.clear()
+
+        assert len(cache) == 0
+
+
+class TestMemoized:
+    def teardown_method(self, *args, **kwargs):
+        memo.set_object_cache(None)
+
+    def test_object_is_only_built_once_per_instance(self):
+        fake = Fake()
+
+        assert fake.schedule is fake.schedule
+        assert fake.builds == 1
+        assert Fake().schedule is not fake.schedule
+
+    def test_forget_rebuilds_object(self):
+        fake = Fake()
+        schedule = fake.schedule
+
+        memo.forget(fake, 'schedule')
+
+        assert fake.schedule is not schedule
+        assert fake.builds == 2
+
+    def test_object_cache_shares_objects_between_instances(self):
+        cache = ObjectCache()
+        memo.set_object_cache(cache)
+        first = Fake()
+        second = Fake()
+
+        assert first.schedule is second.schedule
+        assert second.builds == 0
+        assert ('nba', 'schedule', 'DET', '2018') in cache
+        assert Fake('BOS').schedule is not first.schedule
+
+        cache.invalidate('nba', 'schedule')
+
+        assert Fake().schedule is not first.schedule
+
+    def test_team_schedule_is_memoized(self):
+        flexmock(Team) \
+            .should_receive('_parse_team_data') \
+            .and_return(None)
+        flexmock(Schedule) \
+            .should_receive('_pull_schedule') \
+            .and_return(None) \
+            .once()
+
+        team = Team(None, 1)
+        team._abbreviation = 'DET'
+        team._year = '2018'
+
+        assert team.schedule is team.schedule
+
+    def test_objects_without_valid_key_are_not_memoized(self):
+        cache = ObjectCache()
+        memo.set_object_cache(cache)
+        fake = Fake('<td data-stat="date_game">Oct 20</td>')
+
+        assert fake.schedule is not fake.schedule
+        assert fake.builds == 2
+        assert memo.memoized_value(fake, 'schedule') is None
+        assert len(cache) == 0
+
+    def test_dataframe_extended_does_not_keep_boxscore(self):
+        flexmock(Game) \
+            .should_receive('_parse_game_data') \
+            .and_return(None)
+        flexmock(schedule) \
+            .should_receive('Boxscore') \
+            .replace_with(MockBoxscore) \
+            .times(2)
+        game = Game(None)
+        game._boxscore = '201710310LAL'
+
+        assert game.dataframe_extended == '201710310LAL'
+        assert memo.memoized_value(game, 'boxscore') is None
+        boxscore = game.boxscore
+        assert game.dataframe_extended == '201710310LAL'
+        assert memo.memoized_value(game, 'boxscore') is boxscore
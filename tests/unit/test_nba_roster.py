@@ -1,5 +1,7 @@
+from collections import OrderedDict
 from flexmock import flexmock
 from mock import patch, PropertyMock
+from pyquery import PyQuery as pq
 from sportsreference.nba.roster import cleanup, Player
 
 
@@ -46,7 +48,7 @@ class TestNBAPlayer:
 
         assert result == 0.0
 
-    @patch('requests.get', side_effect=mock_pyquery)
+    @patch('requests.Session.get', side_effect=mock_pyquery)
     def test_invalid_url_returns_none(self, *args, **kwargs):
         flexmock(Player) \
             .should_receive('_build_url') \
@@ -81,3 +83,35 @@ class TestNBAPlayer:
         result = player._parse_contract(player_info)
 
         assert player._contract is None
+
+    def test_season_rows_are_combined_by_season(self):
+        html = pq('<table id="totals"><tbody>'
+                  '<tr><th data-stat="season">2016-17</th>'
+                  '<td data-stat="pts">10</td></tr>'
+                  '<tr><th data-stat="season">2017-18</th>'
+                  '<td data-stat="pts">20</td></tr>'
+                  '</tbody><tfoot>'
+                  '<tr><th data-stat="season">Career</th>'
+                  '<td data-stat="pts">30</td></tr>'
+                  '</tfoot></table>'
+                  '<table id="advanced"><tbody>'
+                  '<tr><th data-stat="season">2017-18</th>'
+                  '<td data-stat="per">15.0</td></tr>'
+                  '</tbody><tfoot>'
+                  '<tr><th data-stat="season">Career</th>'
+                  '<td data-stat="per">14.0</td></tr>'
+                  '</tfoot></table>')
+        player = Player(None)
+        all_stats_dict = OrderedDict()
+
+        for table in ['table#totals', 'table#advanced']:
+            rows = html('%s tbody tr' % table).items()
+            career = html('%s tfoot tr' % table).items()
+            all_stats_dict = player._combine_season_stats(rows,
+                                                          career,
+                                                          all_stats_dict)
+
+        assert list(all_stats_dict) == ['2016-17', '2017-18', 'career']
+        assert len(all_stats_dict['2017-18']['data']) == 2
+        assert pq(all_stats_dict['career']['data'])('td').text() == '30 14.0'
+        assert player._most_recent_season == '2017-18'
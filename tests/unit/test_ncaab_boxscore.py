@@ -36,7 +36,7 @@ def mock_pyquery(url):
 
 
 class TestNCAABBoxscore:
-    @patch('requests.get', side_effect=mock_pyquery)
+    @patch('requests.Session.get', side_effect=mock_pyquery)
     def setup_method(self, *args, **kwargs):
         flexmock(Boxscore) \
             .should_receive('_parse_game_data') \
@@ -1,5 +1,6 @@
 from flexmock import flexmock
 from mock import patch, PropertyMock
+from pyquery import PyQuery as pq
 from sportsreference.ncaab.roster import cleanup, Player
 
 
@@ -44,7 +45,7 @@ class TestNCAABPlayer:
 
         assert result == 0.0
 
-    @patch('requests.get', side_effect=mock_pyquery)
+    @patch('requests.Session.get', side_effect=mock_pyquery)
     def test_invalid_url_returns_none(self, *args, **kwargs):
         mock_id = PropertyMock(return_value='BAD')
         player = Player(None)
@@ -58,3 +59,39 @@ class TestNCAABPlayer:
         result = cleanup(None)
 
         assert result == ''
+
+    def test_most_recent_season_is_looked_up_by_season(self):
+        player = Player(None)
+        player._most_recent_season = '2017-18'
+        player._season_index = {'2016-17': 0, '2017-18': 1, 'Career': 2}
+        player._team_abbreviation = ['purdue', 'PURDUE', None]
+
+        result = player.team_abbreviation
+
+        assert result == 'PURDUE'
+
+    def test_season_rows_are_combined_by_season(self):
+        html = pq('<div><table id="players_totals"><tbody>'
+                  '<tr><th data-stat="season">2016-17</th>'
+                  '<td data-stat="pts">10</td></tr>'
+                  '<tr><th data-stat="season">2017-18</th>'
+                  '<td data-stat="pts">20</td></tr>'
+                  '</tbody><tfoot>'
+                  '<tr><th data-stat="season">Career</th>'
+                  '<td data-stat="pts">30</td></tr>'
+                  '</tfoot></table>'
+                  '<table id="players_advanced"><tbody>'
+                  '<tr><th data-stat="season">2017-18</th>'
+                  '<td data-stat="per">15.0</td></tr>'
+                  '</tbody><tfoot>'
+                  '<tr><th data-stat="season">Career</th>'
+                  '<td data-stat="per">14.0</td></tr>'
+                  '</tfoot></table></div>')
+        player = Player(None)
+
+        all_stats_dict = player._combine_all_stats(html)
+
+        assert list(all_stats_dict) == ['2016-17', '2017-18', 'career']
+        assert all_stats_dict['2017-18']['data']('td').text() == '20 15.0'
+        assert all_stats_dict['career']['data']('td').text() == '30 14.0'
+        assert player._most_recent_season == '2017-18'
@@ -47,7 +47,7 @@ def mock_pyquery(url):
 
 
 class TestNCAAFBoxscore:
-    @patch('requests.get', side_effect=mock_pyquery)
+    @patch('requests.Session.get', side_effect=mock_pyquery)
     def setup_method(self, *args, **kwargs):
         flexmock(Boxscore) \
             .should_receive('_parse_game_data') \
@@ -27,7 +27,7 @@ def mock_pyquery(url, status_code=404):
 
 
 class TestNFLBoxscore:
-    @patch('requests.get', side_effect=mock_pyquery)
+    @patch('requests.Session.get', side_effect=mock_pyquery)
     def setup_method(self, *args, **kwargs):
         flexmock(Boxscore) \
             .should_receive('_parse_game_data') \
@@ -147,7 +147,7 @@ class TestNFLBoxscore:
 
         assert self.boxscore.losing_abbr == expected_name
 
-    @patch('requests.get', side_effect=mock_pyquery)
+    @patch('requests.Session.get', side_effect=mock_pyquery)
     def test_invalid_url_returns_none(self, *args, **kwargs):
         result = Boxscore(None)._retrieve_html_page('')
 
@@ -0,0 +1,158 @@
+import pytest
+import time
+from flexmock import flexmock
+from mock import patch
+from requests.exceptions import HTTPError
+from sportsreference import fetch
+from sportsreference.ratelimit import RateLimiter, TokenBucket, _retry_after
+
+
+class MockResponse:
+    def __init__(self, text, status_code=200, headers=None):
+        self.status_code = status_code
+        self.text = text
+        self.headers = headers or {}
+
+
+class MockServer:
+    def __init__(self, responses):
+        self.responses = list(responses)
+        self.requests = 0
+
+    def __call__(self, url):
+        self.requests += 1
+        return self.responses.pop(0)
+
+
+class TestTokenBucket:
+    def test_burst_is_consumed_without_waiting(self):
+        bucket = TokenBucket(1, 3)
+
+        for _ in range(3):
+            assert bucket._take(bucket._updated) == 0
+
+    def test_empty_bucket_waits_for_refill(self):
+        bucket = TokenBucket(2, 1)
+        now = bucket._updated
+
+        assert bucket._take(now) == 0
+        assert bucket._take(now) == pytest.approx(0.5)
+        assert bucket._take(now + 0.5) == 0
+
+    def test_bucket_never_exceeds_burst(self):
+        bucket = TokenBucket(1, 2)
+        now = bucket._updated + 1000
+
+        bucket._take(now)
+
+        assert bucket._tokens == 1
+
+    def test_blocked_bucket_waits_until_unblocked(self):
+        bucket = TokenBucket(1, 5)
+        flexmock(time).should_receive('time').and_return(100.0)
+
+        bucket.block(10)
+
+        assert bucket._take(105.0) == pytest.approx(5)
+        # The bucket is emptied when blocked and refills once unblocked.
+        assert bucket._take(110.0) == pytest.approx(1)
+        assert bucket._take(111.0) == 0
+
+    def test_acquire_sleeps_until_token_is_available(self):
+        bucket = TokenBucket(1, 1)
+        flexmock(time).should_receive('time').and_return(100.0) \
+            .and_return(100.0).and_return(101.0)
+        flexmock(time).should_receive('sleep').with_args(1.0).once()
+
+        bucket._updated = 100.0
+        bucket.acquire()
+        bucket.acquire()
+
+    def test_shared_state_is_used_by_every_bucket_with_same_path(self,
+                                                                 tmpdir):
+        path = str(tmpdir.join('host.bucket'))
+        first = TokenBucket(0.001, 2, path)
+        second = TokenBucket(0.001, 2, path)
+
+        assert first._update(first._take) == 0
+        assert second._update(second._take) == 0
+        assert first._update(first._take) > 0
+
+
+class TestRateLimiter:
+    def teardown_method(self, *args, **kwargs):
+        fetch.set_rate_limiter(None)
+
+    def test_each_host_has_its_own_bucket(self):
+        limiter = RateLimiter(directory=None)
+
+        nba = limiter.bucket('https://www.basketball-reference.com/a.html')
+        nba_http = limiter.bucket('http://www.basketball-reference.com/b.html')
+        nhl = limiter.bucket('https://www.hockey-reference.com/a.html')
+
+        assert nba is nba_http
+        assert nba is not nhl
+
+    def test_host_limits_override_defaults(self):
+        limiter = RateLimiter(rate=1, burst=1, directory=None,
+                              limits={'www.hockey-reference.com': (5, 10)})
+
+        nba = limiter.bucket('https://www.basketball-reference.com/a.html')
+        nhl = limiter.bucket('https://www.hockey-reference.com/a.html')
+
+        assert (nba.rate, nba.burst) == (1, 1)
+        assert (nhl.rate, nhl.burst) == (5, 10)
+
+    def test_retry_after_seconds_is_used_as_delay(self):
+        limiter = RateLimiter(directory=None)
+        response = MockResponse('', 429, {'Retry-After': '30'})
+
+        assert limiter.delay(response, 0) == 30
+
+    def test_retry_after_date_is_parsed(self):
+        response = MockResponse('', 429, {
+            'Retry-After': 'Wed, 21 Oct 2015 07:28:00 GMT'
+        })
+        flexmock(time).should_receive('time').and_return(1445412470.0)
+
+        assert _retry_after(response) == 10
+
+    def test_missing_retry_after_uses_jittered_exponential_backoff(self):
+        limiter = RateLimiter(directory=None, backoff=2, max_backoff=20)
+        response = MockResponse('', 429)
+
+        for attempt, maximum in [(0, 2), (1, 4), (2, 8), (3, 16), (8, 20)]:
+            delay = limiter.delay(response, attempt)
+            assert maximum / 2.0 <= delay <= maximum
+
+    def test_only_throttled_responses_are_retried(self):
+        limiter = RateLimiter(directory=None, max_retries=2)
+
+        assert limiter.should_retry(MockResponse('', 429), 0)
+        assert limiter.should_retry(MockResponse('', 503), 1)
+        assert not limiter.should_retry(MockResponse('', 429), 2)
+        assert not limiter.should_retry(MockResponse('', 404), 0)
+
+    def test_fetch_retries_throttled_requests(self):
+        limiter = RateLimiter(rate=1000, burst=1000, directory=None)
+        fetch.set_rate_limiter(limiter)
+        server = MockServer([MockResponse('', 429, {'Retry-After': '0'}),
+                             MockResponse('<html>page</html>')])
+
+        with patch('requests.Session.get', side_effect=server):
+            html = fetch.get_html('https://www.example.com/page')
+
+        assert html == '<html>page</html>'
+        assert server.requests == 2
+
+    def test_fetch_raises_error_once_retries_are_exhausted(self):
+        limiter = RateLimiter(rate=1000, burst=1000, directory=None,
+                              max_retries=1)
+        fetch.set_rate_limiter(limiter)
+        server = MockServer([MockResponse('', 429, {'Retry-After': '0'}),
+                             MockResponse('', 429, {'Retry-After': '0'})])
+
+        with patch('requests.Session.get', side_effect=server):
+            with pytest.raises(HTTPError):
+                fetch.get_html('https://www.example.com/page')
+        assert server.requests == 2
@@ -1,4 +1,8 @@
+import threading
+from datetime import datetime
 from flexmock import flexmock
+from mock import patch
+from pyquery import PyQuery as pq
 from sportsreference import utils
 
 
@@ -210,6 +214,80 @@ class TestUtils:
                                     'batters_used')
         assert result == expected
 
+    def test__parse_field_uses_row_index_for_data_stat_schemes(self):
+        parsing_scheme = {'wins': 'td[data-stat="wins"]',
+                          'first_wins': 'td[data-stat="wins"]:first',
+                          'team_wins': 'tfoot td[data-stat="wins"]',
+                          'rank': 'th[data-stat="ranker"]:first'}
+        html = pq('''<table>
+    <tbody>
+        <tr><th data-stat="ranker">1</th><td data-stat="wins">10</td></tr>
+        <tr><th data-stat="ranker">2</th><td data-stat="wins">20</td></tr>
+    </tbody>
+    <tfoot>
+        <tr><td data-stat="wins">30</td></tr>
+    </tfoot>
+</table>''')
+
+        assert utils._parse_field(parsing_scheme, html, 'wins') == '10'
+        assert utils._parse_field(parsing_scheme, html, 'wins', 2) == '30'
+        assert utils._parse_field(parsing_scheme, html, 'first_wins') == '10'
+        assert utils._parse_field(parsing_scheme, html, 'team_wins') == '30'
+        assert utils._parse_field(parsing_scheme, html, 'rank') == '1'
+
+    def test__parse_field_first_scheme_matches_each_row(self):
+        parsing_scheme = {'wins': 'td[data-stat="wins"]:first'}
+        rows = list(pq('''<table>
+    <tr><td data-stat="wins">10</td><td data-stat="wins">11</td></tr>
+    <tr><td data-stat="wins">20</td></tr>
+</table>''')('tr').items())
+        html = rows[0] + rows[1]
+
+        assert utils._parse_field(parsing_scheme, html, 'wins') == '10'
+        assert utils._parse_field(parsing_scheme, html, 'wins', 1) == '20'
+
+    def test__parse_field_returns_none_for_missing_data_stat(self):
+        parsing_scheme = {'losses': 'td[data-stat="losses"]:first'}
+        html = pq('<tr><td data-stat="wins">10</td></tr>')
+
+        assert utils._parse_field(parsing_scheme, html, 'losses') is None
+
+    def test__row_index_is_reused_for_same_html(self):
+        html = pq('<tr><td data-stat="wins">10</td></tr>')
+
+        index = utils._row_index(html)
+
+        assert utils._row_index(html) is index
+        assert utils._row_index(pq('<tr></tr>')) is not index
+
+    def test_compiled_scheme_matches_selector(self):
+        scheme = utils.CompiledScheme({'name': 'a:first',
+                                       'links': 'td a',
+                                       'empty': ''})
+        html = pq('''<tr>
+    <td><a href="/a">First</a></td>
+    <td><a href="/b">Second</a></td>
+</tr>''')
+
+        assert scheme['name'] == 'a:first'
+        assert scheme.select(html, 'name').text() == html('a:first').text()
+        assert [i.text() for i in scheme.select(html, 'links').items()] == \
+            ['First', 'Second']
+        assert len(scheme.select(html, 'empty')) == 0
+
+    def test_compiled_scheme_compiles_each_field_once(self):
+        scheme = utils.CompiledScheme({'name': 'a'})
+
+        expression = scheme.xpath('name')
+
+        assert scheme.xpath('name') is expression
+
+    def test__parse_field_uses_compiled_scheme(self):
+        scheme = utils.CompiledScheme({'name': 'a'})
+        html = pq('<tr><td><a href="/a">First</a></td></tr>')
+
+        assert utils._parse_field(scheme, html, 'name') == 'First'
+
     def test__get_stats_table_returns_correct_table(self):
         html_string = '''<div>
     <table class="stats_table" id="all_stats">
@@ -223,20 +301,117 @@ class TestUtils:
         </tbody>
     </table>
 </div>'''
-        expected = ['<tr data-row="0">\n<td class="right " '
-                    'data-stat="column1">1</td>\n</tr>',
-                    '<tr data-row="1">\n<td class="right " '
-                    'data-stat="column2">2</td>\n</tr>']
         div = 'table#all_stats'
-        flexmock(utils) \
-            .should_receive('_remove_html_comment_tags') \
-            .and_return(html_string) \
-            .once()
-
-        result = utils._get_stats_table(MockHtml(html_string, expected), div)
-
-        i = 0
-        for element in result:
-            i += 1
 
-        assert i == 2
+        result = utils._get_stats_table(pq(html_string), div)
+
+        assert [i('td').text() for i in result] == ['1', '2']
+
+    def test__get_stats_table_returns_commented_table(self):
+        html = pq('''<div>
+    <div id="all_stats">
+        <h2>Stats</h2>
+        <!--
+        <table id="stats">
+            <tbody>
+                <tr><td data-stat="wins">1</td></tr>
+                <tr><td data-stat="wins">2</td></tr>
+            </tbody>
+            <tfoot><tr><td data-stat="wins">3</td></tr></tfoot>
+        </table>
+        -->
+    </div>
+</div>''')
+
+        rows = utils._get_stats_table(html, 'div#all_stats')
+        footer = utils._get_stats_table(html, 'div#all_stats', footer=True)
+
+        assert [i('td').text() for i in rows] == ['1', '2']
+        assert [i('td').text() for i in footer] == ['3']
+        # The passed page is left unchanged.
+        assert len(html('table')) == 0
+
+    def test__uncomment_replaces_comments_with_contents(self):
+        html = pq('''<div>before<!--<p>first</p> text <p>second</p>-->after\
+<!-- plain --></div>''')
+
+        result = utils._uncomment(html)
+
+        assert result is html
+        assert [i.text() for i in html('p').items()] == ['first', 'second']
+        assert html.text().split() == ['before', 'first', 'text', 'second',
+                                       'after', 'plain']
+
+    def test__dataframe_from_rows_builds_typed_columns(self):
+        rows = [{'name': 'Purdue', 'wins': 30, 'rank': 3, 'pct': .5},
+                {'name': 'Indiana', 'wins': 20, 'rank': None, 'pct': .25}]
+
+        df = utils._dataframe_from_rows(rows, ['PURDUE', 'INDIANA'])
+
+        assert list(df.columns) == ['name', 'wins', 'rank', 'pct']
+        assert list(df.index) == ['PURDUE', 'INDIANA']
+        assert df['wins'].dtype == 'int64'
+        assert df['rank'].dtype == 'float64'
+        assert df['pct'].dtype == 'float64'
+        assert df.loc['PURDUE', 'rank'] == 3
+        assert df['rank'].isnull().tolist() == [False, True]
+        assert df.loc['INDIANA', 'name'] == 'Indiana'
+
+    def test__dataframe_from_rows_without_rows_returns_none(self):
+        assert utils._dataframe_from_rows([], []) is None
+
+    def test__slots_includes_scheme_fields(self):
+        parsing_scheme = {'wins': 'td[data-stat="wins"]',
+                          'losses': 'td[data-stat="losses"]',
+                          'ties': 'td[data-stat="ties"]'}
+
+        result = utils._slots(parsing_scheme,
+                              include=['year'],
+                              exclude=['ties'])
+
+        assert result == ('_year', '_wins', '_losses')
+
+    def test__pull_stats_tables_downloads_pages_concurrently(self):
+        pages = {
+            'https://www.example.com/first': '<table id="first"><tbody>'
+                                             '<tr><td>1</td></tr>'
+                                             '<tr><td>2</td></tr>'
+                                             '</tbody></table>',
+            'https://www.example.com/second': '<table id="a"><tbody>'
+                                              '<tr><td>3</td></tr>'
+                                              '</tbody></table>'
+                                              '<table id="b"><tbody>'
+                                              '<tr><td>4</td></tr>'
+                                              '</tbody></table>'
+        }
+        # Each request waits for the other to arrive, so both requests must be
+        # in flight at the same time to succeed.
+        arrived = dict((url, threading.Event()) for url in pages)
+
+        def get(url):
+            arrived[url].set()
+            for event in arrived.values():
+                event.wait(5)
+                assert event.is_set()
+            return flexmock(status_code=200, text=pages[url])
+
+        with patch('requests.Session.get', side_effect=get):
+            tables = utils._pull_stats_tables([
+                ('https://www.example.com/first', ['table#first']),
+                ('https://www.example.com/second', ['table#a', 'table#b'])
+            ])
+
+        assert [[row('td').text() for row in table] for table in tables] == \
+            [['1', '2'], ['3'], ['4']]
+
+    def test__date_range_includes_both_days(self):
+        result = utils._date_range(datetime(2017, 12, 30),
+                                   datetime(2018, 1, 2))
+
+        assert result == [datetime(2017, 12, 30), datetime(2017, 12, 31),
+                          datetime(2018, 1, 1), datetime(2018, 1, 2)]
+
+    def test__date_range_without_end_only_includes_start(self):
+        result = utils._date_range(datetime(2017, 12, 30))
+
+        assert result == [datetime(2017, 12, 30)]
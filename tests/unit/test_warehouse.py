@@ -0,0 +1,171 @@
+import pandas as pd
+from datetime import datetime
+from sportsreference.warehouse import Warehouse
+
+
+class MockTeam:
+    __module__ = 'sportsreference.nba.teams'
+
+    def __init__(self, abbreviation, wins):
+        self._year = '2017'
+        self.abbreviation = abbreviation
+        self.wins = wins
+
+
+class MockTeams:
+    def __init__(self, teams):
+        self._teams = teams
+
+    def __iter__(self):
+        return iter(self._teams)
+
+    @property
+    def dataframes(self):
+        return pd.DataFrame([{'abbreviation': team.abbreviation,
+                              'wins': team.wins} for team in self._teams],
+                            index=[team.abbreviation for team in self._teams])
+
+
+class MockGame:
+    __module__ = 'sportsreference.nba.schedule'
+
+    def __init__(self, boxscore, date, points):
+        self._boxscore = boxscore
+        self._date = date
+        self._points = points
+
+    @property
+    def dataframe(self):
+        if self._points is None:
+            return None
+        return pd.DataFrame([{'datetime': self._date,
+                              'points_scored': self._points,
+                              'field_goal_percentage': 0.5}],
+                            index=[self._boxscore])
+
+
+class MockBoxscore:
+    __module__ = 'sportsreference.nba.boxscore'
+
+    def __init__(self, uri, home_points):
+        self._uri = uri
+        self._home_points = home_points
+
+    @property
+    def dataframe(self):
+        return pd.DataFrame([{'date': '7:30 PM, October 31, 2017',
+                              'home_points': self._home_points}],
+                            index=[self._uri])
+
+
+class MockPlayer:
+    __module__ = 'sportsreference.nba.roster'
+
+    player_id = 'hardeja01'
+    name = 'James Harden'
+
+    @property
+    def dataframe(self):
+        rows = [{'height': '6-5', 'player_id': 'hardeja01', 'points': 1000,
+                 'weight': 220, 'contract': {'2017-18': '$28,299,399'}},
+                {'height': '6-5', 'player_id': 'hardeja01', 'points': 2191,
+                 'weight': 220, 'contract': {'2017-18': '$28,299,399'}}]
+        return pd.DataFrame(rows, index=[['2016-17', '2017-18']])
+
+
+class TestWarehouse:
+    def setup_method(self, *args, **kwargs):
+        self.warehouse = Warehouse(':memory:')
+
+    def teardown_method(self, *args, **kwargs):
+        self.warehouse.close()
+
+    def test_teams_are_saved_by_season(self):
+        teams = MockTeams([MockTeam('DET', 39), MockTeam('HOU', 65)])
+
+        result = self.warehouse.save_teams(teams)
+
+        assert result == 2
+        df = self.warehouse.teams('nba', season=2017)
+        assert df.loc[('HOU', '2017'), 'wins'] == 65
+        assert self.warehouse.teams('nba', season=2018).empty
+
+    def test_saving_teams_again_replaces_rows(self):
+        self.warehouse.save_teams(MockTeams([MockTeam('DET', 39)]))
+        self.warehouse.save_teams(MockTeams([MockTeam('DET', 40)]))
+
+        df = self.warehouse.teams('nba')
+
+        assert len(df) == 1
+        assert df.loc[('DET', '2017'), 'wins'] == 40
+
+    def test_games_keep_types_and_skip_unplayed_games(self):
+        schedule = [MockGame('201710180DET', datetime(2017, 10, 18), 102),
+                    MockGame('201710200DET', datetime(2017, 10, 20), 111),
+                    MockGame('201804110DET', datetime(2018, 4, 11), None)]
+
+        result = self.warehouse.save_schedule(schedule, 'DET', '2018')
+
+        assert result == 2
+        df = self.warehouse.games('nba', team='DET', season=2018)
+        assert list(df.index.get_level_values('boxscore')) == \
+            ['201710180DET', '201710200DET']
+        assert df['points_scored'].dtype == 'int64'
+        assert df['field_goal_percentage'].dtype == 'float64'
+        assert df['datetime'].iloc[0] == '2017-10-18 00:00:00'
+
+    def test_games_are_indexed_by_date(self):
+        schedule = [MockGame('201710180DET', datetime(2017, 10, 18), 102)]
+        self.warehouse.save_schedule(schedule, 'DET', '2018')
+
+        df = self.warehouse.query('SELECT name FROM sqlite_master WHERE '
+                                  'type = "index" AND tbl_name = "nba_games"')
+
+        assert 'nba_games_datetime' in list(df['name'])
+
+    def test_boxscores_are_saved_by_uri(self):
+        boxscores = [MockBoxscore('201710310LAL', 98),
+                     MockBoxscore('201710310PHO', 120)]
+
+        result = self.warehouse.save_boxscores(boxscores)
+
+        assert result == 2
+        df = self.warehouse.boxscores('nba', boxscore='201710310PHO')
+        assert df.loc['201710310PHO', 'home_points'] == 120
+
+    def test_boxscores_are_selected_by_date_range(self):
+        boxscores = [MockBoxscore('201710300LAL', 98),
+                     MockBoxscore('201710310PHO', 120),
+                     MockBoxscore('201711010DET', 101)]
+        self.warehouse.save_boxscores(boxscores)
+
+        df = self.warehouse.boxscores('nba', start_date=datetime(2017, 10, 31),
+                                      end_date='2017-11-01')
+
+        assert sorted(df.index) == ['201710310PHO', '201711010DET']
+        assert df.loc['201710310PHO', 'game_date'] == '2017-10-31'
+
+    def test_indexes_are_added_to_existing_tables(self):
+        self.warehouse._upsert('nba', 'boxscores', [{'boxscore': 'a'}])
+        self.warehouse.save_boxscores([MockBoxscore('201710310PHO', 120)])
+
+        df = self.warehouse.query('SELECT name FROM sqlite_master WHERE '
+                                  'type = "index" AND '
+                                  'tbl_name = "nba_boxscores"')
+
+        assert 'nba_boxscores_game_date' in list(df['name'])
+
+    def test_players_are_split_into_players_and_seasons(self):
+        result = self.warehouse.save_players([MockPlayer()])
+
+        assert result == 1
+        players = self.warehouse.players('nba')
+        assert players.loc['hardeja01', 'name'] == 'James Harden'
+        assert players.loc['hardeja01', 'weight'] == 220
+        seasons = self.warehouse.player_seasons('nba', player_id='hardeja01')
+        assert list(seasons['points']) == [1000, 2191]
+        assert 'weight' not in seasons.columns
+        assert seasons['contract'].iloc[0] == '{"2017-18": "$28,299,399"}'
+
+    def test_missing_table_returns_none(self):
+        assert self.warehouse.games('nhl') is None